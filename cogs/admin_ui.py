@@ -0,0 +1,158 @@
+# cogs/admin_ui.py
+import asyncio, os, sqlite3, sys, time
+from typing import Optional
+
+from config import (
+    ADMIN_UI_MODE, ADMIN_UI_HOST, ADMIN_UI_PORT, ADMIN_UI_SNAPSHOT_FILE,
+    ADMIN_UI_SNAPSHOT_SECONDS, ADMIN_UI_PASSWORD_FILE,
+)
+from cogs.helpers import log
+from cogs.db_utils import DATABASE_FILE
+from cogs.metrics import RollingStats, fmt_ms, register_source
+
+MODES = ("snapshot", "readonly", "write", "off")
+
+
+def snapshot_database(source: str, dest: str):
+    """
+    Copies `source` into `dest` with the SQLite online backup API. The copy is
+    written next to `dest` and swapped in with os.replace, so readers never see
+    a half-written file. The snapshot is switched out of WAL mode so it can be
+    opened read-only without a -shm file.
+    """
+    tmp = dest + ".tmp"
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(tmp)
+    try:
+        src.backup(dst)             # one step: a single short read transaction on the live DB
+        dst.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        dst.close()
+        src.close()
+    os.replace(tmp, dest)
+
+
+class AdminUI:
+    """
+    Runs the sqlite-web admin UI as a supervised child process, so page loads
+    and long queries never compete with the bot's event loop.
+    Modes (ADMIN_UI_MODE):
+    - "snapshot": read-only view of a copy of data.db, refreshed every ADMIN_UI_SNAPSHOT_SECONDS
+    - "readonly": read-only view of the live data.db
+    - "write":    full write access to the live data.db (explicit opt-in)
+    - "off":      not started
+    The child is restarted with backoff if it exits.
+    """
+
+    def __init__(self, mode: str = ADMIN_UI_MODE, db_path: str = DATABASE_FILE,
+                 max_backoff: float = 300.0):
+        if mode not in MODES:
+            log(f"Unknown ADMIN_UI_MODE {mode!r}, falling back to 'snapshot'", level="warning")
+            mode = "snapshot"
+        self.mode        = mode
+        self.db_path     = db_path
+        self.max_backoff = max_backoff
+        self.restarts    = 0
+        self.snapshot_time = RollingStats(maxlen=100)   # ms per snapshot
+        self.last_snapshot: Optional[float] = None
+
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._tasks = []
+        register_source("admin_ui", self.describe)
+
+    # -------------------------------
+    # Lifecycle
+    # -------------------------------
+    async def start(self):
+        if self.mode == "off" or self._tasks:
+            return
+        if self.mode == "snapshot":
+            await self._refresh_snapshot()
+            self._tasks.append(asyncio.create_task(self._snapshot_loop()))
+        self._tasks.append(asyncio.create_task(self._supervise()))
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._proc and self._proc.returncode is None:
+            self._proc.terminate()
+            try:
+                await asyncio.wait_for(self._proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self._proc.kill()
+                await self._proc.wait()
+        self._proc = None
+
+    # -------------------------------
+    # Child process
+    # -------------------------------
+    def _command(self) -> tuple:
+        target = ADMIN_UI_SNAPSHOT_FILE if self.mode == "snapshot" else self.db_path
+        args = [
+            sys.executable, "-m", "sqlite_web.sqlite_web", target,
+            "--host", ADMIN_UI_HOST, "--port", str(ADMIN_UI_PORT),
+            "--no-browser", "--quiet",
+        ]
+        if self.mode != "write":
+            args.append("--read-only")
+
+        env = dict(os.environ)
+        if ADMIN_UI_PASSWORD_FILE:
+            try:
+                with open(ADMIN_UI_PASSWORD_FILE, "r", encoding="utf-8") as f:
+                    env["SQLITE_WEB_PASSWORD"] = f.read().strip()
+                args.append("--password")
+            except OSError as e:
+                log(f"Could not read ADMIN_UI_PASSWORD_FILE: {e}", level="error")
+        return args, env
+
+    async def _supervise(self):
+        backoff = 5.0
+        while True:
+            args, env = self._command()
+            started = time.monotonic()
+            try:
+                self._proc = await asyncio.create_subprocess_exec(*args, env=env, stdin=asyncio.subprocess.DEVNULL)
+            except OSError as e:
+                log(f"Could not start the admin UI: {e}", level="error")
+            else:
+                log(f"Admin UI started ({self.mode}) on {ADMIN_UI_HOST}:{ADMIN_UI_PORT}, pid {self._proc.pid}")
+                code = await self._proc.wait()
+                log(f"Admin UI exited with code {code}", level="warning")
+            if time.monotonic() - started > 60:
+                backoff = 5.0               # it ran for a while; treat the next exit as a fresh failure
+            self.restarts += 1
+            await asyncio.sleep(backoff)
+            backoff = min(self.max_backoff, backoff * 2)
+
+    # -------------------------------
+    # Snapshots
+    # -------------------------------
+    async def _refresh_snapshot(self):
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(snapshot_database, self.db_path, ADMIN_UI_SNAPSHOT_FILE)
+        except (sqlite3.Error, OSError) as e:
+            log(f"Admin UI snapshot failed: {e}", level="error")
+            return
+        self.snapshot_time.add((time.perf_counter() - start) * 1000)
+        self.last_snapshot = time.time()
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(ADMIN_UI_SNAPSHOT_SECONDS)
+            await self._refresh_snapshot()
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        if self.mode == "off":
+            return "off"
+        running = self._proc is not None and self._proc.returncode is None
+        summary = f"{self.mode}, {'running' if running else 'down'}, {self.restarts} restarts"
+        if self.mode == "snapshot":
+            age = f"{time.time() - self.last_snapshot:.0f}s ago" if self.last_snapshot else "never"
+            summary += f", snapshot {age} (last took {fmt_ms(self.snapshot_time.last())})"
+        return summary
@@ -0,0 +1,55 @@
+# cogs/analytics.py
+"""
+Histogram math for the recruiter throughput aggregates (see db_utils "Recruiter
+Analytics"). Durations go into log-scale buckets, so percentiles come from a few
+bucket counts per recruiter/region instead of a scan over the history.
+"""
+import math
+from typing import Dict, Optional
+
+BUCKET_BASE   = 60.0    # bucket 0 holds everything under a minute
+BUCKET_GROWTH = 1.5     # each bucket is 50% wider than the previous (~±22% error)
+
+# lifecycle event -> (metric name, label)
+METRICS = {
+    "claim":       ("time_to_claim",       "⏱️ Time to claim"),
+    "ban_history": ("time_to_ban_history", "📄 Time to ban history"),
+    "decision":    ("time_to_decision",    "⚖️ Time to decision"),
+}
+
+
+def bucket_of(seconds: float) -> int:
+    if seconds < BUCKET_BASE:
+        return 0
+    return int(math.log(seconds / BUCKET_BASE, BUCKET_GROWTH)) + 1
+
+
+def bucket_value(bucket: int) -> float:
+    """Representative duration of a bucket (geometric middle of its range)."""
+    if bucket == 0:
+        return BUCKET_BASE / 2
+    low = BUCKET_BASE * BUCKET_GROWTH ** (bucket - 1)
+    return low * math.sqrt(BUCKET_GROWTH)
+
+
+def percentile(buckets: Dict[int, int], pct: float) -> Optional[float]:
+    total = sum(buckets.values())
+    if not total:
+        return None
+    rank = pct / 100 * total
+    seen = 0
+    for bucket in sorted(buckets):
+        seen += buckets[bucket]
+        if seen >= rank:
+            return bucket_value(bucket)
+    return bucket_value(max(buckets))
+
+
+def fmt_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "n/a"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
@@ -0,0 +1,71 @@
+# cogs/charts.py
+import io
+from importlib.util import find_spec
+from typing import Dict, Optional
+
+# optional: /app_stats falls back to a text table. Only looked up here; the
+# import itself (~0.7s) waits until a chart is actually drawn.
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
+
+from cogs.db_utils import TREND_FIELDS, week_start
+
+REGIONS = ("EU", "NA", "SEA")
+
+
+def _week_totals(trends: Dict[int, Dict[str, list]]) -> Dict[int, list]:
+    totals = {}
+    for week, regions in trends.items():
+        row = [0] * len(TREND_FIELDS)
+        for counts in regions.values():
+            row = [a + b for a, b in zip(row, counts)]
+        totals[week] = row
+    return totals
+
+
+def render_weekly_trends(trends: Dict[int, Dict[str, list]]) -> Optional[io.BytesIO]:
+    """PNG with submissions per region and outcomes per week. None without matplotlib."""
+    if not HAS_MATPLOTLIB or not trends:
+        return None
+    from matplotlib.figure import Figure
+    weeks = sorted(trends)
+    labels = [week_start(week).strftime("%d %b") for week in weeks]
+    totals = _week_totals(trends)
+    x = range(len(weeks))
+
+    fig = Figure(figsize=(9, 6), dpi=100)
+    top, bottom = fig.subplots(2, 1, sharex=True)
+
+    base = [0] * len(weeks)
+    for region in REGIONS:
+        values = [trends[week].get(region, [0] * len(TREND_FIELDS))[0] for week in weeks]
+        top.bar(x, values, bottom=base, label=region)
+        base = [a + b for a, b in zip(base, values)]
+    top.set_title("Submissions per week")
+    top.legend(loc="upper left")
+
+    for idx, name in enumerate(TREND_FIELDS[1:], start=1):
+        bottom.plot(x, [totals[week][idx] for week in weeks], marker="o", label=name.replace("_", " "))
+    bottom.set_title("Outcomes (by submission week) and closed-region attempts")
+    bottom.legend(loc="upper left")
+    bottom.set_xticks(list(x), labels, rotation=45, ha="right")
+
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    buf.seek(0)
+    return buf
+
+
+def format_weekly_trends(trends: Dict[int, Dict[str, list]], limit: int = 1000) -> str:
+    """Plain-text table of the same data (most recent weeks that fit in `limit`), used without matplotlib."""
+    totals = _week_totals(trends)
+    header = "Week     Sub  Acc  Den  Wdr  Closed"
+    lines, size = [], len(header)
+    for week in sorted(trends, reverse=True):
+        sub, acc, den, wdr, closed = totals[week]
+        line = f"{week_start(week):%d %b}  {sub:>4} {acc:>4} {den:>4} {wdr:>4} {closed:>6}"
+        size += len(line) + 1
+        if size > limit:
+            break
+        lines.append(line)
+    return "\n".join([header] + lines[::-1])
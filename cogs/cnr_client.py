@@ -0,0 +1,261 @@
+# cogs/cnr_client.py
+import asyncio, time
+from collections import Counter, deque
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+from config import (
+    CNR_ID, CHECK_CNR_VERIFIED_ROLE, CNR_CACHE_TTL, CNR_NEGATIVE_CACHE_TTL, CNR_CACHE_MAX_ENTRIES,
+    CNR_RATE_LIMIT, CNR_RATE_PER, CNR_MAX_ATTEMPTS,
+)
+from cogs.helpers import log, retry_with_backoff
+from cogs.metrics import RollingStats, fmt_ms, register_source, unregister_source
+
+CNR_API_BASE = "https://discord.com/api/v9"
+ROUTE_MEMBER = "GET /guilds/{guild_id}/members/{user_id}"
+
+
+def is_cnr_verified(status: int, data: dict) -> bool:
+    return status == 200 and str(CHECK_CNR_VERIFIED_ROLE) in data.get("roles", [])
+
+
+def _is_transient(status: Optional[int]) -> bool:
+    """Network errors, 429 and 5xx are worth retrying (and never cached)."""
+    return status is None or status == 429 or status >= 500
+
+
+class RouteLimiter:
+    """
+    Client-side limit for one API route: at most `rate` requests per `per`
+    seconds, plus a pause set from Discord's rate-limit headers or a 429.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.rate  = rate
+        self.per   = per
+        self.sends = deque()            # monotonic times of recent requests
+        self.paused_until = 0.0
+        self.waited = 0.0               # total seconds callers spent waiting here
+        self._lock  = asyncio.Lock()
+
+    def _wait_time(self, limit: int) -> float:
+        """Seconds until fewer than `limit` requests are in the window (and no pause)."""
+        now = time.monotonic()
+        while self.sends and now - self.sends[0] >= self.per:
+            self.sends.popleft()
+        wait = self.paused_until - now
+        if len(self.sends) >= limit:
+            wait = max(wait, self.per - (now - self.sends[-limit]))
+        return wait
+
+    async def acquire(self, reserve: int = 0):
+        """
+        Waits for a request slot. Background callers pass `reserve`: they only
+        take a slot while that many are still free in the window, and wait
+        outside the lock so interactive callers are never queued behind them.
+        """
+        start = time.monotonic()
+        limit = max(1, self.rate - reserve)
+        while True:
+            async with self._lock:
+                wait = self._wait_time(limit)
+                if wait <= 0:
+                    self.sends.append(time.monotonic())
+                    self.waited += time.monotonic() - start
+                    return
+                if not reserve:
+                    await asyncio.sleep(wait)
+                    continue
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class CnRMemberClient:
+    """
+    Looks up members of the CnR guild (CNR_ID) for verification.
+    - one pooled aiohttp session, created lazily
+    - results cached per user: verified members for CNR_CACHE_TTL seconds,
+      "not a member"/"missing role" for CNR_NEGATIVE_CACHE_TTL seconds;
+      API errors (429, 5xx, timeouts) are never cached
+    - concurrent lookups for the same user share one request
+    - each route is kept to CNR_RATE_LIMIT requests per CNR_RATE_PER seconds
+      and honours Discord's rate-limit headers; 429/5xx/network errors are
+      retried with jittered backoff, up to CNR_MAX_ATTEMPTS tries
+    lookup() returns (status, member_data) like the old fetch_cnr_member();
+    status is None on network errors. lookup(..., reserve=n) is for background
+    work: it leaves n slots of every window to interactive lookups.
+    """
+
+    def __init__(self, token: str, ttl: float = CNR_CACHE_TTL,
+                 negative_ttl: float = CNR_NEGATIVE_CACHE_TTL, max_entries: int = CNR_CACHE_MAX_ENTRIES,
+                 rate: int = CNR_RATE_LIMIT, per: float = CNR_RATE_PER, max_attempts: int = CNR_MAX_ATTEMPTS,
+                 base_delay: float = 1.0, max_delay: float = 30.0):
+        self.token        = token
+        self.ttl          = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries  = max_entries
+        self.rate         = rate
+        self.per          = per
+        self.max_attempts = max_attempts
+        self.base_delay   = base_delay
+        self.max_delay    = max_delay
+        self.latency      = RollingStats(maxlen=500)
+        self.statuses     = Counter()       # HTTP status (or "error") -> count
+        self.hits         = 0
+        self.misses       = 0
+        self.shared       = 0               # lookups that joined an in-flight request
+        self.retries      = 0
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: Dict[int, Tuple[float, int, dict]] = {}     # user_id -> (expires, status, data)
+        self._inflight: Dict[int, asyncio.Future] = {}
+        self._routes: Dict[str, RouteLimiter] = {}
+        register_source("cnr_lookup", self.describe)
+
+    # -------------------------------
+    # Session
+    # -------------------------------
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": self.token, "Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+            )
+        return self._session
+
+    async def close(self):
+        unregister_source("cnr_lookup")
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    # -------------------------------
+    # Lookups
+    # -------------------------------
+    async def lookup(self, user_id: int, reserve: int = 0) -> Tuple[Optional[int], dict]:
+        cached = self._cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1], cached[2]
+
+        if reserve:
+            # background lookups don't register as in-flight: an interactive
+            # lookup for the same user must not wait behind their budget
+            self.misses += 1
+            result = await self._fetch(user_id, reserve)
+            self._store(user_id, *result)
+            return result
+
+        future = self._inflight.get(user_id)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[user_id] = future
+        result = (None, {})     # what waiting lookups get if this one dies
+        try:
+            result = await self._fetch(user_id)
+            self._store(user_id, *result)
+            return result
+        finally:
+            del self._inflight[user_id]
+            future.set_result(result)
+
+    def _route(self, route: str) -> RouteLimiter:
+        if route not in self._routes:
+            self._routes[route] = RouteLimiter(self.rate, self.per)
+        return self._routes[route]
+
+    async def _fetch(self, user_id: int, reserve: int = 0) -> Tuple[Optional[int], dict]:
+        """GET the member, retrying transient failures with jittered backoff."""
+        limiter = self._route(ROUTE_MEMBER)
+
+        async def attempt_once():
+            await limiter.acquire(reserve)
+            status, data, retry_after = await self._get_once(limiter, user_id)
+            return (status, data), _is_transient(status), retry_after
+
+        def on_retry(result: tuple, attempt: int, delay: float):
+            self.retries += 1
+            log(f"CnR member lookup for {user_id} got {result[0] or 'no response'}, retry {attempt} in {delay:.1f}s", level="warning")
+
+        status, data = await retry_with_backoff(
+            attempt_once, self.max_attempts, self.base_delay, self.max_delay, on_retry
+        )
+        if _is_transient(status):
+            log(f"CnR member lookup for {user_id} failed after {self.max_attempts} attempts (last status {status})", level="error")
+        return status, data
+
+    async def _get_once(self, limiter: RouteLimiter, user_id: int) -> Tuple[Optional[int], dict, Optional[float]]:
+        """Single GET. Returns (status, data, retry_after)."""
+        start = perf_counter()
+        try:
+            async with self._get_session().get(f"{CNR_API_BASE}/guilds/{CNR_ID}/members/{user_id}") as resp:
+                status  = resp.status
+                headers = resp.headers
+                try:
+                    data = await resp.json(content_type=None)
+                except ValueError:
+                    data = None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.latency.add((perf_counter() - start) * 1000)
+            self.statuses["error"] += 1
+            log(f"CnR member lookup for {user_id} failed: {str(e) or type(e).__name__}", level="warning")
+            return None, {}, None
+        self.latency.add((perf_counter() - start) * 1000)
+        self.statuses[status] += 1
+        data = data if isinstance(data, dict) else {}
+
+        # keep the route inside Discord's bucket instead of running into 429s
+        retry_after = None
+        try:
+            if status == 429:
+                retry_after = float(data.get("retry_after") or headers.get("Retry-After") or 1.0)
+                limiter.pause(retry_after)
+            elif headers.get("X-RateLimit-Remaining") == "0":
+                limiter.pause(float(headers.get("X-RateLimit-Reset-After", 0)))
+        except (TypeError, ValueError):
+            pass
+        return status, data, retry_after
+
+    def _store(self, user_id: int, status: Optional[int], data: dict):
+        if is_cnr_verified(status, data):
+            ttl = self.ttl
+        elif status in (200, 404):
+            ttl = self.negative_ttl
+        else:
+            return
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        if len(self._cache) >= self.max_entries:
+            self._cache = {uid: entry for uid, entry in self._cache.items() if entry[0] > now}
+            while len(self._cache) >= self.max_entries:
+                del self._cache[next(iter(self._cache))]    # oldest insert first
+        self._cache.pop(user_id, None)
+        self._cache[user_id] = (now + ttl, status, data)
+
+    def invalidate(self, user_id: int):
+        self._cache.pop(user_id, None)
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        lookups = self.hits + self.misses + self.shared
+        if not lookups:
+            return "no lookups yet"
+        snap = self.latency.snapshot()
+        codes = ", ".join(f"{code}×{count}" for code, count in sorted(self.statuses.items(), key=str))
+        return (
+            f"{lookups} lookups, hit rate {(self.hits + self.shared) / lookups:.0%} "
+            f"({self.shared} shared), API p50 {fmt_ms(snap['p50'])}, p95 {fmt_ms(snap['p95'])}, "
+            f"status {codes or 'n/a'}, {self.retries} retries, "
+            f"rate-limit wait {sum(route.waited for route in self._routes.values()):.0f}s, cached {len(self._cache)}"
+        )
@@ -3,11 +3,13 @@
 import aiosqlite
 from contextlib import asynccontextmanager
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone, date
 from typing import Optional, Dict, List
 from cogs.helpers import log  # Assumes you have a log function in helpers.py
+from cogs.analytics import METRICS, bucket_of, percentile
 
 DATABASE_FILE = "data.db"
+PLAYER_LOGS_FILE = "player_logs.db"     # opened by PlayerListCog
 
 @asynccontextmanager
 async def get_db_connection():
@@ -21,6 +23,36 @@ async def get_db_connection():
     finally:
         await conn.close()
 
+@asynccontextmanager
+async def read_only_connection(db_path: str):
+    """Opens `db_path` read-only; a missing file raises instead of creating an empty DB."""
+    conn = await aiosqlite.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+@asynccontextmanager
+async def stream_query(query: str, params: tuple = (), batch_size: int = 500, db_path: Optional[str] = None):
+    """
+    Runs a read-only query and yields (column names, async iterator of row batches),
+    so callers can walk a table of any size with one batch in memory at a time.
+    Runs against data.db unless `db_path` names another database (opened read-only).
+    """
+    connection = get_db_connection() if db_path is None else read_only_connection(db_path)
+    async with connection as conn:
+        cursor = await conn.execute(query, params)
+        columns = [col[0] for col in cursor.description]
+
+        async def batches():
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
+        yield columns, batches()
+
 # -------------------------------
 # Database functions for recruitment
 # -------------------------------
@@ -65,9 +97,13 @@ async def add_entry(thread_id: str, recruiter_id: str, starttime: datetime, endt
                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                             (thread_id, recruiter_id, start_str, end_str, embed_id, ingame_name, user_id, region, role_type)
                         )
+            if endtime:
+                await _put_job(conn, JOB_ENTRY_ENDTIME, thread_id, local_epoch(endtime))
             await conn.commit()
-            log(f"Added entry to DB: thread_id={thread_id}, user_id={user_id}, role_type={role_type}")
-            return True
+        if endtime:
+            _notify_job(JOB_ENTRY_ENDTIME, thread_id, local_epoch(endtime))
+        log(f"Added entry to DB: thread_id={thread_id}, user_id={user_id}, role_type={role_type}")
+        return True
     except aiosqlite.IntegrityError:
         log("Database Error: Duplicate thread_id or integrity issue.", level="error")
         return False
@@ -80,11 +116,13 @@ async def remove_entry(thread_id: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("DELETE FROM entries WHERE thread_id = ?", (thread_id,))
-            await conn.commit()
             removed = (cursor.rowcount > 0)
-            if removed:
-                log(f"Removed entry from DB for thread_id={thread_id}")
-            return removed
+            await _drop_job(conn, JOB_ENTRY_ENDTIME, thread_id)
+            await conn.commit()
+        _notify_job(JOB_ENTRY_ENDTIME, thread_id, None)
+        if removed:
+            log(f"Removed entry from DB for thread_id={thread_id}")
+        return removed
     except aiosqlite.Error as e:
         log(f"Database Error (remove_entry): {e}", level="error")
         return False
@@ -94,11 +132,14 @@ async def update_endtime(thread_id: str, new_endtime: datetime) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("UPDATE entries SET endtime = ? WHERE thread_id = ?", (new_endtime.isoformat(), thread_id))
-            await conn.commit()
             updated = (cursor.rowcount > 0)
             if updated:
-                log(f"Updated endtime for thread_id={thread_id} to {new_endtime.isoformat()}")
-            return updated
+                await _put_job(conn, JOB_ENTRY_ENDTIME, thread_id, local_epoch(new_endtime))
+            await conn.commit()
+        if updated:
+            _notify_job(JOB_ENTRY_ENDTIME, thread_id, local_epoch(new_endtime))
+            log(f"Updated endtime for thread_id={thread_id} to {new_endtime.isoformat()}")
+        return updated
     except aiosqlite.Error as e:
         log(f"Database Error (update_endtime): {e}", level="error")
         return False
@@ -193,8 +234,11 @@ async def add_role_request(user_id: str, request_type: str, details: str) -> boo
                 """,
                 (user_id, request_type, details, ts)
             )
+            due_at = local_epoch(ts) + ROLE_REQUEST_REMINDER.total_seconds()
+            await _put_job(conn, JOB_ROLE_REMINDER, user_id, due_at)
             await conn.commit()
-            return True
+        _notify_job(JOB_ROLE_REMINDER, user_id, due_at)
+        return True
     except aiosqlite.Error as e:
         log(f"DB Error (add_role_request): {e}", level="error")
         return False
@@ -204,8 +248,11 @@ async def remove_role_request(user_id: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("DELETE FROM role_requests WHERE user_id = ?", (user_id,))
+            removed = cursor.rowcount > 0
+            await _drop_job(conn, JOB_ROLE_REMINDER, user_id)
             await conn.commit()
-            return cursor.rowcount > 0
+        _notify_job(JOB_ROLE_REMINDER, user_id, None)
+        return removed
     except aiosqlite.Error as e:
         log(f"DB Error (remove_role_request): {e}", level="error")
         return False
@@ -228,8 +275,10 @@ async def clear_role_requests() -> None:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("DELETE FROM role_requests")
+            await _drop_job(conn, JOB_ROLE_REMINDER)
             await conn.commit()
-            log("All role requests have been cleared.")
+        _notify_job(JOB_ROLE_REMINDER, None, None)
+        log("All role requests have been cleared.")
     except aiosqlite.Error as e:
         log(f"Error clearing role requests: {e}", level="error")
 
@@ -251,27 +300,27 @@ async def get_role_requests() -> list:
         log(f"Error retrieving role requests: {e}", level="error")
     return requests
 
-async def get_pending_role_requests_no_reminder() -> list:
-    """Return role requests that have not yet been reminded (reminder_sent = 0)."""
-    requests = []
-    try:
-        async with get_db_connection() as conn:
-            cursor = await conn.cursor()
-            await cursor.execute(
-                "SELECT user_id, request_type, details, timestamp, reminder_sent FROM role_requests WHERE reminder_sent = 0"
-            )
-            rows = await cursor.fetchall()
-            for row in rows:
-                requests.append({
-                    "user_id": row[0],
-                    "request_type": row[1],
-                    "details": row[2],
-                    "timestamp": row[3],
-                    "reminder_sent": row[4]
-                })
-    except aiosqlite.Error as e:
-        log(f"Error retrieving pending role requests: {e}", level="error")
-    return requests
+async def get_pending_role_requests_no_reminder(conn, user_ids: list) -> list:
+    """Return the role requests of `user_ids` that have not yet been reminded (reminder_sent = 0), on the caller's connection."""
+    if not user_ids:
+        return []
+    placeholders = ",".join("?" * len(user_ids))
+    cursor = await conn.execute(
+        "SELECT user_id, request_type, details, timestamp, reminder_sent FROM role_requests "
+        f"WHERE reminder_sent = 0 AND user_id IN ({placeholders})",
+        list(user_ids)
+    )
+    return [
+        {"user_id": row[0], "request_type": row[1], "details": row[2], "timestamp": row[3], "reminder_sent": row[4]}
+        for row in await cursor.fetchall()
+    ]
+
+async def mark_role_requests_reminder_sent(conn, user_ids: list) -> None:
+    """Bulk variant of mark_role_request_reminder_sent inside the caller's transaction (the caller commits)."""
+    await conn.executemany(
+        "UPDATE role_requests SET reminder_sent = 1 WHERE user_id = ?",
+        [(user_id,) for user_id in user_ids]
+    )
 
 async def mark_role_request_reminder_sent(user_id: str) -> bool:
     """Mark the role request for the given user as having had its reminder sent."""
@@ -449,6 +498,15 @@ async def init_applications_db():
                 await conn.commit()
                 log("Added last_reminder_sent column to application_threads.", level="info")
 
+            # ——— Migration: epoch start time for the weekly trend query ———
+            if "start_epoch" not in cols:
+                await conn.execute("ALTER TABLE application_threads ADD COLUMN start_epoch INTEGER")
+            await _backfill_epoch(conn, "application_threads", "starttime", "start_epoch")
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_application_threads_trend ON application_threads(start_epoch, region, status)"
+            )
+            await conn.commit()
+
             log("Applications DB (application_threads) initialized successfully async with new ban history columns.")
     except aiosqlite.Error as e:
         log(f"Applications DB Error: {e}", level="error")
@@ -472,14 +530,18 @@ async def add_application(
             await cursor.execute(
                 """
                 INSERT INTO application_threads 
-                (thread_id, applicant_id, recruiter_id, starttime, ingame_name, region, age, level, join_reason, previous_crews, is_closed, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 'open')
+                (thread_id, applicant_id, recruiter_id, starttime, ingame_name, region, age, level, join_reason, previous_crews, is_closed, status, start_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 'open', ?)
                 """,
-                (thread_id, applicant_id, recruiter_id, start_str, ingame_name, region, age, level, join_reason, previous_crews)
+                (thread_id, applicant_id, recruiter_id, start_str, ingame_name, region, age, level, join_reason, previous_crews,
+                 int(local_epoch(start_str)))
             )
+            due_at = app_reminder_epoch(start_str, None)
+            await _put_job(conn, JOB_APP_REMINDER, thread_id, due_at)
             await conn.commit()
-            log(f"Added new application thread {thread_id} from user {applicant_id}")
-            return True
+        _notify_job(JOB_APP_REMINDER, thread_id, due_at)
+        log(f"Added new application thread {thread_id} from user {applicant_id}")
+        return True
     except aiosqlite.IntegrityError:
         log("Duplicate thread_id in 'application_threads' or integrity issue.", level="error")
         return False
@@ -532,8 +594,10 @@ async def update_application_recruiter(thread_id: str, new_recruiter_id: str) ->
                 """,
                 (new_recruiter_id, thread_id)
             )
-            await conn.commit()
             updated = (cursor.rowcount > 0)
+            if updated:
+                await _record_app_event(conn, thread_id, "claim")
+            await conn.commit()
             if updated:
                 log(f"Application thread {thread_id} claimed by {new_recruiter_id}")
             return updated
@@ -553,11 +617,13 @@ async def close_application(thread_id: str) -> bool:
                 """,
                 (thread_id,)
             )
-            await conn.commit()
             closed = (cursor.rowcount > 0)
-            if closed:
-                log(f"Application thread {thread_id} marked as closed.")
-            return closed
+            await _drop_job(conn, JOB_APP_REMINDER, thread_id)
+            await conn.commit()
+        _notify_job(JOB_APP_REMINDER, thread_id, None)
+        if closed:
+            log(f"Application thread {thread_id} marked as closed.")
+        return closed
     except aiosqlite.Error as e:
         log(f"DB Error (close_application): {e}", level="error")
         return False
@@ -567,11 +633,14 @@ async def remove_application(thread_id: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("DELETE FROM application_threads WHERE thread_id = ?", (thread_id,))
-            await conn.commit()
             removed = (cursor.rowcount > 0)
-            if removed:
-                log(f"Removed application thread {thread_id} from DB.")
-            return removed
+            await _drop_job(conn, JOB_APP_REMINDER, thread_id)
+            await conn.commit()
+        _notify_job(JOB_APP_REMINDER, thread_id, None)
+        if removed:
+            _invalidate_trend_week()
+            log(f"Removed application thread {thread_id} from DB.")
+        return removed
     except aiosqlite.Error as e:
         log(f"DB Error (remove_application): {e}", level="error")
         return False
@@ -581,8 +650,13 @@ async def update_application_status(thread_id: str, new_status: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("UPDATE application_threads SET status = ? WHERE thread_id = ?", (new_status, thread_id))
-            await conn.commit()
             updated = (cursor.rowcount > 0)
+            changed_week = None
+            if updated and new_status != "open":
+                changed_week = await _record_app_event(conn, thread_id, "decision", outcome=new_status)
+            await conn.commit()
+            if changed_week is not None:
+                _invalidate_trend_week(changed_week)    # only now can a recompute see the new status
             if updated:
                 log(f"Updated application {thread_id} status to {new_status}")
             return updated
@@ -595,11 +669,18 @@ async def mark_application_removed(thread_id: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("UPDATE application_threads SET status = 'removed', is_closed = 1 WHERE thread_id = ?", (thread_id,))
-            await conn.commit()
             updated = (cursor.rowcount > 0)
+            changed_week = None
             if updated:
-                log(f"Marked application {thread_id} as removed")
-            return updated
+                changed_week = await _record_app_event(conn, thread_id, "decision", outcome="removed")
+            await _drop_job(conn, JOB_APP_REMINDER, thread_id)
+            await conn.commit()
+        if changed_week is not None:
+            _invalidate_trend_week(changed_week)
+        _notify_job(JOB_APP_REMINDER, thread_id, None)
+        if updated:
+            log(f"Marked application {thread_id} as removed")
+        return updated
     except aiosqlite.Error as e:
         log(f"DB Error (mark_application_removed): {e}", level="error")
         return False
@@ -671,13 +752,28 @@ def sort_applications(apps: list) -> list:
     return sorted(apps, key=sort_key)
 
 async def set_application_silence(thread_id: str, silent: bool) -> bool:
+    """Silencing drops the reminder job; un-silencing puts it back at its regular due time."""
     try:
         async with get_db_connection() as conn:
             await conn.execute(
                 "UPDATE application_threads SET silenced = ? WHERE thread_id = ?",
                 (1 if silent else 0, thread_id)
             )
+            due_at = None
+            if not silent:
+                cursor = await conn.execute(
+                    "SELECT starttime, last_reminder_sent FROM application_threads WHERE thread_id = ? AND is_closed = 0",
+                    (thread_id,)
+                )
+                row = await cursor.fetchone()
+                if row:
+                    due_at = app_reminder_epoch(row[0], row[1])
+            if due_at is None:
+                await _drop_job(conn, JOB_APP_REMINDER, thread_id)
+            else:
+                await _put_job(conn, JOB_APP_REMINDER, thread_id, due_at)
             await conn.commit()
+        _notify_job(JOB_APP_REMINDER, thread_id, due_at)
         return True
     except Exception as e:
         log(f"Error updating silenced status for thread {thread_id}: {e}", level="error")
@@ -716,20 +812,36 @@ async def init_application_attempts_db():
                 )
                 """
             )
+            # ——— Migration: epoch timestamp for the weekly trend query ———
+            await cursor.execute("PRAGMA table_info(application_attempts)")
+            cols = [row[1] for row in await cursor.fetchall()]
+            if "ts_epoch" not in cols:
+                await cursor.execute("ALTER TABLE application_attempts ADD COLUMN ts_epoch INTEGER")
+            await _backfill_epoch(conn, "application_attempts", "timestamp", "ts_epoch")
+            await cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_application_attempts_trend ON application_attempts(ts_epoch, status, region)"
+            )
             await conn.commit()
             log("Application attempts DB initialized successfully.")
     except aiosqlite.Error as e:
         log(f"Application Attempts DB Error: {e}", level="error")
 
+async def add_application_attempts(conn, rows: list) -> None:
+    """
+    Inserts attempts inside the caller's transaction (the caller commits).
+    `rows` is a list of (applicant_id, region, status, log_url), all stamped now.
+    """
+    now = datetime.now()
+    await conn.executemany(
+        "INSERT INTO application_attempts (applicant_id, region, timestamp, status, log_url, ts_epoch) VALUES (?, ?, ?, ?, ?, ?)",
+        [(str(applicant_id), region, now.isoformat(), status, log_url, int(now.timestamp()))
+         for applicant_id, region, status, log_url in rows]
+    )
+
 async def add_application_attempt(applicant_id: str, region: str, status: str, log_url: str) -> bool:
     try:
         async with get_db_connection() as conn:
-            cursor = await conn.cursor()
-            timestamp = datetime.now().isoformat()
-            await cursor.execute(
-                "INSERT INTO application_attempts (applicant_id, region, timestamp, status, log_url) VALUES (?, ?, ?, ?, ?)",
-                (str(applicant_id), region, timestamp, status, log_url)
-            )
+            await add_application_attempts(conn, [(applicant_id, region, status, log_url)])
             await conn.commit()
             return True
     except aiosqlite.Error as e:
@@ -819,6 +931,9 @@ async def get_application_history(applicant_id: str) -> list:
 # APPLICATION STATUS
 # -------------------------------
 
+# region -> status, loaded once by init_region_status and written through on update
+_region_status: Dict[str, str] = {}
+
 async def init_region_status():
     async with get_db_connection() as conn:
         cursor = await conn.cursor()
@@ -836,19 +951,18 @@ async def init_region_status():
                 (region, "OPEN")
             )
         await conn.commit()
+        await cursor.execute("SELECT region, status FROM region_status")
+        _region_status.clear()
+        _region_status.update({region: status for region, status in await cursor.fetchall()})
 
 async def get_region_status(region: str) -> Optional[str]:
-    try:
-        async with get_db_connection() as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT status FROM region_status WHERE region = ?", (region.upper(),))
-            row = await cursor.fetchone()
-            if row:
-                return row[0]
+    if not _region_status:
+        try:
+            await init_region_status()
+        except aiosqlite.Error as e:
+            log(f"Error getting region status: {e}", level="error")
             return None
-    except aiosqlite.Error as e:
-        log(f"Error getting region status: {e}", level="error")
-        return None
+    return _region_status.get(region.upper())
 
 async def update_region_status(region: str, status: str) -> bool:
     try:
@@ -856,7 +970,10 @@ async def update_region_status(region: str, status: str) -> bool:
             cursor = await conn.cursor()
             await cursor.execute("UPDATE region_status SET status = ? WHERE region = ?", (status.upper(), region.upper()))
             await conn.commit()
-            return cursor.rowcount > 0
+            if cursor.rowcount > 0:
+                _region_status[region.upper()] = status.upper()
+                return True
+            return False
     except aiosqlite.Error as e:
         log(f"Error updating region status: {e}", level="error")
         return False
@@ -884,6 +1001,7 @@ async def init_timeouts_db():
         log(f"Timeouts DB Error: {e}", level="error")
 
 async def add_timeout_record(user_id: str, record_type: str, expires_at: Optional[datetime] = None) -> bool:
+    due_at = local_epoch(expires_at) if record_type == "timeout" and expires_at else None
     try:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
@@ -891,8 +1009,13 @@ async def add_timeout_record(user_id: str, record_type: str, expires_at: Optiona
                 "INSERT OR REPLACE INTO timeouts (user_id, type, expires_at) VALUES (?, ?, ?)",
                 (user_id, record_type, expires_at.isoformat() if expires_at else None)
             )
+            if due_at is None:
+                await _drop_job(conn, JOB_TIMEOUT_EXPIRY, user_id)
+            else:
+                await _put_job(conn, JOB_TIMEOUT_EXPIRY, user_id, due_at)
             await conn.commit()
-            return True
+        _notify_job(JOB_TIMEOUT_EXPIRY, user_id, due_at)
+        return True
     except aiosqlite.Error as e:
         log(f"DB Error (add_timeout_record): {e}", level="error")
         return False
@@ -902,8 +1025,11 @@ async def remove_timeout_record(user_id: str) -> bool:
         async with get_db_connection() as conn:
             cursor = await conn.cursor()
             await cursor.execute("DELETE FROM timeouts WHERE user_id = ?", (user_id,))
+            removed = cursor.rowcount > 0
+            await _drop_job(conn, JOB_TIMEOUT_EXPIRY, user_id)
             await conn.commit()
-            return cursor.rowcount > 0
+        _notify_job(JOB_TIMEOUT_EXPIRY, user_id, None)
+        return removed
     except aiosqlite.Error as e:
         log(f"DB Error (remove_timeout_record): {e}", level="error")
         return False
@@ -943,6 +1069,68 @@ async def get_all_timeouts() -> list:
         log(f"DB Error (get_all_timeouts): {e}", level="error")
         return []
 
+async def get_expired_timeouts(user_ids: list) -> list:
+    """Timeout records among `user_ids` whose expires_at has passed (local time)."""
+    placeholders = ",".join("?" * len(user_ids))
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT user_id, expires_at FROM timeouts
+                WHERE type = 'timeout' AND expires_at IS NOT NULL AND expires_at <= ?
+                AND user_id IN ({placeholders})
+                """,
+                (datetime.now().isoformat(), *user_ids)
+            )
+            rows = await cursor.fetchall()
+        return [{"user_id": row[0], "expires_at": datetime.fromisoformat(row[1])} for row in rows]
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_expired_timeouts): {e}", level="error")
+        return []
+
+async def remove_timeout_records(user_ids: list) -> None:
+    """Bulk variant of remove_timeout_record."""
+    if not user_ids:
+        return
+    try:
+        async with get_db_connection() as conn:
+            await conn.executemany("DELETE FROM timeouts WHERE user_id = ?", [(uid,) for uid in user_ids])
+            await conn.executemany(
+                "DELETE FROM scheduled_jobs WHERE kind = ? AND job_key = ?",
+                [(JOB_TIMEOUT_EXPIRY, uid) for uid in user_ids]
+            )
+            await conn.commit()
+    except aiosqlite.Error as e:
+        log(f"DB Error (remove_timeout_records): {e}", level="error")
+        return
+    notify_jobs(JOB_TIMEOUT_EXPIRY, [(uid, None) for uid in user_ids])
+
+async def get_required_roles(user_id: Optional[str] = None) -> Dict[str, set]:
+    """
+    Desired managed roles per user id, derived from the records:
+    'timeout' / 'blacklist' from active timeouts rows, 'trainee' / 'cadet' from entries.
+    Pass `user_id` to look up a single user.
+    """
+    where_user = " AND user_id = ?" if user_id else ""
+    params = (datetime.now().isoformat(),) + ((user_id,) * 2 if user_id else ())
+    required = {}
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT user_id, type FROM timeouts
+                WHERE (type = 'blacklist' OR expires_at IS NULL OR expires_at > ?){where_user}
+                UNION ALL
+                SELECT user_id, role_type FROM entries WHERE 1 = 1{where_user}
+                """,
+                params
+            )
+            for uid, role in await cursor.fetchall():
+                required.setdefault(str(uid), set()).add(role)
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_required_roles): {e}", level="error")
+    return required
+
 
 # -------------------------------
 # Tickets & LOA Reminder DB
@@ -1030,7 +1218,9 @@ async def remove_ticket(thread_id: str) -> None:
                 "DELETE FROM tickets WHERE thread_id = ?",
                 (thread_id,)
             )
+            await _drop_job(conn, JOB_TICKET_LOCK, thread_id)
             await conn.commit()
+        _notify_job(JOB_TICKET_LOCK, thread_id, None)
         log(f"Removed ticket from DB: thread_id={thread_id}")
     except aiosqlite.Error as e:
         log(f"Error removing ticket {thread_id} from DB: {e}", level="error")
@@ -1065,7 +1255,9 @@ async def add_loa_reminder(thread_id: str, user_id: str, end_date_iso: str) -> N
                 """,
                 (thread_id, user_id, end_date_iso)
             )
+            await _put_job(conn, JOB_LOA_EXPIRY, thread_id, loa_expiry_epoch(end_date_iso))
             await conn.commit()
+        _notify_job(JOB_LOA_EXPIRY, thread_id, loa_expiry_epoch(end_date_iso))
         log(f"LOA reminder added: thread_id={thread_id}, end_date={end_date_iso}")
     except aiosqlite.Error as e:
         log(f"Error adding LOA reminder {thread_id}: {e}", level="error")
@@ -1092,7 +1284,9 @@ async def remove_loa_reminder(thread_id: str) -> None:
                 "DELETE FROM loa_reminders WHERE thread_id = ?",
                 (thread_id,)
             )
+            await _drop_job(conn, JOB_LOA_EXPIRY, thread_id)
             await conn.commit()
+        _notify_job(JOB_LOA_EXPIRY, thread_id, None)
         log(f"LOA reminder removed: thread_id={thread_id}")
     except aiosqlite.Error as e:
         log(f"Error removing LOA reminder {thread_id}: {e}", level="error")
@@ -1100,7 +1294,7 @@ async def remove_loa_reminder(thread_id: str) -> None:
 async def update_loa_end_date(thread_id: str, new_end_date_iso: str) -> None:
     try:
         async with get_db_connection() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 """
                 UPDATE loa_reminders
                 SET end_date = ?, reminder_sent = 0
@@ -1108,7 +1302,12 @@ async def update_loa_end_date(thread_id: str, new_end_date_iso: str) -> None:
                 """,
                 (new_end_date_iso, thread_id)
             )
+            updated = cursor.rowcount > 0
+            if updated:
+                await _put_job(conn, JOB_LOA_EXPIRY, thread_id, loa_expiry_epoch(new_end_date_iso))
             await conn.commit()
+        if updated:
+            _notify_job(JOB_LOA_EXPIRY, thread_id, loa_expiry_epoch(new_end_date_iso))
         log(f"LOA reminder extended: thread_id={thread_id}, new_end_date={new_end_date_iso}")
     except aiosqlite.Error as e:
         log(f"Error updating LOA reminder {thread_id}: {e}", level="error")
@@ -1125,17 +1324,21 @@ async def mark_reminder_sent(thread_id: str) -> None:
     except aiosqlite.Error as e:
         log(f"Error marking reminder sent for {thread_id}: {e}", level="error")
 
-async def get_expired_loa() -> List[tuple]:
+async def get_expired_loa(thread_ids: list) -> List[tuple]:
+    """(thread_id, user_id) of the LOAs among `thread_ids` that have expired and were not pinged yet."""
+    if not thread_ids:
+        return []
     today_iso = datetime.utcnow().date().isoformat()
+    placeholders = ",".join("?" * len(thread_ids))
     try:
         async with get_db_connection() as conn:
             cursor = await conn.execute(
-                """
+                f"""
                 SELECT thread_id, user_id
                 FROM loa_reminders
-                WHERE end_date < ? AND reminder_sent = 0
+                WHERE end_date < ? AND reminder_sent = 0 AND thread_id IN ({placeholders})
                 """,
-                (today_iso,)
+                (today_iso, *thread_ids)
             )
             return await cursor.fetchall()
     except aiosqlite.Error as e:
@@ -1172,25 +1375,35 @@ async def update_ticket_done(thread_id: str, done_at_iso: str):
     """Mark a ticket as done at the given UTC ISO timestamp."""
     try:
         async with get_db_connection() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 "UPDATE tickets SET ticket_done = ? WHERE thread_id = ?",
                 (done_at_iso, thread_id)
             )
+            updated = cursor.rowcount > 0
+            due_at = utc_epoch(done_at_iso) + TICKET_LOCK_DELAY.total_seconds()
+            if updated:
+                await _put_job(conn, JOB_TICKET_LOCK, thread_id, due_at)
             await conn.commit()
+        if updated:
+            _notify_job(JOB_TICKET_LOCK, thread_id, due_at)
         log(f"Ticket {thread_id} marked done at {done_at_iso}")
     except aiosqlite.Error as e:
         log(f"Error updating ticket_done: {e}", level="error")
 
 
-async def get_tickets_to_lock() -> list:
+async def get_tickets_to_lock(thread_ids: list) -> list:
     """
-    Return all thread_ids whose ticket_done ≤ (now – 24h).
+    Return the thread_ids among `thread_ids` whose ticket_done ≤ (now – 24h).
     """
+    if not thread_ids:
+        return []
     cutoff = datetime.utcnow() - timedelta(hours=24) ## CHANGE IN PRODUCTIOn
+    placeholders = ",".join("?" * len(thread_ids))
     try:
         async with get_db_connection() as conn:
             cursor = await conn.execute(
-                "SELECT thread_id, ticket_done FROM tickets WHERE ticket_done IS NOT NULL"
+                f"SELECT thread_id, ticket_done FROM tickets WHERE ticket_done IS NOT NULL AND thread_id IN ({placeholders})",
+                list(thread_ids)
             )
             rows = await cursor.fetchall()
 
@@ -1232,7 +1445,669 @@ async def clear_ticket_done(thread_id: str):
                 "UPDATE tickets SET ticket_done = NULL WHERE thread_id = ?",
                 (thread_id,)
             )
+            await _drop_job(conn, JOB_TICKET_LOCK, thread_id)
             await conn.commit()
+        _notify_job(JOB_TICKET_LOCK, thread_id, None)
         log(f"Cleared ticket_done for {thread_id}")
     except aiosqlite.Error as e:
-        log(f"Error clearing ticket_done: {e}", level="error")
\ No newline at end of file
+        log(f"Error clearing ticket_done: {e}", level="error")
+# -------------------------------
+# Recruiter Analytics
+# -------------------------------
+# Lifecycle timestamps are stamped as the events happen (first claim, ban
+# history posted, decision) and each duration since the application started is
+# folded into per-recruiter, per-region and overall aggregates right away:
+# a count/sum row plus log-scale histogram buckets for percentiles.
+
+async def init_analytics_db():
+    try:
+        async with get_db_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS application_lifecycle (
+                    thread_id       TEXT PRIMARY KEY,
+                    started_at      REAL NOT NULL,
+                    claimed_at      REAL,
+                    ban_history_at  REAL,
+                    decided_at      REAL,
+                    outcome         TEXT
+                )
+            """)
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS analytics_totals (
+                    scope         TEXT NOT NULL,
+                    key           TEXT NOT NULL,
+                    metric        TEXT NOT NULL,
+                    count         INTEGER NOT NULL DEFAULT 0,
+                    total_seconds REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (scope, key, metric)
+                )
+            """)
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS analytics_buckets (
+                    scope   TEXT NOT NULL,
+                    key     TEXT NOT NULL,
+                    metric  TEXT NOT NULL,
+                    bucket  INTEGER NOT NULL,
+                    count   INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (scope, key, metric, bucket)
+                )
+            """)
+            await conn.commit()
+            log("Analytics DB initialized successfully.")
+    except aiosqlite.Error as e:
+        log(f"Analytics DB Error: {e}", level="error")
+
+async def _add_to_aggregates(conn, scopes: list, metric: str, seconds: Optional[float]):
+    for scope, key in scopes:
+        await conn.execute(
+            """
+            INSERT INTO analytics_totals (scope, key, metric, count, total_seconds) VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(scope, key, metric) DO UPDATE SET
+                count = count + 1, total_seconds = total_seconds + excluded.total_seconds
+            """,
+            (scope, key, metric, seconds or 0.0)
+        )
+        if seconds is not None:
+            await conn.execute(
+                """
+                INSERT INTO analytics_buckets (scope, key, metric, bucket, count) VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT(scope, key, metric, bucket) DO UPDATE SET count = count + 1
+                """,
+                (scope, key, metric, bucket_of(seconds))
+            )
+
+async def _record_app_event(conn, thread_id: str, event: str, outcome: Optional[str] = None) -> Optional[float]:
+    """
+    Stamps `event` once per application and updates the aggregates, in the caller's transaction.
+    Returns the application's start epoch when a decision changed its week's outcome
+    counts (else None); the caller invalidates that trend week once it has committed.
+    """
+    column = {"claim": "claimed_at", "ban_history": "ban_history_at", "decision": "decided_at"}[event]
+    changed_week = None
+    try:
+        cursor = await conn.execute(
+            "SELECT starttime, region, recruiter_id FROM application_threads WHERE thread_id = ?", (thread_id,)
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        starttime, region, recruiter_id = row
+        started_at = local_epoch(starttime)
+        now = datetime.now().timestamp()
+        if event == "decision":
+            changed_week = started_at
+
+        await conn.execute(
+            "INSERT OR IGNORE INTO application_lifecycle (thread_id, started_at) VALUES (?, ?)",
+            (thread_id, started_at)
+        )
+        cursor = await conn.execute(
+            f"UPDATE application_lifecycle SET {column} = ?, outcome = COALESCE(?, outcome) "
+            f"WHERE thread_id = ? AND {column} IS NULL",
+            (now, outcome, thread_id)
+        )
+        if cursor.rowcount == 0:
+            return changed_week             # already recorded, each application counts once
+
+        scopes = [("all", "all"), ("region", region), ("recruiter", recruiter_id or "unclaimed")]
+        await _add_to_aggregates(conn, scopes, METRICS[event][0], max(0.0, now - started_at))
+        if outcome:
+            await _add_to_aggregates(conn, scopes, f"outcome_{outcome}", None)
+    except aiosqlite.Error as e:
+        # analytics must never block the action itself
+        log(f"DB Error (_record_app_event {event} {thread_id}): {e}", level="error")
+    return changed_week
+
+async def mark_ban_history_sent(thread_id: str) -> bool:
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                "UPDATE application_threads SET ban_history_sent = 1 WHERE thread_id = ?", (thread_id,)
+            )
+            updated = cursor.rowcount > 0
+            if updated:
+                await _record_app_event(conn, thread_id, "ban_history")
+            await conn.commit()
+            return updated
+    except aiosqlite.Error as e:
+        log(f"DB Error (mark_ban_history_sent): {e}", level="error")
+        return False
+
+async def get_recruiter_stats(scope: str = "all", key: str = "all") -> dict:
+    """
+    {"metrics": {metric: {"count", "mean", "p50", "p90"}}, "outcomes": {outcome: count}}
+    for one aggregate (overall, a region or a recruiter).
+    """
+    result = {"metrics": {}, "outcomes": {}}
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT metric, count, total_seconds FROM analytics_totals WHERE scope = ? AND key = ?",
+                (scope, key)
+            )
+            totals = await cursor.fetchall()
+            cursor = await conn.execute(
+                "SELECT metric, bucket, count FROM analytics_buckets WHERE scope = ? AND key = ?",
+                (scope, key)
+            )
+            buckets: Dict[str, Dict[int, int]] = {}
+            for metric, bucket, count in await cursor.fetchall():
+                buckets.setdefault(metric, {})[bucket] = count
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_recruiter_stats): {e}", level="error")
+        return result
+
+    for metric, count, total_seconds in totals:
+        if metric.startswith("outcome_"):
+            result["outcomes"][metric[len("outcome_"):]] = count
+            continue
+        hist = buckets.get(metric, {})
+        result["metrics"][metric] = {
+            "count": count,
+            "mean":  total_seconds / count if count else None,
+            "p50":   percentile(hist, 50),
+            "p90":   percentile(hist, 90),
+        }
+    return result
+
+async def get_recruiter_leaderboard(limit: int = 15) -> list:
+    """Per recruiter: decisions, claims and median time to claim/decision, most decisions first."""
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT key, metric, count FROM analytics_totals
+                WHERE scope = 'recruiter' AND metric IN ('time_to_claim', 'time_to_decision')
+                """
+            )
+            totals = await cursor.fetchall()
+            cursor = await conn.execute(
+                """
+                SELECT key, metric, bucket, count FROM analytics_buckets
+                WHERE scope = 'recruiter' AND metric IN ('time_to_claim', 'time_to_decision')
+                """
+            )
+            bucket_rows = await cursor.fetchall()
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_recruiter_leaderboard): {e}", level="error")
+        return []
+
+    recruiters: Dict[str, dict] = {}
+    for key, metric, count in totals:
+        recruiters.setdefault(key, {"recruiter_id": key, "buckets": {}})[metric] = count
+    for key, metric, bucket, count in bucket_rows:
+        recruiters.setdefault(key, {"recruiter_id": key, "buckets": {}})["buckets"].setdefault(metric, {})[bucket] = count
+    board = []
+    for rec in recruiters.values():
+        board.append({
+            "recruiter_id":   rec["recruiter_id"],
+            "claims":         rec.get("time_to_claim", 0),
+            "decisions":      rec.get("time_to_decision", 0),
+            "claim_p50":      percentile(rec["buckets"].get("time_to_claim", {}), 50),
+            "decision_p50":   percentile(rec["buckets"].get("time_to_decision", {}), 50),
+        })
+    board.sort(key=lambda r: (r["decisions"], r["claims"]), reverse=True)
+    return board[:limit]
+
+# -------------------------------
+# Application Trends
+# -------------------------------
+# Weekly (Monday 00:00 UTC) buckets of submissions and outcomes per region,
+# plus closed-region attempts, from one GROUP BY over the covering
+# (epoch, region, status) indexes. Finished weeks are cached; only the current
+# week is re-read, and a week is dropped from the cache when one of its
+# applications is decided or removed.
+
+WEEK_SECONDS = 7 * 86400
+_WEEK_ORIGIN = 4 * 86400                # 1970-01-05, the first Monday of the epoch
+TREND_FIELDS = ("submitted", "accepted", "denied", "withdrawn", "closed_attempts")
+
+_trend_cache: Dict[int, Dict[str, list]] = {}   # week -> region -> counts in TREND_FIELDS order
+
+def week_of(epoch: float) -> int:
+    return int(epoch - _WEEK_ORIGIN) // WEEK_SECONDS
+
+def week_start(week: int) -> datetime:
+    return datetime.fromtimestamp(_WEEK_ORIGIN + week * WEEK_SECONDS, tz=timezone.utc)
+
+def _invalidate_trend_week(epoch: Optional[float] = None):
+    if epoch is None:
+        _trend_cache.clear()
+    else:
+        _trend_cache.pop(week_of(epoch), None)
+
+async def _backfill_epoch(conn, table: str, text_column: str, epoch_column: str):
+    cursor = await conn.execute(f"SELECT rowid, {text_column} FROM {table} WHERE {epoch_column} IS NULL")
+    rows = await cursor.fetchall()
+    if rows:
+        await conn.executemany(
+            f"UPDATE {table} SET {epoch_column} = ? WHERE rowid = ?",
+            [(int(local_epoch(text)), rowid) for rowid, text in rows]
+        )
+        log(f"Backfilled {epoch_column} for {len(rows)} {table} rows")
+
+async def get_weekly_trends(weeks: int = 12) -> Dict[int, Dict[str, list]]:
+    """{week: {region: [submitted, accepted, denied, withdrawn, closed_attempts]}} for the last `weeks` weeks."""
+    current = week_of(datetime.now().timestamp())
+    wanted = range(current - weeks + 1, current + 1)
+    missing = [week for week in wanted if week not in _trend_cache or week == current]
+    first = min(missing)
+    since = _WEEK_ORIGIN + first * WEEK_SECONDS
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT (start_epoch - {_WEEK_ORIGIN}) / {WEEK_SECONDS} AS week, region,
+                       COUNT(*),
+                       SUM(status IN ('accepted', 'accepted_cadet')),
+                       SUM(status = 'denied'),
+                       SUM(status = 'withdrawn'),
+                       0
+                  FROM application_threads
+                 WHERE start_epoch >= ?
+                 GROUP BY week, region
+                UNION ALL
+                SELECT (ts_epoch - {_WEEK_ORIGIN}) / {WEEK_SECONDS} AS week, region, 0, 0, 0, 0, COUNT(*)
+                  FROM application_attempts
+                 WHERE ts_epoch >= ? AND status = 'closed_region_attempt'
+                 GROUP BY week, region
+                """,
+                (since, since)
+            )
+            rows = await cursor.fetchall()
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_weekly_trends): {e}", level="error")
+        rows = []
+    else:
+        for week in range(first, current + 1):
+            if week in missing:
+                _trend_cache[week] = {}
+        for week, region, *counts in rows:
+            if week not in missing:
+                continue                    # cached and still valid
+            bucket = _trend_cache[week].setdefault(region, [0] * len(TREND_FIELDS))
+            for i, value in enumerate(counts):
+                bucket[i] += value or 0
+    return {week: _trend_cache.get(week, {}) for week in wanted}
+
+# -------------------------------
+# Paginated Lists
+# -------------------------------
+# Keyset pagination for the list commands: a page is the `limit` rows after
+# (or before) the sort key of the row at the page edge, so only one page is
+# ever read. Each function returns (rows, has_more, total).
+
+async def _keyset_page(query: str, keys: List[str], edge: Optional[tuple], backwards: bool,
+                       limit: int, params: tuple = ()) -> tuple:
+    key_expr = f"({', '.join(keys)})"
+    direction = "DESC" if backwards else "ASC"
+    where, args = "", list(params)
+    if edge:
+        where = f"WHERE {key_expr} {'<' if backwards else '>'} ({', '.join('?' * len(edge))})"
+        args += list(edge)
+    order = ", ".join(f"{key} {direction}" for key in keys)
+    async with get_db_connection() as conn:
+        cursor = await conn.execute(
+            f"SELECT * FROM ({query}) {where} ORDER BY {order} LIMIT ?", (*args, limit + 1)
+        )
+        rows = await cursor.fetchall()
+        cursor = await conn.execute(f"SELECT COUNT(*) FROM ({query})", params)
+        total = (await cursor.fetchone())[0]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+    return rows, has_more, total
+
+async def get_role_requests_page(cursor: Optional[tuple] = None, backwards: bool = False, limit: int = 10) -> tuple:
+    try:
+        rows, has_more, total = await _keyset_page(
+            "SELECT user_id, request_type, details, timestamp FROM role_requests",
+            ["timestamp", "user_id"], cursor, backwards, limit
+        )
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_role_requests_page): {e}", level="error")
+        return [], False, 0
+    requests = [
+        {"user_id": r[0], "request_type": r[1], "details": r[2], "timestamp": r[3]}
+        for r in rows
+    ]
+    return requests, has_more, total
+
+async def get_open_applications_page(cursor: Optional[tuple] = None, backwards: bool = False, limit: int = 10) -> tuple:
+    """Same order as sort_applications: unclaimed without ban history, unclaimed with, then claimed."""
+    if cursor:
+        cursor = (int(cursor[0]), *cursor[1:])
+    try:
+        rows, has_more, total = await _keyset_page(
+            """
+            SELECT thread_id, applicant_id, recruiter_id, ingame_name, region, ban_history_sent, starttime,
+                   CASE WHEN COALESCE(recruiter_id, '') != '' THEN 2 ELSE COALESCE(ban_history_sent, 0) END AS sort_rank
+            FROM application_threads WHERE is_closed = 0 AND status = 'open'
+            """,
+            ["sort_rank", "starttime", "thread_id"], cursor, backwards, limit
+        )
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_open_applications_page): {e}", level="error")
+        return [], False, 0
+    applications = [
+        {
+            "thread_id": r[0], "applicant_id": r[1], "recruiter_id": r[2], "ingame_name": r[3],
+            "region": r[4], "ban_history_sent": int(r[5]), "starttime": datetime.fromisoformat(r[6]),
+            "sort_rank": r[7],
+            "starttime_raw": r[6],      # page cursor: the stored text, which isoformat() may not reproduce
+        }
+        for r in rows
+    ]
+    return applications, has_more, total
+
+async def get_timeouts_page(cursor: Optional[tuple] = None, backwards: bool = False, limit: int = 10) -> tuple:
+    try:
+        rows, has_more, total = await _keyset_page(
+            "SELECT user_id, type, expires_at FROM timeouts",
+            ["user_id"], cursor, backwards, limit
+        )
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_timeouts_page): {e}", level="error")
+        return [], False, 0
+    records = [
+        {"user_id": r[0], "type": r[1], "expires_at": datetime.fromisoformat(r[2]) if r[2] else None}
+        for r in rows
+    ]
+    return records, has_more, total
+
+async def get_active_loa_page(cursor: Optional[tuple] = None, backwards: bool = False, limit: int = 10) -> tuple:
+    try:
+        rows, has_more, total = await _keyset_page(
+            "SELECT thread_id, user_id, end_date FROM loa_reminders WHERE reminder_sent = 0",
+            ["end_date", "thread_id"], cursor, backwards, limit
+        )
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_active_loa_page): {e}", level="error")
+        return [], False, 0
+    reminders = [{"thread_id": r[0], "user_id": r[1], "end_date": r[2]} for r in rows]
+    return reminders, has_more, total
+
+# -------------------------------
+# Scheduled Jobs
+# -------------------------------
+# Due-time work (reminders, LOA expiry, ticket auto-lock) is kept as one row per
+# (kind, job_key) with a unix-epoch due_at. The writers above keep these rows in
+# step with their own tables and notify the listeners (the scheduler) after commit.
+
+JOB_ENTRY_ENDTIME  = "entry_endtime"
+JOB_APP_REMINDER   = "app_reminder"
+JOB_ROLE_REMINDER  = "role_request_reminder"
+JOB_LOA_EXPIRY     = "loa_expiry"
+JOB_TICKET_LOCK    = "ticket_lock"
+JOB_TIMEOUT_EXPIRY = "timeout_expiry"
+JOB_GUEST_SWEEP    = "guest_sweep"
+
+APP_FIRST_REMINDER    = timedelta(hours=3)
+APP_REMINDER_INTERVAL = timedelta(hours=24)
+ROLE_REQUEST_REMINDER = timedelta(hours=24)
+TICKET_LOCK_DELAY     = timedelta(hours=24)
+
+# callables (kind, job_key, due_at); job_key None means every job of that kind,
+# due_at None means the job was cancelled
+_job_listeners = []
+
+def add_job_listener(callback) -> None:
+    if callback not in _job_listeners:
+        _job_listeners.append(callback)
+
+def remove_job_listener(callback) -> None:
+    if callback in _job_listeners:
+        _job_listeners.remove(callback)
+
+def _notify_job(kind: str, job_key: Optional[str], due_at: Optional[float]) -> None:
+    for callback in list(_job_listeners):
+        try:
+            callback(kind, job_key, due_at)
+        except Exception as e:
+            log(f"Job listener failed for {kind}/{job_key}: {e}", level="error")
+
+def local_epoch(value) -> float:
+    """Epoch seconds of a naive local datetime (or its ISO string)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+def utc_epoch(value) -> float:
+    """Epoch seconds of a naive UTC datetime (or its ISO string)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+def loa_expiry_epoch(end_date_iso: str) -> float:
+    """An LOA counts as expired from 00:00 UTC on the day after its end date."""
+    end = date.fromisoformat(end_date_iso[:10]) + timedelta(days=1)
+    return datetime(end.year, end.month, end.day, tzinfo=timezone.utc).timestamp()
+
+def app_reminder_epoch(starttime_iso: str, last_reminder_iso: Optional[str]) -> float:
+    """First reminder 3h after the application opened, then one per day."""
+    if last_reminder_iso:
+        return utc_epoch(last_reminder_iso) + APP_REMINDER_INTERVAL.total_seconds()
+    return local_epoch(starttime_iso) + APP_FIRST_REMINDER.total_seconds()
+
+async def _put_job(conn, kind: str, job_key: str, due_at: float) -> None:
+    await conn.execute(
+        """
+        INSERT INTO scheduled_jobs (kind, job_key, due_at) VALUES (?, ?, ?)
+        ON CONFLICT(kind, job_key) DO UPDATE SET due_at = excluded.due_at
+        """,
+        (kind, job_key, due_at)
+    )
+
+async def _drop_job(conn, kind: str, job_key: Optional[str] = None) -> None:
+    if job_key is None:
+        await conn.execute("DELETE FROM scheduled_jobs WHERE kind = ?", (kind,))
+    else:
+        await conn.execute(
+            "DELETE FROM scheduled_jobs WHERE kind = ? AND job_key = ?",
+            (kind, job_key)
+        )
+
+async def init_scheduled_jobs_db():
+    try:
+        async with get_db_connection() as conn:
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                    kind     TEXT NOT NULL,
+                    job_key  TEXT NOT NULL,
+                    due_at   REAL NOT NULL,
+                    UNIQUE (kind, job_key)
+                )
+                """
+            )
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due ON scheduled_jobs(due_at)"
+            )
+            await conn.commit()
+            log("Scheduled jobs DB initialized successfully.")
+    except aiosqlite.Error as e:
+        log(f"Scheduled jobs DB Error: {e}", level="error")
+
+async def put_jobs(conn, kind: str, jobs: list) -> None:
+    """
+    Upserts jobs of one kind inside the caller's transaction. `jobs` is a list of
+    (job_key, due_at); call notify_jobs() once the transaction is committed.
+    """
+    await conn.executemany(
+        """
+        INSERT INTO scheduled_jobs (kind, job_key, due_at) VALUES (?, ?, ?)
+        ON CONFLICT(kind, job_key) DO UPDATE SET due_at = excluded.due_at
+        """,
+        [(kind, job_key, due_at) for job_key, due_at in jobs]
+    )
+
+def notify_jobs(kind: str, jobs: list) -> None:
+    for job_key, due_at in jobs:
+        _notify_job(kind, job_key, due_at)
+
+async def schedule_jobs(kind: str, jobs: list) -> bool:
+    """Creates or moves jobs of one kind. `jobs` is a list of (job_key, due_at)."""
+    if not jobs:
+        return True
+    try:
+        async with get_db_connection() as conn:
+            await put_jobs(conn, kind, jobs)
+            await conn.commit()
+    except aiosqlite.Error as e:
+        log(f"DB Error (schedule_jobs {kind}): {e}", level="error")
+        return False
+    notify_jobs(kind, jobs)
+    return True
+
+async def schedule_job(kind: str, job_key: str, due_at: float) -> bool:
+    return await schedule_jobs(kind, [(job_key, due_at)])
+
+async def ensure_job(kind: str, job_key: str, due_at: float) -> Optional[float]:
+    """Creates the job unless it already exists. Returns the stored due_at."""
+    try:
+        async with get_db_connection() as conn:
+            await conn.execute(
+                "INSERT OR IGNORE INTO scheduled_jobs (kind, job_key, due_at) VALUES (?, ?, ?)",
+                (kind, job_key, due_at)
+            )
+            cursor = await conn.execute(
+                "SELECT due_at FROM scheduled_jobs WHERE kind = ? AND job_key = ?", (kind, job_key)
+            )
+            row = await cursor.fetchone()
+            await conn.commit()
+    except aiosqlite.Error as e:
+        log(f"DB Error (ensure_job {kind}): {e}", level="error")
+        return None
+    _notify_job(kind, job_key, row[0])
+    return row[0]
+
+async def complete_scheduled_jobs(kind: str, jobs: list) -> None:
+    """
+    Deletes jobs that ran. `jobs` is a list of (job_key, due_at); a job that was
+    moved to a later time while its handler ran is left in place.
+    """
+    try:
+        async with get_db_connection() as conn:
+            await conn.executemany(
+                "DELETE FROM scheduled_jobs WHERE kind = ? AND job_key = ? AND due_at <= ?",
+                [(kind, job_key, due_at) for job_key, due_at in jobs]
+            )
+            await conn.commit()
+    except aiosqlite.Error as e:
+        log(f"DB Error (complete_scheduled_jobs {kind}): {e}", level="error")
+
+async def get_scheduled_jobs() -> List[tuple]:
+    """Returns every stored job as (kind, job_key, due_at), earliest first."""
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT kind, job_key, due_at FROM scheduled_jobs ORDER BY due_at"
+            )
+            return await cursor.fetchall()
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_scheduled_jobs): {e}", level="error")
+        return []
+
+async def backfill_scheduled_jobs() -> int:
+    """
+    Creates missing jobs from the source tables (rows written before the
+    scheduler existed, or by hand). Existing jobs are left alone.
+    Returns the number of jobs added.
+    """
+    sources = [
+        (JOB_ENTRY_ENDTIME,
+         "SELECT thread_id, endtime FROM entries WHERE reminder_sent = 0 AND endtime IS NOT NULL",
+         lambda endtime: local_epoch(endtime)),
+        (JOB_APP_REMINDER,
+         "SELECT thread_id, starttime, last_reminder_sent FROM application_threads "
+         "WHERE is_closed = 0 AND COALESCE(silenced, 0) = 0",
+         app_reminder_epoch),
+        (JOB_ROLE_REMINDER,
+         "SELECT user_id, timestamp FROM role_requests WHERE reminder_sent = 0",
+         lambda ts: local_epoch(ts) + ROLE_REQUEST_REMINDER.total_seconds()),
+        (JOB_LOA_EXPIRY,
+         "SELECT thread_id, end_date FROM loa_reminders WHERE reminder_sent = 0",
+         loa_expiry_epoch),
+        (JOB_TICKET_LOCK,
+         "SELECT thread_id, ticket_done FROM tickets WHERE ticket_done IS NOT NULL",
+         lambda done: utc_epoch(done) + TICKET_LOCK_DELAY.total_seconds()),
+        (JOB_TIMEOUT_EXPIRY,
+         "SELECT user_id, expires_at FROM timeouts WHERE type = 'timeout' AND expires_at IS NOT NULL",
+         local_epoch),
+    ]
+    added = 0
+    try:
+        async with get_db_connection() as conn:
+            for kind, query, due_for in sources:
+                try:
+                    cursor = await conn.execute(query)
+                    rows = await cursor.fetchall()
+                except aiosqlite.Error as e:
+                    log(f"Could not backfill {kind} jobs: {e}", level="warning")
+                    continue
+                jobs = []
+                for job_key, *values in rows:
+                    try:
+                        jobs.append((kind, str(job_key), due_for(*values)))
+                    except (TypeError, ValueError):
+                        continue
+                before = conn.total_changes
+                await conn.executemany(
+                    "INSERT OR IGNORE INTO scheduled_jobs (kind, job_key, due_at) VALUES (?, ?, ?)",
+                    jobs
+                )
+                added += conn.total_changes - before
+            await conn.commit()
+    except aiosqlite.Error as e:
+        log(f"DB Error (backfill_scheduled_jobs): {e}", level="error")
+    return added
+
+# -------------------------------
+# Bot State
+# -------------------------------
+# Small key/value facts the bot keeps across restarts (e.g. the hash of the
+# last synced command tree).
+
+async def init_bot_state_db():
+    try:
+        async with get_db_connection() as conn:
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS bot_state (
+                    key        TEXT PRIMARY KEY,
+                    value      TEXT,
+                    updated_at TEXT
+                )
+                """
+            )
+            await conn.commit()
+            log("Bot state DB initialized successfully.")
+    except aiosqlite.Error as e:
+        log(f"Bot state DB Error: {e}", level="error")
+
+async def get_bot_state(key: str) -> Optional[str]:
+    try:
+        async with get_db_connection() as conn:
+            cursor = await conn.execute("SELECT value FROM bot_state WHERE key = ?", (key,))
+            row = await cursor.fetchone()
+            return row[0] if row else None
+    except aiosqlite.Error as e:
+        log(f"DB Error (get_bot_state {key}): {e}", level="error")
+        return None
+
+async def set_bot_state(key: str, value: str) -> bool:
+    try:
+        async with get_db_connection() as conn:
+            await conn.execute(
+                """
+                INSERT INTO bot_state (key, value, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                """,
+                (key, value, datetime.utcnow().isoformat())
+            )
+            await conn.commit()
+        return True
+    except aiosqlite.Error as e:
+        log(f"DB Error (set_bot_state {key}): {e}", level="error")
+        return False
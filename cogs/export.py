@@ -0,0 +1,186 @@
+# cogs/export.py
+import asyncio, csv, gzip, io, json, tempfile
+from datetime import datetime
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from cogs.helpers import log, create_user_activity_log_embed
+from cogs.db_utils import PLAYER_LOGS_FILE, stream_query
+from cogs.guild_resources import require_tier
+
+# dataset -> (query, column the date range applies to, database; None is data.db).
+# The range is [since, until) on the stored ISO text, so "2025-01-01" compares
+# correctly against full timestamps.
+EXPORTS = {
+    "applications": (
+        "SELECT * FROM application_threads WHERE starttime >= ? AND starttime < ? ORDER BY starttime",
+        "starttime",
+        None,
+    ),
+    "attempts": (
+        "SELECT * FROM application_attempts WHERE timestamp >= ? AND timestamp < ? ORDER BY id",
+        "timestamp",
+        None,
+    ),
+    "entries": (
+        "SELECT * FROM entries WHERE starttime >= ? AND starttime < ? ORDER BY starttime",
+        "starttime",
+        None,
+    ),
+    "tickets": (
+        "SELECT * FROM tickets WHERE created_at >= ? AND created_at < ? ORDER BY created_at",
+        "created_at",
+        None,
+    ),
+    "playtime_daily": (
+        """
+        SELECT date(l.log_time) AS day, l.uid, p.current_name, SUM(l.seconds) AS seconds
+          FROM playtime_log l
+          LEFT JOIN players_info p ON p.uid = l.uid
+         WHERE l.log_time >= ? AND l.log_time < ?
+         GROUP BY day, l.uid
+         ORDER BY day, l.uid
+        """,
+        "log_time (UTC)",
+        PLAYER_LOGS_FILE,
+    ),
+}
+
+UPLOAD_HEADROOM = 512 * 1024    # gzip holds back part of its output until flushed
+
+
+class _PartWriter:
+    """
+    Writes rows into gzip parts on disk, starting a new part (with its own
+    header) before the compressed size reaches `max_bytes`.
+    """
+
+    def __init__(self, columns: list, fmt: str, max_bytes: int):
+        self.columns   = columns
+        self.fmt       = fmt
+        self.max_bytes = max_bytes
+        self.parts     = []         # finished temp files, rewound
+        self.rows      = 0
+        self._open()
+
+    def _open(self):
+        self._part_rows = 0
+        self._raw  = tempfile.TemporaryFile()
+        self._gz   = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        self._text = io.TextIOWrapper(self._gz, encoding="utf-8", newline="")
+        self._csv  = csv.writer(self._text) if self.fmt == "csv" else None
+        if self._csv:
+            self._csv.writerow(self.columns)
+
+    def _close(self):
+        self._text.flush()
+        self._text.detach()
+        self._gz.close()
+        self._raw.seek(0)
+        self.parts.append(self._raw)
+
+    def write(self, rows: list):
+        for row in rows:
+            if self._csv:
+                self._csv.writerow(row)
+            else:
+                self._text.write(json.dumps(dict(zip(self.columns, row)), default=str) + "\n")
+        self.rows += len(rows)
+        self._part_rows += len(rows)
+        if self._raw.tell() >= self.max_bytes:
+            self._close()
+            self._open()
+
+    def finish(self) -> list:
+        if self.parts and not self._part_rows:
+            self._raw.close()           # split landed on the last batch; nothing left to send
+        else:
+            self._close()
+        return self.parts
+
+    def discard(self):
+        self._raw.close()
+        for part in self.parts:
+            part.close()
+
+
+class ExportCog(commands.Cog):
+    """Leadership data exports as gzip CSV/JSONL attachments."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="export", description="Export recruitment data as a compressed CSV/JSONL file.")
+    @app_commands.describe(
+        dataset="What to export",
+        file_format="csv or jsonl",
+        since="Start date, YYYY-MM-DD (inclusive)",
+        until="End date, YYYY-MM-DD (exclusive)"
+    )
+    @app_commands.choices(
+        dataset=[app_commands.Choice(name=name, value=name) for name in EXPORTS],
+        file_format=[
+            app_commands.Choice(name="CSV", value="csv"),
+            app_commands.Choice(name="JSON Lines", value="jsonl"),
+        ]
+    )
+    @require_tier("leadership", "❌ Only leadership can export data.")
+    async def export(self, interaction: discord.Interaction, dataset: str, file_format: str = "csv",
+                     since: Optional[str] = None, until: Optional[str] = None):
+        for value in (since, until):
+            if value:
+                try:
+                    datetime.strptime(value, "%Y-%m-%d")
+                except ValueError:
+                    return await interaction.response.send_message(
+                        "❌ Dates must be in YYYY-MM-DD format.", ephemeral=True
+                    )
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        query, date_column, db_path = EXPORTS[dataset]
+        limit = interaction.guild.filesize_limit if interaction.guild else 10 * 1024 * 1024
+
+        writer = None
+        try:
+            async with stream_query(query, (since or "", until or "9999"), db_path=db_path) as (columns, batches):
+                writer = _PartWriter(columns, file_format, limit - UPLOAD_HEADROOM)
+                async for rows in batches:
+                    # compression runs off the event loop; only one batch is held at a time
+                    await asyncio.to_thread(writer.write, rows)
+            parts = await asyncio.to_thread(writer.finish)
+        except Exception as e:
+            log(f"Export of {dataset} failed: {e}", level="error")
+            if writer:
+                writer.discard()
+            return await interaction.followup.send(f"❌ Export failed: {e}", ephemeral=True)
+
+        span = f"{since or 'start'} → {until or 'now'}"
+        stem = f"{dataset}_{since or 'all'}_{until or 'now'}"
+        try:
+            for idx, part in enumerate(parts, 1):
+                suffix = f".part{idx}" if len(parts) > 1 else ""
+                filename = f"{stem}{suffix}.{file_format}.gz"
+                content = (
+                    f"📦 **{dataset}** ({span}, by {date_column}): {writer.rows} rows"
+                    if idx == 1 else None
+                )
+                await interaction.followup.send(content, file=discord.File(part, filename=filename), ephemeral=True)
+        finally:
+            for part in parts:
+                part.close()
+
+        log(f"{interaction.user.id} exported {dataset} ({span}): {writer.rows} rows in {len(parts)} file(s)")
+        activity_channel = self.bot.resources.activity_ch
+        if activity_channel:
+            log_embed = create_user_activity_log_embed(
+                "recruitment", "Data Export", interaction.user,
+                f"{dataset} ({span}), {writer.rows} rows as {file_format}"
+            )
+            self.bot.outbound.send(activity_channel, embed=log_embed)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ExportCog(bot))
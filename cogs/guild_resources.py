@@ -1,13 +1,40 @@
 # cogs/guild_resources.py
 
 import asyncio
+from functools import wraps
+from typing import Dict, FrozenSet
+
+import discord
 from config import *
 
+# permission tier -> role IDs; holding any one of them grants the tier
+PERMISSION_TIERS = {
+    "leadership": (LEADERSHIP_ID,),
+    "recruiter":  (RECRUITER_ID,),
+    "staff":      (RECRUITER_ID, LEADERSHIP_ID),
+    "mentor":     (MENTOR_ROLE_ID,),
+    "lead_dev":   (LEAD_BOT_DEVELOPER_ID,),
+    "chief":      (CHIEF_ROLE_ID,),
+}
+
+def member_has_any(member, role_ids) -> bool:
+    """
+    True if `member` holds any of `role_ids`. Intersects the IDs with the
+    member's raw role-ID list (one set lookup per role the member holds)
+    instead of building and scanning Role objects; a plain User (DMs) has no
+    roles and never passes.
+    """
+    member_roles = getattr(member, "_roles", None)
+    if member_roles is None:
+        return False
+    return not frozenset(role_ids).isdisjoint(member_roles)
+
 class GuildResources:
     """Holds cached Role & Channel objects for quick access."""
     def __init__(self, bot):
         self.bot    = bot
         self._ready = asyncio.Event()
+        self.tiers: Dict[str, FrozenSet[int]] = {}   # filled by _load; empty means nobody passes
 
         # placeholders for channels
         self.trainee_notes_ch = None
@@ -34,10 +61,15 @@ class GuildResources:
         self.blacklist_role   = None
         self.timeout_role     = None
         self.lead_dev_role    = None
+        self.chief_role       = None
         # … add any other roles you need …
 
         # register _init to run once on ready
         bot.add_listener(self._init, "on_ready")
+        # re-resolve everything when roles or channels change
+        for event in ("on_guild_role_create", "on_guild_role_delete", "on_guild_role_update",
+                      "on_guild_channel_create", "on_guild_channel_delete", "on_guild_channel_update"):
+            bot.add_listener(self._on_guild_change, event)
 
     async def _init(self):
         # ensure this only runs once
@@ -55,6 +87,16 @@ class GuildResources:
             # give up if still missing
             return
 
+        self._load(guild)
+        # signal that resources are ready
+        self._ready.set()
+
+    async def _on_guild_change(self, obj, *_):
+        guild = getattr(obj, "guild", None)
+        if self._ready.is_set() and guild is not None and guild.id == GUILD_ID:
+            self._load(guild)
+
+    def _load(self, guild: discord.Guild):
         # --------------------
         # Channels
         # --------------------
@@ -91,15 +133,48 @@ class GuildResources:
         self.guest_role     = guild.get_role(GUEST_ROLE)
         self.verified_role  = guild.get_role(VERIFIED_ROLE)
         self.lead_dev_role   = guild.get_role(LEAD_BOT_DEVELOPER_ID)
+        self.chief_role      = guild.get_role(CHIEF_ROLE_ID)
 
-        # signal that resources are ready
-        self._ready.set()
+        # --------------------
+        # Permission tiers
+        # --------------------
+        # only roles that exist count, like the old `role and role in user.roles`
+        self.tiers = {
+            tier: frozenset(role_id for role_id in role_ids if guild.get_role(role_id))
+            for tier, role_ids in PERMISSION_TIERS.items()
+        }
+
+    def has_tier(self, member, tier: str) -> bool:
+        """True if `member` holds a role of `tier`."""
+        return member_has_any(member, self.tiers.get(tier, ()))
 
     async def ready(self):
         """Await until all roles & channels are fetched."""
         await self._ready.wait()
         return self
 
+
+def require_tier(tier: str, message: str = "❌ You do not have permission to use this command."):
+    """
+    Rejects the interaction with `message` unless the user is in `tier`, before
+    the wrapped callback (and any DB work in it) runs. Works on app commands and
+    component callbacks alike: the first Interaction argument is checked. A call
+    without one raises instead of running the callback unchecked.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = kwargs.get("interaction") or next(
+                (arg for arg in args if isinstance(arg, discord.Interaction)), None
+            )
+            if interaction is None:
+                raise TypeError(f"{func.__qualname__} requires tier '{tier}' but was called without an Interaction")
+            if not interaction.client.resources.has_tier(interaction.user, tier):
+                return await interaction.response.send_message(message, ephemeral=True)
+            return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 # In your bot startup file (e.g. main.py):
 #
 # from cogs.guild_resources import GuildResources
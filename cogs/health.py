@@ -0,0 +1,108 @@
+# cogs/health.py
+import asyncio, math, time
+from time import perf_counter
+from typing import Optional
+
+import aiohttp
+import discord
+
+from config import TICKET_CHANNEL_ID, STATUS_PROBE_SECONDS, STATUS_PAGE_SECONDS, STATUS_WINDOW_SECONDS
+from cogs.helpers import log
+from cogs.db_utils import get_db_connection
+from cogs.metrics import RollingStats
+
+DISCORD_STATUS_URL = "https://status.discord.com/api/v2/status.json"
+
+
+class HealthProber:
+    """
+    Samples bot health in the background so /status never waits on the network:
+    - heartbeat, a REST round-trip (fetch_channel) and a DB round-trip every
+      STATUS_PROBE_SECONDS
+    - the Discord status page every STATUS_PAGE_SECONDS (one pooled session)
+    Each series is a RollingStats over the last STATUS_WINDOW_SECONDS. Event-loop
+    lag comes from the bot's LoopWatchdog.
+    """
+
+    def __init__(self, bot: discord.Client, interval: float = STATUS_PROBE_SECONDS,
+                 page_interval: float = STATUS_PAGE_SECONDS, window: float = STATUS_WINDOW_SECONDS):
+        self.bot           = bot
+        self.interval      = interval
+        self.page_interval = page_interval
+        self.window        = window
+        samples = int(window / interval) + 1
+        self.heartbeat   = RollingStats(maxlen=samples, window=window)     # ms
+        self.rest        = RollingStats(maxlen=samples, window=window)     # ms
+        self.db          = RollingStats(maxlen=samples, window=window)     # ms
+        self.status_page = RollingStats(maxlen=samples, window=window)     # ms
+        self.loop_lag    = bot.watchdog.lag
+        self.rest_ok     = None
+        self.db_ok       = None
+        self.status_desc = None
+        self.sampled_at  = None         # wall clock of the last probe
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._page_due = 0.0
+        self._tasks = []
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._probe_loop())]
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    # -------------------------------
+    # Probes
+    # -------------------------------
+    async def _probe_loop(self):
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                await self.probe()
+            except Exception as e:
+                log(f"Health probe failed: {e}", level="error")
+            await asyncio.sleep(self.interval)
+
+    async def probe(self):
+        latency = self.bot.latency
+        if math.isfinite(latency):
+            self.heartbeat.add(latency * 1000)
+
+        start = perf_counter()
+        try:
+            await self.bot.fetch_channel(TICKET_CHANNEL_ID)
+            self.rest_ok = True
+        except Exception:
+            self.rest_ok = False
+        self.rest.add((perf_counter() - start) * 1000)
+
+        start = perf_counter()
+        try:
+            async with get_db_connection() as conn:
+                await conn.execute("SELECT 1")
+            self.db_ok = True
+        except Exception:
+            self.db_ok = False
+        self.db.add((perf_counter() - start) * 1000)
+
+        if time.monotonic() >= self._page_due:
+            self._page_due = time.monotonic() + self.page_interval
+            await self._probe_status_page()
+        self.sampled_at = time.time()
+
+    async def _probe_status_page(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        start = perf_counter()
+        try:
+            async with self._session.get(DISCORD_STATUS_URL) as resp:
+                j = await resp.json()
+                self.status_desc = j["status"]["description"]
+        except Exception:
+            self.status_desc = "Fetch Failed"
+        self.status_page.add((perf_counter() - start) * 1000)
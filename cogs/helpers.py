@@ -1,44 +1,27 @@
 import discord
 from config import *
+import asyncio, random
 import logging
-import inspect
+import sys
 import aiosqlite
+import hashlib, json
 from datetime import datetime, timezone
-from typing import Optional, Dict, Union
-import pytz
+from typing import Any, Awaitable, Callable, Optional, Dict, Tuple, Union
 DATABASE_FILE = "data.db"
 
-# 1) Generate a log file name based on date/time
-LOG_FILENAME = datetime.now().strftime("botlog_%Y-%m-%d_%H-%M-%S.log")
+# Records go to the root logger; main.py sets up the file handlers (cogs.logging_setup)
 
-# 2) Configure the logging to write to that file
-logging.basicConfig(
-    filename=LOG_FILENAME,
-    filemode="a",            # append to the file
-    level=logging.INFO,      # or DEBUG, etc.
-    format="%(asctime)s - %(message)s",  # We'll prepend module info ourselves below
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING, "debug": logging.DEBUG}
+_loggers: Dict[str, logging.Logger] = {}
 
 def log(message: str, level: str = "info"):
-    # 1) Identify which file (module) called log()
-    #    - we look one frame up in the stack
-    caller_frame = inspect.stack()[1]
-    caller_module = inspect.getmodule(caller_frame[0])
-    module_name = caller_module.__name__ if caller_module else "UnknownModule"
-
-    # 2) Build the final text with [module_name]
-    full_msg = f"[{module_name}] {message}"
-
-    # 3) Dispatch to the built-in logger with the chosen level
-    if level.lower() == "error":
-        logging.error(full_msg)
-    elif level.lower() == "warning":
-        logging.warning(full_msg)
-    elif level.lower() == "debug":
-        logging.debug(full_msg)
-    else:
-        logging.info(full_msg)
+    # The caller's module name comes straight from its frame globals; unlike
+    # inspect.stack() this touches one frame and reads no source files.
+    module_name = sys._getframe(1).f_globals.get("__name__", "UnknownModule")
+    logger = _loggers.get(module_name)
+    if logger is None:
+        logger = _loggers[module_name] = logging.getLogger(module_name)
+    logger.log(_LEVELS.get(level.lower(), logging.INFO), message)
 
 def is_in_correct_guild(interaction: discord.Interaction) -> bool:
     return interaction.guild_id == GUILD_ID
@@ -86,6 +69,12 @@ def create_user_activity_log_embed(type: str, action: str, user: discord.Member,
 
     return embed
 
+def embed_hash(embed: discord.Embed, view: Optional[discord.ui.View] = None) -> str:
+    """Stable hash of an embed's (and its view's) rendered content, used to skip no-op edits."""
+    content = {"embed": embed.to_dict(), "view": view.to_components() if view else None}
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
 async def init_stored_embeds_db():
     """
     Initialize the stored_embeds table in the database if it doesn't exist.
@@ -95,12 +84,17 @@ async def init_stored_embeds_db():
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS stored_embeds (
-                    embed_key   TEXT PRIMARY KEY,
-                    message_id  TEXT NOT NULL,
-                    channel_id  TEXT NOT NULL
+                    embed_key    TEXT PRIMARY KEY,
+                    message_id   TEXT NOT NULL,
+                    channel_id   TEXT NOT NULL,
+                    content_hash TEXT
                 )
                 """
             )
+            cursor = await db.execute("PRAGMA table_info(stored_embeds)")
+            columns = [row[1] for row in await cursor.fetchall()]
+            if "content_hash" not in columns:
+                await db.execute("ALTER TABLE stored_embeds ADD COLUMN content_hash TEXT")
             await db.commit()
         log("Stored embeds DB initialized successfully.")
     except Exception as e:
@@ -115,28 +109,34 @@ async def get_stored_embed(embed_key: str) -> Optional[Dict]:
             row = await cursor.fetchone()
     return {"message_id": row[0], "channel_id": row[1]} if row else None
 
-async def set_stored_embed(embed_key: str, message_id: int, channel_id: int):
+async def get_all_stored_embeds() -> Dict[str, Dict]:
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        async with db.execute(
+            "SELECT embed_key, message_id, channel_id, content_hash FROM stored_embeds"
+        ) as cursor:
+            rows = await cursor.fetchall()
+    return {
+        key: {"message_id": message_id, "channel_id": channel_id, "content_hash": content_hash}
+        for key, message_id, channel_id, content_hash in rows
+    }
+
+async def set_stored_embed(embed_key: str, message_id: int, channel_id: int, content_hash: Optional[str] = None):
     async with aiosqlite.connect(DATABASE_FILE) as db:
         await db.execute("""
-            INSERT OR REPLACE INTO stored_embeds (embed_key, message_id, channel_id)
-            VALUES (?,?,?)
-        """, (embed_key, message_id, channel_id))
+            INSERT OR REPLACE INTO stored_embeds (embed_key, message_id, channel_id, content_hash)
+            VALUES (?,?,?,?)
+        """, (embed_key, message_id, channel_id, content_hash))
         await db.commit()
 
-def remove_stored_embed(embed_key: str) -> bool:
-    import sqlite3
+async def remove_stored_embed(embed_key: str) -> bool:
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM stored_embeds WHERE embed_key = ?", (embed_key,))
-        conn.commit()
-        return cursor.rowcount > 0
+        async with aiosqlite.connect(DATABASE_FILE) as db:
+            cursor = await db.execute("DELETE FROM stored_embeds WHERE embed_key = ?", (embed_key,))
+            await db.commit()
+            return cursor.rowcount > 0
     except Exception as e:
         log(f"DB Error (remove_stored_embed): {e}", level="error")
         return False
-    finally:
-        conn.close()
-        return False
 
 def d_timestamp(dt_or_iso: Union[str, datetime], style: str = "f") -> str:
     """
@@ -149,4 +149,28 @@ def d_timestamp(dt_or_iso: Union[str, datetime], style: str = "f") -> str:
         # if you pass in a datetime, fromisoformat would choke on it
         dt = datetime.fromisoformat(dt_or_iso)
     ts = int(dt.timestamp())
-    return f"<t:{ts}:{style}>"
\ No newline at end of file
+    return f"<t:{ts}:{style}>"
+
+async def retry_with_backoff(
+    attempt_once: Callable[[], Awaitable[Tuple[Any, bool, Optional[float]]]],
+    max_attempts: int, base_delay: float, max_delay: float,
+    on_retry: Optional[Callable[[Any, int, float], None]] = None,
+) -> Any:
+    """
+    Calls `attempt_once()` until it succeeds or `max_attempts` are used up and
+    returns the last result. `attempt_once` returns (result, retryable,
+    retry_after); retryable failures wait with jittered exponential backoff, or
+    for the server's retry_after, never longer than `max_delay`.
+    on_retry(result, attempt, delay) runs before each wait (logging, counters).
+    """
+    for attempt in range(1, max_attempts + 1):
+        result, retryable, retry_after = await attempt_once()
+        if not retryable or attempt == max_attempts:
+            return result
+        if retry_after:
+            delay = min(max_delay, retry_after)
+        else:
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+        if on_retry:
+            on_retry(result, attempt, delay)
+        await asyncio.sleep(delay)
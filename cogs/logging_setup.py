@@ -0,0 +1,92 @@
+# cogs/logging_setup.py
+import atexit, gzip, json, logging, os, queue, shutil
+from datetime import date, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts":     datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level":  record.levelname.lower(),
+            "module": record.name,
+            "msg":    record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-based RotatingFileHandler that also rolls over when the local date
+    changes, and gzips every rolled file (botlog.log.1.gz, .2.gz, ...).
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, daily: bool):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.daily  = daily
+        self.opened = self._file_date()
+        self.namer  = lambda name: name + ".gz"
+        self.rotator = self._compress
+
+    def _file_date(self) -> date:
+        if os.path.exists(self.baseFilename):
+            return date.fromtimestamp(os.path.getmtime(self.baseFilename))
+        return date.today()
+
+    @staticmethod
+    def _compress(source: str, dest: str):
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.daily and date.today() != self.opened and os.path.exists(self.baseFilename):
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        super().doRollover()
+        self.opened = date.today()
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(filename: str, max_bytes: int, backup_count: int,
+                      daily: bool = True, json_lines: bool = False, level: int = logging.INFO) -> QueueListener:
+    """
+    Routes the root logger through a QueueHandler; a QueueListener thread does
+    the formatting and file I/O, so logging never blocks the event loop.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    file_handler = CompressingRotatingFileHandler(filename, max_bytes, backup_count, daily)
+    if json_lines:
+        file_handler.setFormatter(JsonLinesFormatter())
+    else:
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s - [%(name)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flushes whatever is still queued and stops the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
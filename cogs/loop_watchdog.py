@@ -0,0 +1,146 @@
+# cogs/loop_watchdog.py
+import asyncio, bisect, os, sys, threading, time, traceback
+from typing import Optional
+
+from config import LOOP_WATCHDOG_INTERVAL, LOOP_WATCHDOG_THRESHOLD, LOOP_WATCHDOG_HANG
+from cogs.helpers import log
+from cogs.metrics import RollingStats, fmt_ms, register_source
+
+LAG_BUCKETS = (5, 20, 50, 100, 250, 1000)      # ms; the last histogram bucket is "more"
+
+
+class LoopWatchdog:
+    """
+    Always-on event-loop lag monitor and blocking-call detector.
+    - a callback on the loop ticks every `interval` seconds; how late each tick
+      runs is the loop lag (histogram + per-second max over the last hour)
+    - a daemon thread watches the ticks; once none has run for `threshold`
+      seconds it grabs the loop thread's current stack, i.e. the code that is
+      blocking, and logs it with the cog function and task when the loop
+      recovers (or after `hang` seconds if it doesn't)
+    Nothing is captured while the loop is healthy, so the cost is one timer
+    callback per interval and a thread that wakes a few times per threshold.
+    """
+
+    def __init__(self, interval: float = LOOP_WATCHDOG_INTERVAL,
+                 threshold: float = LOOP_WATCHDOG_THRESHOLD, hang: float = LOOP_WATCHDOG_HANG):
+        self.interval  = interval
+        self.threshold = threshold
+        self.hang      = hang
+        self.lag       = RollingStats(maxlen=3600, window=3600)   # max lag per second, ms
+        self.histogram = [0] * (len(LAG_BUCKETS) + 1)             # ticks per lag bucket
+        self.stalls    = 0
+        self.last_stall: Optional[str] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._beat = 0.0                # monotonic time of the last tick
+        self._second_start = 0.0
+        self._second_max = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        register_source("loop_lag", self.describe)
+
+    def start(self):
+        """Starts watching the running loop. Call from inside it."""
+        if self._thread:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = self._second_start = time.monotonic()
+        self._handle = self._loop.call_later(self.interval, self._tick, self._beat + self.interval)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+        self._thread = None
+
+    # -------------------------------
+    # Loop side
+    # -------------------------------
+    def _tick(self, expected: float):
+        now = time.monotonic()
+        lag_ms = max(0.0, now - expected) * 1000
+        self.histogram[bisect.bisect_right(LAG_BUCKETS, lag_ms)] += 1
+        self._second_max = max(self._second_max, lag_ms)
+        if now - self._second_start >= 1.0:
+            self.lag.add(self._second_max)
+            self._second_start, self._second_max = now, 0.0
+        self._beat = now
+        self._handle = self._loop.call_later(self.interval, self._tick, now + self.interval)
+
+    # -------------------------------
+    # Watchdog thread
+    # -------------------------------
+    def _watch(self):
+        stalled_beat = None         # the last tick before the stall being tracked
+        stack, where, task = [], "unknown", None
+        hang_reported = False
+        while not self._stop.wait(min(self.interval, self.threshold) / 2):
+            beat = self._beat
+            if stalled_beat is not None and beat != stalled_beat:
+                # recovered: the first tick after the stall ran at `beat`
+                blocked_ms = (beat - stalled_beat - self.interval) * 1000
+                self.stalls += 1
+                self.last_stall = f"{blocked_ms:.0f} ms in {where}"
+                self._report(f"Event loop blocked for {blocked_ms:.0f} ms", where, task, stack)
+                stalled_beat, hang_reported = None, False
+                continue
+
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold:
+                continue
+            if stalled_beat is None:
+                stalled_beat = beat
+                stack, where, task = self._capture()
+            elif stalled >= self.hang and not hang_reported:
+                hang_reported = True
+                self._report(f"Event loop still blocked after {stalled:.0f}s", where, task, stack)
+
+    def _capture(self):
+        """Stack of the loop thread right now, the innermost bot function in it, and the current task."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.extract_stack(frame) if frame else []
+        # drop the asyncio runner frames above the callback that is blocking
+        runner = [i for i, entry in enumerate(stack) if f"{os.sep}asyncio{os.sep}" in entry.filename]
+        if runner and runner[-1] + 1 < len(stack):
+            stack = stack[runner[-1] + 1:]
+        stack = stack[-15:]
+        where = "unknown"
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith("cogs.") or module in ("__main__", "main"):
+                if module != __name__:
+                    where = f"{module}.{frame.f_code.co_qualname}"
+                    break
+            frame = frame.f_back
+        task = None
+        try:
+            current = asyncio.current_task(self._loop)
+            task = current.get_name() if current else None
+        except RuntimeError:
+            pass
+        return stack, where, task
+
+    def _report(self, headline: str, where: str, task: Optional[str], stack: list):
+        task_note = f" (task {task})" if task else ""
+        log(f"{headline} in {where}{task_note}:\n{''.join(traceback.format_list(stack)).rstrip()}",
+            level="warning")
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        snap = self.lag.snapshot()
+        labels = [f"<{bound}" for bound in LAG_BUCKETS] + [f"≥{LAG_BUCKETS[-1]}"]
+        histogram = " ".join(f"{label}:{count}" for label, count in zip(labels, self.histogram) if count)
+        stall = f", last: {self.last_stall}" if self.last_stall else ""
+        return (
+            f"p50 {fmt_ms(snap['p50'])}, p95 {fmt_ms(snap['p95'])}, max {fmt_ms(snap['max'])} (1 h); "
+            f"ms {histogram or 'n/a'}; {self.stalls} stalls > {fmt_ms(self.threshold * 1000)}{stall}"
+        )
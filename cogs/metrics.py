@@ -0,0 +1,124 @@
+# cogs/metrics.py
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+# name -> callable returning a one-line summary (shown by /status)
+_SOURCES: Dict[str, Callable[[], str]] = {}
+
+# name -> LoopStats for the background loops wrapped with track_loop()
+LOOPS: Dict[str, "LoopStats"] = {}
+
+
+class RollingStats:
+    """
+    Rolling window of numeric samples, bounded by count and optionally by age
+    (`window` in seconds). Used for latency/lag percentiles.
+    """
+
+    def __init__(self, maxlen: int = 1000, window: Optional[float] = None):
+        self.window = window
+        self._samples = deque(maxlen=maxlen)
+
+    def __len__(self):
+        self._prune()
+        return len(self._samples)
+
+    def add(self, value: float, ts: Optional[float] = None):
+        self._samples.append((ts if ts is not None else time.monotonic(), value))
+
+    def _prune(self):
+        if self.window is None:
+            return
+        cutoff = time.monotonic() - self.window
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def values(self) -> list:
+        self._prune()
+        return [value for _, value in self._samples]
+
+    def last(self):
+        return self._samples[-1][1] if self._samples else None
+
+    def percentile(self, pct: float) -> Optional[float]:
+        values = sorted(self.values())
+        if not values:
+            return None
+        index = min(len(values) - 1, max(0, round(pct / 100 * (len(values) - 1))))
+        return values[index]
+
+    def snapshot(self) -> dict:
+        values = sorted(self.values())
+        if not values:
+            return {"count": 0, "p50": None, "p95": None, "max": None, "last": None}
+        pick = lambda pct: values[min(len(values) - 1, round(pct / 100 * (len(values) - 1)))]
+        return {
+            "count": len(values),
+            "p50":   pick(50),
+            "p95":   pick(95),
+            "max":   values[-1],
+            "last":  self.last(),
+        }
+
+
+def fmt_ms(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:.0f} ms"
+
+
+def register_source(name: str, describe: Callable[[], str]):
+    """Registers a component summary for /status. Re-registering replaces it."""
+    _SOURCES[name] = describe
+
+
+def unregister_source(name: str):
+    _SOURCES.pop(name, None)
+
+
+def collect() -> Dict[str, str]:
+    """Returns {name: summary} for every registered source."""
+    out = {}
+    for name, describe in list(_SOURCES.items()):
+        try:
+            out[name] = describe()
+        except Exception as e:
+            out[name] = f"unavailable ({e})"
+    return out
+
+
+class LoopStats:
+    """When a background loop last ran, whether that run raised, and run durations (ms)."""
+
+    def __init__(self):
+        self.last_run = None            # wall-clock start of the last run
+        self.last_ok  = True
+        self.runs     = 0
+        self.durations = RollingStats(maxlen=500, window=3600)
+
+
+def track_loop(name: str):
+    """
+    Decorator for a tasks.loop body, placed under @tasks.loop: records each
+    run's start and duration in LOOPS[name] for /status.
+    """
+    stats = LOOPS.setdefault(name, LoopStats())
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            stats.last_run = time.time()
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                stats.last_ok = False
+                raise
+            else:
+                stats.last_ok = True
+                return result
+            finally:
+                stats.runs += 1
+                stats.durations.add((time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
@@ -0,0 +1,94 @@
+# cogs/name_index.py
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+
+# Leading rank tags are stripped before indexing so that "happy" finds "[SWAT] Happy"
+TAG_PREFIX_RE = re.compile(r"^\[(?:SWAT|CADET|TRAINEE)\]\s*", re.IGNORECASE)
+
+
+def _fold(name: str) -> str:
+    return name.casefold().strip()
+
+
+def _trigrams(text: str) -> set:
+    """Returns the padded trigram set of an already folded string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerNameIndex:
+    """
+    In-memory index over every known player name (current and past).
+    Serves prefix lookups for autocomplete and trigram-ranked fuzzy
+    suggestions when an exact /player lookup misses.
+    """
+
+    def __init__(self):
+        self._names = {}                 # folded name -> name as last seen
+        self._keys = []                  # sorted (search key, folded name)
+        self._grams = defaultdict(set)   # trigram -> folded names containing it
+        self._gram_count = {}            # folded name -> number of trigrams
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, name: str):
+        """Adds a name to the index. Re-adding a known name only refreshes its casing."""
+        if not name:
+            return
+        folded = _fold(name)
+        if not folded:
+            return
+        if folded in self._names:
+            self._names[folded] = name
+            return
+        self._names[folded] = name
+
+        core = TAG_PREFIX_RE.sub("", folded)
+        for key in {folded, core}:
+            if key:
+                insort(self._keys, (key, folded))
+
+        grams = _trigrams(core or folded)
+        self._gram_count[folded] = len(grams)
+        for gram in grams:
+            self._grams[gram].add(folded)
+
+    def prefix(self, text: str, limit: int = 25) -> list:
+        """Returns up to `limit` names whose full or tag-stripped form starts with `text`."""
+        key = _fold(text)
+        if not key:
+            return []
+        results, seen = [], set()
+        i = bisect_left(self._keys, (key,))
+        while i < len(self._keys) and len(results) < limit:
+            candidate, folded = self._keys[i]
+            if not candidate.startswith(key):
+                break
+            if folded not in seen:
+                seen.add(folded)
+                results.append(self._names[folded])
+            i += 1
+        return results
+
+    def fuzzy(self, text: str, limit: int = 5, min_score: float = 0.3) -> list:
+        """
+        Ranks known names by trigram similarity (Dice coefficient) to `text`.
+        Returns a list of (name, score) tuples, best match first.
+        """
+        query = TAG_PREFIX_RE.sub("", _fold(text))
+        if not query:
+            return []
+        grams = _trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._grams.get(gram, ()))
+
+        scored = []
+        for folded, hits in shared.items():
+            score = 2 * hits / (len(grams) + self._gram_count[folded])
+            if score >= min_score:
+                scored.append((score, folded))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self._names[folded], round(score, 2)) for score, folded in scored[:limit]]
@@ -0,0 +1,154 @@
+# cogs/outbound.py
+import asyncio, heapq, itertools, time
+from collections import deque
+from typing import Dict, Optional
+
+import discord
+
+from cogs.helpers import log
+from cogs.metrics import RollingStats, fmt_ms, register_source
+
+PRIORITY_PING = 0   # messages with content (mentions); never merged, sent first
+PRIORITY_LOG  = 1   # plain embeds; merged into batches
+
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+class _Item:
+    __slots__ = ("content", "embeds", "future", "merge", "queued_at")
+
+    def __init__(self, content, embeds, future, merge):
+        self.content   = content
+        self.embeds    = embeds
+        self.future    = future
+        self.merge     = merge and not content
+        self.queued_at = time.monotonic()
+
+
+class _ChannelQueue:
+    def __init__(self, channel):
+        self.channel = channel
+        self.heap    = []                   # (priority, seq, _Item)
+        self.sends   = deque()              # monotonic times of recent sends
+        self.worker: Optional[asyncio.Task] = None
+
+
+class OutboundQueue:
+    """
+    Per-channel queue for bot messages such as activity-log embeds.
+    - plain embeds queued within `window` seconds are merged, up to 10 per message
+    - messages with content (pings) are sent on their own and ahead of logs;
+      merge=False sends a plain embed on its own too (e.g. for its jump_url)
+    - each channel is kept to `rate` messages per `per` seconds, on top of
+      discord.py's own 429 handling
+    send() returns a future resolving to the sent discord.Message (None on failure).
+    """
+
+    def __init__(self, window: float = 1.0, rate: int = 5, per: float = 5.0):
+        self.window  = window
+        self.rate    = rate
+        self.per     = per
+        self.latency = RollingStats(maxlen=500)     # queued -> sent, ms
+        self.sent_messages = 0
+        self.sent_embeds   = 0
+        self.failed        = 0
+
+        self._queues: Dict[int, _ChannelQueue] = {}
+        self._seq = itertools.count()
+        register_source("outbound", self.describe)
+
+    def send(self, channel: discord.abc.Messageable, content: Optional[str] = None,
+             embed: Optional[discord.Embed] = None, embeds: Optional[list] = None,
+             priority: Optional[int] = None, merge: bool = True) -> asyncio.Future:
+        """Queues a message (at most 10 embeds). Awaiting the returned future is optional."""
+        embeds = ([embed] if embed is not None else []) + list(embeds or [])
+        if priority is None:
+            priority = PRIORITY_PING if content else PRIORITY_LOG
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = _ChannelQueue(channel)
+        heapq.heappush(queue.heap, (priority, next(self._seq), _Item(content, embeds[:MAX_EMBEDS_PER_MESSAGE], future, merge)))
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._drain(queue))
+        return future
+
+    async def close(self):
+        for queue in self._queues.values():
+            if queue.worker:
+                queue.worker.cancel()
+            # nobody is going to send these; don't leave awaiting callers hanging
+            for _, _, item in queue.heap:
+                if not item.future.done():
+                    item.future.set_result(None)
+            queue.heap.clear()
+
+    # -------------------------------
+    # Worker
+    # -------------------------------
+    def _next_batch(self, queue: _ChannelQueue) -> list:
+        priority, _, item = heapq.heappop(queue.heap)
+        batch = [item]
+        if priority != PRIORITY_LOG or not item.merge:
+            return batch
+        count = len(item.embeds)
+        while queue.heap:
+            next_priority, _, candidate = queue.heap[0]
+            if next_priority != PRIORITY_LOG or not candidate.merge:
+                break
+            if count + len(candidate.embeds) > MAX_EMBEDS_PER_MESSAGE:
+                break
+            heapq.heappop(queue.heap)
+            batch.append(candidate)
+            count += len(candidate.embeds)
+        return batch
+
+    async def _throttle(self, queue: _ChannelQueue):
+        now = time.monotonic()
+        while queue.sends and now - queue.sends[0] >= self.per:
+            queue.sends.popleft()
+        if len(queue.sends) >= self.rate:
+            await asyncio.sleep(self.per - (now - queue.sends[0]))
+            queue.sends.popleft()
+        queue.sends.append(time.monotonic())
+
+    async def _drain(self, queue: _ChannelQueue):
+        while queue.heap:
+            priority, _, head = queue.heap[0]
+            if priority == PRIORITY_LOG and head.merge:
+                # give a burst of log embeds a moment to collect
+                wait = self.window - (time.monotonic() - head.queued_at)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+
+            batch = self._next_batch(queue)
+            embeds = [embed for item in batch for embed in item.embeds]
+            await self._throttle(queue)
+            try:
+                message = await queue.channel.send(content=batch[0].content, embeds=embeds)
+                self.sent_messages += 1
+                self.sent_embeds += len(embeds)
+            except Exception as e:
+                # any failure (not just HTTPException) must not kill the worker
+                # and strand the futures still queued behind this batch
+                message = None
+                self.failed += 1
+                log(f"Outbound send to channel {queue.channel.id} failed ({len(batch)} queued message(s)): {e}", level="error")
+
+            sent_at = time.monotonic()
+            for item in batch:
+                self.latency.add((sent_at - item.queued_at) * 1000)
+                if not item.future.done():
+                    item.future.set_result(message)
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        depth = sum(len(queue.heap) for queue in self._queues.values())
+        snap = self.latency.snapshot()
+        return (
+            f"{depth} queued, {self.sent_messages} msgs / {self.sent_embeds} embeds, "
+            f"{self.failed} failed, latency p50 {fmt_ms(snap['p50'])}, p95 {fmt_ms(snap['p95'])}"
+        )
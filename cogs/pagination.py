@@ -0,0 +1,133 @@
+# cogs/pagination.py
+import re
+from typing import Awaitable, Callable, Dict, Optional
+
+import discord
+
+PAGE_SIZE = 10
+
+# async fetch(cursor, backwards, limit) -> (rows, has_more, total), see db_utils "Paginated Lists"
+PageFetcher = Callable[[Optional[tuple], bool, int], Awaitable[tuple]]
+
+
+class PageSource:
+    """
+    One keyset-paginated list. `cursor_of(row)` returns the row's sort key and
+    `format_row(interaction, row)` its line in the page embed.
+    """
+
+    def __init__(self, name: str, title: str, fetch: PageFetcher,
+                 cursor_of: Callable[[dict], tuple], format_row: Callable[[discord.Interaction, dict], str],
+                 empty_text: str, colour: discord.Colour = discord.Colour.blue()):
+        self.name       = name
+        self.title      = title
+        self.fetch      = fetch
+        self.cursor_of  = cursor_of
+        self.format_row = format_row
+        self.empty_text = empty_text
+        self.colour     = colour
+
+
+_SOURCES: Dict[str, PageSource] = {}
+
+
+def register_page_source(source: PageSource) -> PageSource:
+    _SOURCES[source.name] = source
+    return source
+
+
+def _encode(cursor: tuple) -> str:
+    return "|".join(str(part) for part in cursor)
+
+
+def _decode(text: str) -> Optional[tuple]:
+    return tuple(text.split("|")) if text else None
+
+
+# -------------------------------
+# Buttons
+# -------------------------------
+class PageButton(discord.ui.DynamicItem[discord.ui.Button],
+                 template=r"page:(?P<source>[a-z_]+):(?P<direction>prev|next):(?P<cursor>.*)"):
+    """
+    Prev/next button. The page edge is carried in the custom_id, so the buttons
+    keep working after a restart and no page state is held in memory.
+    """
+
+    def __init__(self, source: str, direction: str, cursor: str = "", disabled: bool = False):
+        super().__init__(
+            discord.ui.Button(
+                label="◀ Prev" if direction == "prev" else "Next ▶",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"page:{source}:{direction}:{cursor}",
+                disabled=disabled,
+            )
+        )
+        self.source    = source
+        self.direction = direction
+        self.cursor    = cursor
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]):
+        return cls(match["source"], match["direction"], match["cursor"])
+
+    async def callback(self, interaction: discord.Interaction):
+        source = _SOURCES.get(self.source)
+        if source is None:
+            return await interaction.response.send_message("❌ This list is no longer available.", ephemeral=True)
+        embed, view = await build_page(source, interaction, _decode(self.cursor), backwards=self.direction == "prev")
+        if embed is None:
+            embed = discord.Embed(title=source.title, description=source.empty_text, colour=source.colour)
+        await interaction.response.edit_message(embed=embed, view=view)
+
+
+# -------------------------------
+# Pages
+# -------------------------------
+async def build_page(source: PageSource, interaction: discord.Interaction,
+                     cursor: Optional[tuple] = None, backwards: bool = False):
+    """Loads one page. Returns (embed, view); embed is None if the list is empty."""
+    rows, has_more, total = await source.fetch(cursor, backwards, PAGE_SIZE)
+    if backwards and not rows:
+        # everything before the edge was removed in the meantime
+        rows, has_more, total = await source.fetch(None, False, PAGE_SIZE)
+        cursor, backwards = None, False
+
+    if not rows:
+        return None, None
+
+    lines = "\n".join(source.format_row(interaction, row) for row in rows)
+    embed = discord.Embed(
+        title=source.title,
+        description=lines,
+        colour=source.colour,
+    )
+    embed.set_footer(text=f"{total} total")
+
+    if backwards:
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = cursor is not None, has_more
+    if not has_prev and not has_next:
+        return embed, None
+
+    view = discord.ui.View(timeout=None)
+    view.add_item(PageButton(source.name, "prev", _encode(source.cursor_of(rows[0])), disabled=not has_prev))
+    view.add_item(PageButton(source.name, "next", _encode(source.cursor_of(rows[-1])), disabled=not has_next))
+    return embed, view
+
+
+async def send_paginated(interaction: discord.Interaction, source_name: str):
+    """Sends the first page of a registered list as an ephemeral message."""
+    source = _SOURCES[source_name]
+    embed, view = await build_page(source, interaction)
+    if embed is None:
+        kwargs = {"content": source.empty_text, "ephemeral": True}
+    else:
+        kwargs = {"embed": embed, "ephemeral": True}
+        if view is not None:
+            kwargs["view"] = view
+    if interaction.response.is_done():
+        await interaction.followup.send(**kwargs)
+    else:
+        await interaction.response.send_message(**kwargs)
@@ -0,0 +1,164 @@
+# cogs/persistent_embeds.py
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import discord
+from discord import PartialMessage
+
+from cogs.helpers import log, embed_hash, init_stored_embeds_db, get_all_stored_embeds, set_stored_embed
+from cogs.metrics import register_source
+
+# async render() -> (channel, embed, view) for one embed key
+Renderer = Callable[[], Awaitable[Tuple[Optional[discord.abc.Messageable], discord.Embed, Optional[discord.ui.View]]]]
+
+
+class PersistentEmbeds:
+    """
+    Keeps the bot's long-lived embeds (role request, application, tickets,
+    verification) posted and up to date.
+    - each key has a render callback; refresh(key) edits the message only when
+      the rendered content hash differs from the last one posted
+    - deleted messages are reported by on_raw_message_delete and re-sent right
+      away, so nothing polls Discord to check that a message still exists
+    - the first refresh after a restart fetches the stored message once, since
+      it may have been deleted while the bot was offline
+    """
+
+    def __init__(self, bot):
+        self.bot     = bot
+        self.sends   = 0
+        self.edits   = 0
+        self.skipped = 0
+        self.failed  = 0
+
+        self._records: Dict[str, dict] = {}     # key -> {"message_id", "channel_id", "hash", "verified"}
+        self._by_message: Dict[int, str] = {}   # message id -> key
+        self._renderers: Dict[str, Renderer] = {}
+        self._locks = defaultdict(asyncio.Lock)
+        self._resends: set = set()              # re-send tasks started by deletion events
+        self._loaded = False
+        register_source("embeds", self.describe)
+
+    def register(self, key: str, render: Renderer):
+        self._renderers[key] = render
+
+    def unregister(self, key: str):
+        self._renderers.pop(key, None)
+
+    def message_id(self, key: str) -> Optional[int]:
+        record = self._records.get(key)
+        return record["message_id"] if record else None
+
+    # -------------------------------
+    # Records
+    # -------------------------------
+    async def _load(self):
+        if self._loaded:
+            return
+        await init_stored_embeds_db()       # cogs may refresh before on_ready has run it
+        for key, stored in (await get_all_stored_embeds()).items():
+            self._set_record(key, int(stored["message_id"]), int(stored["channel_id"]),
+                             stored["content_hash"], verified=False)
+        self._loaded = True
+
+    def _set_record(self, key: str, message_id: int, channel_id: int, digest: Optional[str], verified: bool):
+        old = self._records.get(key)
+        if old:
+            self._by_message.pop(old["message_id"], None)
+        self._records[key] = {"message_id": message_id, "channel_id": channel_id,
+                              "hash": digest, "verified": verified}
+        self._by_message[message_id] = key
+
+    async def _store(self, key: str, message_id: int, channel_id: int, digest: str):
+        self._set_record(key, message_id, channel_id, digest, verified=True)
+        await set_stored_embed(key, str(message_id), str(channel_id), digest)
+
+    # -------------------------------
+    # Refresh
+    # -------------------------------
+    async def refresh(self, key: str) -> Optional[int]:
+        """Renders `key` and posts it if needed. Returns the message id (None if not posted)."""
+        render = self._renderers.get(key)
+        if render is None:
+            return None
+        async with self._locks[key]:
+            await self._load()
+            channel, embed, view = await render()
+            if channel is None:
+                return None
+            digest = embed_hash(embed, view)
+            record = self._records.get(key)
+            if record and record["channel_id"] != channel.id:
+                record = None               # channel changed: post a fresh one there
+
+            try:
+                if record and record["hash"] == digest:
+                    if record["verified"]:
+                        self.skipped += 1
+                        return record["message_id"]
+                    try:
+                        await channel.fetch_message(record["message_id"])
+                        record["verified"] = True
+                        self.skipped += 1
+                        return record["message_id"]
+                    except discord.NotFound:
+                        record = None
+
+                if record:
+                    try:
+                        await PartialMessage(channel=channel, id=record["message_id"]).edit(embed=embed, view=view)
+                        self.edits += 1
+                        await self._store(key, record["message_id"], channel.id, digest)
+                        return record["message_id"]
+                    except discord.NotFound:
+                        pass                # gone: fall through and send a new one
+
+                msg = await channel.send(embed=embed, view=view)
+                self.sends += 1
+                await self._store(key, msg.id, channel.id, digest)
+                log(f"Posted {key} as message {msg.id}")
+                return msg.id
+            except discord.HTTPException as e:
+                self.failed += 1
+                log(f"Error refreshing persistent embed {key}: {e}", level="error")
+                return None
+
+    # -------------------------------
+    # Deletion events
+    # -------------------------------
+    def _forget(self, message_id: int):
+        key = self._by_message.get(message_id)
+        if key is None or key not in self._renderers:
+            return                          # not ours (e.g. the player list keeps its own)
+        del self._by_message[message_id]
+        self._records.pop(key, None)
+        log(f"Persistent embed {key} ({message_id}) was deleted; re-sending")
+        task = asyncio.create_task(self.refresh(key))
+        self._resends.add(task)
+        task.add_done_callback(lambda t: self._resend_done(key, t))
+
+    def _resend_done(self, key: str, task: asyncio.Task):
+        self._resends.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.failed += 1
+            log(f"Re-sending deleted persistent embed {key} failed: {error!r}", level="error")
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self._forget(payload.message_id)
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            self._forget(message_id)
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        return (
+            f"{len(self._records)} tracked, {self.skipped} unchanged, "
+            f"{self.edits} edits, {self.sends} sends, {self.failed} failed"
+        )
@@ -1,12 +1,64 @@
 # cogs/player_list.py
 import discord
+from discord import app_commands
 from discord.ext import tasks, commands
-import requests, json, asyncio, aiohttp, re, pytz, aiosqlite
+import json, asyncio, aiohttp, re, aiosqlite
 from aiohttp import ContentTypeError
-from datetime import datetime, timedelta
-import io
+from datetime import datetime, timedelta, timezone
+import io, time
 from config import *
 from cogs.helpers import log, set_stored_embed, get_stored_embed
+from cogs.name_index import PlayerNameIndex
+from cogs.rolling_unique import RollingUniqueCounter, hour_bucket
+from cogs.metrics import track_loop
+from cogs.db_utils import PLAYER_LOGS_FILE
+
+# -------------------------------
+# Compact member records
+# -------------------------------
+# Every role that matters for the player list gets one bit. Rank roles come first,
+# in ROLE_TO_RANK priority order, so the lowest set rank bit is the member's rank.
+ROLE_BITS = {role_id: 1 << i for i, role_id in enumerate(ROLE_TO_RANK)}
+RANK_MASK = (1 << len(ROLE_BITS)) - 1
+for _role_id in (LEADERSHIP_ID, MENTOR_ROLE_ID, CADET_ROLE, TRAINEE_ROLE, SWAT_ROLE_ID):
+    ROLE_BITS.setdefault(_role_id, 1 << len(ROLE_BITS))
+LEADERSHIP_BIT = ROLE_BITS[LEADERSHIP_ID]
+MENTOR_BIT     = ROLE_BITS[MENTOR_ROLE_ID]
+CADET_BIT      = ROLE_BITS[CADET_ROLE]
+TRAINEE_BIT    = ROLE_BITS[TRAINEE_ROLE]
+SWAT_BIT       = ROLE_BITS[SWAT_ROLE_ID]
+
+RANK_BY_BIT = {ROLE_BITS[role_id]: rank for role_id, rank in ROLE_TO_RANK.items()}
+# Sort position per rank (lowest = highest rank); unknown ranks sort last
+RANK_ORDER = {rank: i for i, rank in enumerate(RANK_HIERARCHY)}
+UNRANKED_ORDER = len(RANK_HIERARCHY)
+
+SWAT_SUFFIX_RE   = re.compile(r'\s*\[SWAT\]$', re.IGNORECASE)
+MEMBER_SUFFIX_RE = re.compile(r'\s*\[(?:CADET|TRAINEE|SWAT)\]$', re.IGNORECASE)
+SWAT_PREFIX_RE   = re.compile(r'^\[SWAT\]\s*', re.IGNORECASE)
+
+
+def rank_from_mask(mask: int):
+    """Highest-priority rank encoded in `mask` (lowest set rank bit), or None."""
+    rank_bits = mask & RANK_MASK
+    return RANK_BY_BIT.get(rank_bits & -rank_bits)
+
+
+class CachedMember:
+    """Slim per-member record for the player list: relevant roles packed into a bitmask."""
+    __slots__ = ("id", "joined_at", "mask", "rank")
+
+    def __init__(self, member_id: int, joined_at, role_ids):
+        mask = 0
+        for role_id in role_ids:
+            bit = ROLE_BITS.get(role_id)
+            if bit:
+                mask |= bit
+        self.id        = member_id
+        self.joined_at = joined_at
+        self.mask      = mask
+        self.rank      = rank_from_mask(mask)
+
 
 class PlayerListCog(commands.Cog):
     """Cog for updating an online player list embed based on external APIs,
@@ -15,7 +67,7 @@ class PlayerListCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         # Cache for Discord members
-        self.discord_cache = {"timestamp": None, "members": {}}
+        self.discord_cache = {"timestamp": None, "members": [], "swat_names": {}, "plain_names": {}}
 
         # 1) Global queue cache  (for all regions except SEA)
         self.queue_cache = {
@@ -24,6 +76,9 @@ class PlayerListCog(commands.Cog):
         }
         # A lock to enforce 1 s between each global external request
         self.rate_limit_lock = asyncio.Lock()
+        # Pauses between external requests / regions (the replay benchmark sets these to 0)
+        self.request_spacing = 1
+        self.region_spacing = 2
 
         # 2) SEA‐only queue cache (for https://sea.gtacnr.net/cnr/servers)
         self.sea_queue_cache = {
@@ -41,6 +96,10 @@ class PlayerListCog(commands.Cog):
         self.http: aiohttp.ClientSession = None
         # For playtime increment calculation.
         self.last_update_time = None
+        # Prefix/trigram index of every known player name (for /player)
+        self.name_index = PlayerNameIndex()
+        # Distinct [SWAT] uids seen over the last 24 hours, in hour buckets
+        self.swat_tracker = RollingUniqueCounter(window_hours=24)
         # Kick off initialization (DB + HTTP + starts loops)
         self.bot.loop.create_task(self.init_database())
 
@@ -49,9 +108,11 @@ class PlayerListCog(commands.Cog):
     async def init_database(self):
         """Initialize aiosqlite DB connection, HTTP session, setup tables, then start loops."""
         # DB
-        self.db_conn = await aiosqlite.connect("player_logs.db")
+        self.db_conn = await aiosqlite.connect(PLAYER_LOGS_FILE)
         self.db_conn.row_factory = aiosqlite.Row
         await self.setup_database()
+        await self.load_name_index()
+        await self.load_swat_tracker()
         # HTTP
         self.http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
         # Now safe to start background loops
@@ -87,8 +148,81 @@ class PlayerListCog(commands.Cog):
                     change_time TEXT
                 )
             """)
+            # Case-insensitive name lookups for /player
+            await cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_players_info_name ON players_info(current_name COLLATE NOCASE)"
+            )
+            await cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_name_changes_old ON name_changes(old_name COLLATE NOCASE)"
+            )
+            await cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_name_changes_new ON name_changes(new_name COLLATE NOCASE)"
+            )
+            # Latest hour bucket each [SWAT] uid was seen in (rolling unique count)
+            await cur.execute("""
+                CREATE TABLE IF NOT EXISTS swat_seen (
+                    uid TEXT PRIMARY KEY,
+                    hour INTEGER NOT NULL
+                )
+            """)
+            await cur.execute("CREATE INDEX IF NOT EXISTS idx_swat_seen_hour ON swat_seen(hour)")
         await self.db_conn.commit()
 
+    async def load_swat_tracker(self):
+        """
+        Restores the rolling [SWAT] uid buckets from swat_seen. On the very first
+        run the table is seeded once from playtime_log so the count starts correct.
+        """
+        current_hour = hour_bucket(time.time())
+        cutoff = self.swat_tracker.cutoff(current_hour)
+        try:
+            async with self.db_conn.cursor() as cur:
+                await cur.execute("SELECT 1 FROM swat_seen LIMIT 1")
+                if await cur.fetchone() is None:
+                    await cur.execute("""
+                        INSERT OR REPLACE INTO swat_seen (uid, hour)
+                        SELECT l.uid, CAST(strftime('%s', MAX(l.log_time)) AS INTEGER) / 3600
+                          FROM playtime_log l
+                          JOIN players_info p ON p.uid = l.uid
+                         WHERE l.log_time >= ?
+                           AND p.current_name LIKE '[SWAT]%'
+                         GROUP BY l.uid
+                    """, (datetime.utcfromtimestamp(cutoff * 3600).isoformat(),))
+                    await self.db_conn.commit()
+                await cur.execute("SELECT uid, hour FROM swat_seen WHERE hour >= ?", (cutoff,))
+                async for row in cur:
+                    self.swat_tracker.observe(row["uid"], row["hour"])
+            log(f"Restored {len(self.swat_tracker)} SWAT uids seen in the last 24h.")
+        except Exception as e:
+            log(f"Error restoring SWAT unique tracker: {e}", level="error")
+
+    async def record_swat_sightings(self, sightings: list):
+        """Persists uids that moved to a newer hour bucket during this tick."""
+        if not sightings:
+            return
+        try:
+            await self.db_conn.executemany(
+                "INSERT OR REPLACE INTO swat_seen (uid, hour) VALUES (?, ?)",
+                sightings
+            )
+            await self.db_conn.commit()
+        except Exception as e:
+            log(f"Error persisting SWAT sightings: {e}", level="error")
+
+    async def load_name_index(self):
+        """Fills the in-memory name index with every current and past player name."""
+        try:
+            async with self.db_conn.cursor() as cur:
+                await cur.execute("SELECT current_name FROM players_info")
+                async for row in cur:
+                    self.name_index.add(row["current_name"])
+                await cur.execute("SELECT old_name FROM name_changes")
+                async for row in cur:
+                    self.name_index.add(row["old_name"])
+            log(f"Loaded {len(self.name_index)} player names into the name index.")
+        except Exception as e:
+            log(f"Error loading player name index: {e}", level="error")
+
     def cog_unload(self):
         self.update_game_status.cancel()
         # Close DB
@@ -116,7 +250,7 @@ class PlayerListCog(commands.Cog):
                     # read raw bytes, then decode as utf-8 (replace on errors)
                     raw = await resp.read()
                 # release lock after read + throttle
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.request_spacing)
 
             # now decode & parse JSON
             text = raw.decode("utf-8", errors="replace")
@@ -144,7 +278,7 @@ class PlayerListCog(commands.Cog):
                     text = await resp.text()
                     data = json.loads(text)
                 # enforce at least 1s between external calls
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.request_spacing)
         except ContentTypeError:
             # fallback if aiohttp still complains
             text = await resp.text()
@@ -172,7 +306,7 @@ class PlayerListCog(commands.Cog):
                     resp.raise_for_status()
                     text = await resp.text()
                 # enforce 1s between SEA requests
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.request_spacing)
         except Exception as e:
             log(f"Error fetching SEA queue data: {e}", level="error")
             return {}
@@ -250,15 +384,20 @@ class PlayerListCog(commands.Cog):
         if not guild:
             log(f"Bot not in guild with ID {GUILD_ID}.", level="error")
             return
-        dc_members = {
-            m.display_name: {
-                "id": m.id,
-                "roles": [r.id for r in m.roles],
-                "joined_at": m.joined_at
-            }
-            for m in guild.members
-        }
-        self.discord_cache.update({"timestamp": now, "members": dc_members})
+        # Members are indexed by the two normalised name forms the matcher compares against
+        members, swat_names, plain_names = [], {}, {}
+        for m in guild.members:
+            record = CachedMember(m.id, m.joined_at, m._roles)
+            members.append(record)
+            display = m.display_name
+            swat_names.setdefault(SWAT_SUFFIX_RE.sub('', display).lower(), record)
+            plain_names.setdefault(MEMBER_SUFFIX_RE.sub('', display).lower(), record)
+        self.discord_cache.update({
+            "timestamp":   now,
+            "members":     members,
+            "swat_names":  swat_names,
+            "plain_names": plain_names,
+        })
 
     def time_convert(self, time_string):
         m = re.match(r'^(.+) (\d{2}):(\d{2})$', time_string)
@@ -275,12 +414,6 @@ class PlayerListCog(commands.Cog):
         rs = f"{r} minute{'s'*(r!=1)}" if r else ""
         return f"*Next restart in ~{hs+' and '+rs if hs and rs else hs or rs}*"
 
-    def get_rank_from_roles(self, roles):
-        for r_id, rank in ROLE_TO_RANK.items():
-            if r_id in roles:
-                return rank
-        return None
-
     async def create_embed(self, region, matching_players, queue_data, server_info):
         offline = False
         embed_color = 0x28ef05
@@ -300,7 +433,7 @@ class PlayerListCog(commands.Cog):
                 last_heartbeat = datetime.fromisoformat(
                     queue_data[region]["LastHeartbeatDateTime"].replace("Z", "+00:00")
                 )
-                if datetime.now(pytz.UTC) - last_heartbeat > timedelta(minutes=1):
+                if datetime.now(timezone.utc) - last_heartbeat > timedelta(minutes=1):
                     offline = True
                     embed_color = 0xf40006
             except Exception as e:
@@ -394,6 +527,7 @@ class PlayerListCog(commands.Cog):
                         """,
                         (uid, username, observed_time, increment)
                     )
+                    self.name_index.add(username)
                 else:
                     if row["current_name"].lower() != username.lower():
                         await cur.execute(
@@ -410,6 +544,7 @@ class PlayerListCog(commands.Cog):
                             """,
                             (username, observed_time, uid)
                         )
+                        self.name_index.add(username)
                     else:
                         await cur.execute(
                             """
@@ -437,6 +572,7 @@ class PlayerListCog(commands.Cog):
             log(f"Error logging player data for uid {uid}: {e}", level="error")
 
     @tasks.loop(seconds=CHECK_INTERVAL)
+    @track_loop("playerlist.update_game_status")
     async def update_game_status(self):
         """
         One‐by‐one updating: refresh discord cache, get queue *once*, then
@@ -465,6 +601,8 @@ class PlayerListCog(commands.Cog):
         )
         self.last_update_time = now_utc
         observed_time = now_utc.isoformat()
+        current_hour = hour_bucket(time.time())
+        swat_sightings = []
 
         # 5) Process each region serially
         for region in API_URLS.keys():
@@ -482,7 +620,7 @@ class PlayerListCog(commands.Cog):
                         resp.raise_for_status()
                         raw = await resp.read()                # bytes
                         fivem_dat['players'] = json.loads(raw.decode("utf-8", errors="replace"))
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(self.request_spacing)
             except Exception as e:
                 log(f"Could not fetch full players.json for {region}: {e}", level="warning")
 
@@ -494,80 +632,18 @@ class PlayerListCog(commands.Cog):
                     if uid in seen:
                         continue
                     seen.add(uid)
+                    username = pl["Username"]["Username"]
                     await self.log_player_data(
                         uid,
-                        pl["Username"]["Username"],
+                        username,
                         observed_time,
                         increment
                     )
+                    if username.startswith("[SWAT]") and self.swat_tracker.observe(uid, current_hour):
+                        swat_sightings.append((uid, current_hour))
 
             # c) Build matching_players list by cross‐referencing Discord cache
-            matching_players = [] if players is not None else None
-            if isinstance(players, list):
-                for pl in players:
-                    username = pl["Username"]["Username"]
-                    # avoid duplicates
-                    if any(mp["username"] == username for mp in matching_players):
-                        continue
-
-                    # SWAT/Mentor block
-                    if username.startswith("[SWAT] "):
-                        cleaned = re.sub(r'^\[SWAT\]\s*', '', username, flags=re.IGNORECASE)
-                        found = False
-                        for dn, details in self.discord_cache["members"].items():
-                            # strip any trailing [SWAT]
-                            compare_dn = re.sub(r'\s*\[SWAT\]$', '', dn, flags=re.IGNORECASE)
-                            if cleaned.lower() == compare_dn.lower():
-                                found = True
-                                is_leader = LEADERSHIP_ID in details["roles"]
-                                display = f"{LEADERSHIP_EMOJI} {username}" if is_leader else username
-                                mtype = "mentor" if MENTOR_ROLE_ID in details["roles"] else "SWAT"
-                                matching_players.append({
-                                    "username":   display,
-                                    "type":       mtype,
-                                    "discord_id": details["id"],
-                                    "rank":       self.get_rank_from_roles(details["roles"])
-                                })
-                                break
-                        if not found:
-                            matching_players.append({
-                                "username":   username,
-                                "type":       "SWAT",
-                                "discord_id": None,
-                                "rank":       None
-                            })
-
-                    # Cadet/Trainee block
-                    else:
-                        for dn, details in self.discord_cache["members"].items():
-                            tmp = re.sub(r'\s*\[(?:CADET|TRAINEE|SWAT)\]$', '', dn, flags=re.IGNORECASE)
-                            if username.lower() == tmp.lower():
-                                if CADET_ROLE in details["roles"]:
-                                    ptype = "cadet"
-                                elif TRAINEE_ROLE in details["roles"]:
-                                    ptype = "trainee"
-                                elif (SWAT_ROLE_ID in details["roles"]
-                                    and details["joined_at"] > datetime.now(pytz.UTC) - timedelta(days=20)):
-                                    ptype = "SWAT"
-                                else:
-                                    ptype = None
-                                matching_players.append({
-                                    "username":   username,
-                                    "type":       ptype,
-                                    "discord_id": details["id"],
-                                    "rank":       self.get_rank_from_roles(details["roles"])
-                                })
-                                break
-
-            # d) Sort by rank hierarchy (lowest index = highest rank)
-            if matching_players is not None:
-                try:
-                    matching_players.sort(
-                        key=lambda mp: RANK_HIERARCHY.index(mp["rank"])
-                        if mp["rank"] in RANK_HIERARCHY else len(RANK_HIERARCHY)
-                    )
-                except Exception as e:
-                    log(f"Error sorting players for {region}: {e}", level="error")
+            matching_players = self.match_players(players)
 
             # e) Build the embed
             embed = await self.create_embed(region, matching_players, queue_info, fivem_dat)
@@ -576,9 +652,74 @@ class PlayerListCog(commands.Cog):
             await self.update_or_create_embed_for_region(channel, region, embed)
 
             # g) Rate‐limit: wait 2 seconds before the next region
-            await asyncio.sleep(2)
+            await asyncio.sleep(self.region_spacing)
+
+        # 6) Persist rolling unique-count buckets (one write per uid per hour)
+        await self.record_swat_sightings(swat_sightings)
 
 
+    def match_players(self, players):
+        """
+        Cross-references a region's player list with the Discord member cache.
+        Returns the matched players sorted by rank, or None if the list is unavailable.
+        """
+        matching_players = [] if players is not None else None
+        if isinstance(players, list):
+            swat_names  = self.discord_cache["swat_names"]
+            plain_names = self.discord_cache["plain_names"]
+            recent_cutoff = datetime.now(timezone.utc) - timedelta(days=20)
+            seen = set()
+            for pl in players:
+                username = pl["Username"]["Username"]
+                # avoid duplicates
+                if username in seen:
+                    continue
+                seen.add(username)
+
+                # SWAT/Mentor block
+                if username.startswith("[SWAT] "):
+                    cleaned = SWAT_PREFIX_RE.sub('', username)
+                    member = swat_names.get(cleaned.lower())
+                    if member:
+                        display = f"{LEADERSHIP_EMOJI} {username}" if member.mask & LEADERSHIP_BIT else username
+                        matching_players.append({
+                            "username":   display,
+                            "type":       "mentor" if member.mask & MENTOR_BIT else "SWAT",
+                            "discord_id": member.id,
+                            "rank":       member.rank
+                        })
+                    else:
+                        matching_players.append({
+                            "username":   username,
+                            "type":       "SWAT",
+                            "discord_id": None,
+                            "rank":       None
+                        })
+
+                # Cadet/Trainee block
+                else:
+                    member = plain_names.get(username.lower())
+                    if member:
+                        if member.mask & CADET_BIT:
+                            ptype = "cadet"
+                        elif member.mask & TRAINEE_BIT:
+                            ptype = "trainee"
+                        elif member.mask & SWAT_BIT and member.joined_at and member.joined_at > recent_cutoff:
+                            ptype = "SWAT"
+                        else:
+                            ptype = None
+                        matching_players.append({
+                            "username":   username,
+                            "type":       ptype,
+                            "discord_id": member.id,
+                            "rank":       member.rank
+                        })
+
+        # Sort by precomputed rank order (lowest = highest rank)
+        if matching_players is not None:
+            matching_players.sort(key=lambda mp: RANK_ORDER.get(mp["rank"], UNRANKED_ORDER))
+        return matching_players
+
     async def update_or_create_embed_for_region(self, channel, region, embed):
         """
         Edit the existing embed for a region, or send a new one if missing.
@@ -651,62 +792,33 @@ class PlayerListCog(commands.Cog):
 
 
     @tasks.loop(hours=1)
+    @track_loop("playerlist.send_unique_count")
     async def send_unique_count(self):
         await self.bot.wait_until_ready()
-        cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
-        # Async DB query
-        async with self.db_conn.cursor() as cur:
-            await cur.execute("""
-                SELECT COUNT(DISTINCT l.uid) AS cnt
-                  FROM playtime_log l
-                  JOIN players_info p ON p.uid = l.uid
-                 WHERE datetime(l.log_time) >= datetime(?)
-                   AND p.current_name LIKE '[SWAT]%'
-            """, (cutoff,))
-            row = await cur.fetchone()
-        count = row["cnt"] if row else 0
+        # 1) Count comes straight from the in-memory rolling buckets
+        current_hour = hour_bucket(time.time())
+        count = self.swat_tracker.count(current_hour)
 
-        # 3) read your website API token
+        # 2) Drop persisted sightings that fell out of the window (indexed delete)
         try:
-            with open(SWAT_WEBSITE_TOKEN_FILE, "r") as f:
-                api_token = f.read().strip()
+            await self.db_conn.execute(
+                "DELETE FROM swat_seen WHERE hour < ?",
+                (self.swat_tracker.cutoff(current_hour),)
+            )
+            await self.db_conn.commit()
         except Exception as e:
-            log(f"Could not read SWAT_WEBSITE_TOKEN_FILE: {e}", level="error")
-            return
+            log(f"Error pruning swat_seen: {e}", level="error")
 
-        # 4) fire off the POST
+        # 3) queue the POST on the shared website client (never blocks the loop)
         if SEND_API_DATA:
-            url = f"{SWAT_WEBSITE_URL}/api/players/count"
-            headers = {"X-Api-Token": api_token, "Content-Type": "application/json",
-                        "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) " 
-                        "Chrome/114.0.0.0 Safari/537.36"),
-                        "Accept": "application/json, text/javascript, */*; q=0.01",
-                        "Accept-Language": "en-US,en;q=0.9"}
             payload = {"playerCount": str(count)}
-            log(f"Sending unique SWAT count={count} to {url}", level="info")
+            log(f"Sending unique SWAT count={count} to the website API", level="info")
+            future = self.bot.website.submit("/api/players/count", payload)
 
-            try:
-                resp = requests.post(url, json=payload, headers=headers, timeout=10)
-                resp.raise_for_status()
-            except requests.exceptions.HTTPError as e:
-                body = getattr(e.response, "text", "")
-                log(f"Players count API HTTP {e.response.status_code}", level="error")
-            except requests.exceptions.RequestException as e:
-                log(f"Error sending players count: {e}", level="error")
-            else:
-                # parse JSON to confirm success
-                try:
-                    data = resp.json()
-                except ValueError:
-                    log(f"Invalid JSON from players count API: {resp.text}", level="error")
-                else:
-                    if data.get("success"):
-                        log(f"Successfully sent unique SWAT count={count}", level="info")
-                    else:
-                        err = data.get("error", "unknown")
-                        log(f"Players count API error response: {err}", level="error")
+            def _report(f):
+                if not f.cancelled() and f.result()["ok"]:
+                    log(f"Successfully sent unique SWAT count={count}", level="info")
+            future.add_done_callback(_report)
 
 
     @commands.has_role(LEADERSHIP_ID)
@@ -819,10 +931,10 @@ class PlayerListCog(commands.Cog):
 
         # Now exactly as before, but using lookup_name for DB queries
         try:
-            # 1) Lookup player_info
+            # 1) Lookup player_info (NOCASE indexes on all name columns)
             async with self.db_conn.cursor() as cur:
                 await cur.execute(
-                    "SELECT * FROM players_info WHERE lower(current_name)=lower(?)",
+                    "SELECT * FROM players_info WHERE current_name = ? COLLATE NOCASE",
                     (lookup_name,)
                 )
                 player_info = await cur.fetchone()
@@ -830,7 +942,7 @@ class PlayerListCog(commands.Cog):
                     await cur.execute(
                         """
                         SELECT uid FROM name_changes
-                         WHERE lower(old_name)=lower(?) OR lower(new_name)=lower(?)
+                         WHERE old_name = ? COLLATE NOCASE OR new_name = ? COLLATE NOCASE
                          LIMIT 1
                         """,
                         (lookup_name, lookup_name)
@@ -844,6 +956,14 @@ class PlayerListCog(commands.Cog):
                         player_info = await cur.fetchone()
 
             if not player_info:
+                # Exact lookup missed → offer ranked fuzzy candidates
+                candidates = self.name_index.fuzzy(lookup_name)
+                if candidates:
+                    suggestions = "\n".join(f"- `{cand}` ({score:.0%})" for cand, score in candidates)
+                    return await ctx.send(
+                        f"Player `{lookup_name}` not found in the logs. Did you mean:\n{suggestions}",
+                        ephemeral=True
+                    )
                 return await ctx.send(
                     f"Player `{lookup_name}` not found in the logs.",
                     ephemeral=True
@@ -917,12 +1037,20 @@ class PlayerListCog(commands.Cog):
             await ctx.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            log("error", f"Error in /player command: {e}")
+            log(f"Error in /player command: {e}", level="error")
             await ctx.send(
                 "❌ An error occurred while fetching the player data.",
                 ephemeral=True
             )
 
+    @player.autocomplete("name")
+    async def player_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggests known player names from the in-memory prefix index."""
+        return [
+            app_commands.Choice(name=candidate[:100], value=candidate[:100])
+            for candidate in self.name_index.prefix(current, limit=25)
+        ]
+
     @player.error
     async def player_error(self, ctx: commands.Context, error):
         if isinstance(error, commands.MissingRole):
@@ -8,7 +8,6 @@ import aiosqlite
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
-import requests
 import threading
 
 # Adjust the sys.path so that config_testing.py (in the root) is found.
@@ -21,6 +20,12 @@ from config import *
 from messages import *
 from cogs.helpers import *
 from cogs.db_utils import *
+from cogs.role_reconciler import RoleReconciler
+from cogs.guild_resources import member_has_any, require_tier
+from cogs.pagination import PageSource, register_page_source, send_paginated
+from cogs.analytics import METRICS, fmt_duration
+from cogs.charts import render_weekly_trends, format_weekly_trends
+from cogs.metrics import track_loop
 
 def handle_interaction_errors(func: Callable[..., Any]) -> Callable[..., Any]:
     @wraps(func)
@@ -197,13 +202,14 @@ class ApplicationControlView(discord.ui.View):
         activity_channel = interaction.client.resources.activity_ch
         if activity_channel:
             log_embed = create_user_activity_log_embed("recruitment", "Application Withdrawn", interaction.user, f"User has withdrawn an application. (Thread ID: <#{interaction.channel.id}>)")
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
         try:
             await interaction.channel.edit(locked=True, archived=True)
         except discord.Forbidden:
             await interaction.response.send_message("❌ Bot lacks permission to lock/archive this thread!", ephemeral=True)
 
     @discord.ui.button(label="Accept", style=discord.ButtonStyle.success, custom_id="app_accept")
+    @require_tier("recruiter", "❌ You do not have permission to accept applications.")
     async def accept_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Must be in the thread
         if not isinstance(interaction.channel, discord.Thread):
@@ -225,13 +231,6 @@ class ApplicationControlView(discord.ui.View):
                 ephemeral=True
             )
 
-        # Now check recruiter permission
-        recruiter_role = interaction.client.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to accept applications.", ephemeral=True
-            )
-
         # All good—ask for final confirmation
         cog = interaction.client.get_cog("RecruitmentCog")
         await interaction.response.send_message(
@@ -241,14 +240,12 @@ class ApplicationControlView(discord.ui.View):
         )
 
     @discord.ui.button(label="Claim", style=ButtonStyle.primary, custom_id="app_claim")
+    @require_tier("recruiter", "❌ Only recruiters can claim.")
     async def claim_button(self, interaction: Interaction, button: discord.ui.Button):
         app_data = await get_application(str(interaction.channel.id))
         if not app_data:
             return await interaction.response.send_message("❌ No application data found!", ephemeral=True)
 
-        if not interaction.client.resources.recruiter_role in interaction.user.roles:
-            return await interaction.response.send_message("❌ Only recruiters can claim.", ephemeral=True)
-
         current = app_data.get("recruiter_id")
         if current:
             # Already claimed: ask for confirmation to override
@@ -345,18 +342,18 @@ class CloseThreadView(discord.ui.View):
             await interaction.response.send_message("❌ No ticket data found for this thread.", ephemeral=True)
             return
 
-        # Determine which role can close this thread
+        # Determine which tier can close this thread
         ticket_type = ticket_data[3]
         if ticket_type == "recruiters":
-            closing_role = interaction.client.resources.recruiter_role
+            closing_tier = "recruiter"
         elif ticket_type == "botdeveloper":
-            closing_role = interaction.client.resources.lead_dev_role
+            closing_tier = "lead_dev"
         elif ticket_type == "loa":
-            closing_role = interaction.client.resources.leadership_role
+            closing_tier = "leadership"
         else:
-            closing_role = interaction.client.resources.leadership_role
+            closing_tier = "leadership"
             
-        if closing_role not in interaction.user.roles and interaction.user.id != int(ticket_data[1]):
+        if not interaction.client.resources.has_tier(interaction.user, closing_tier) and interaction.user.id != int(ticket_data[1]):
             await interaction.response.send_message("❌ You do not have permission to close this ticket.", ephemeral=True)
             return
         try:
@@ -420,13 +417,13 @@ class ApplicationView(discord.ui.View):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
-        if any(r.id == SWAT_ROLE_ID for r in interaction.user.roles):
+        if member_has_any(interaction.user, (SWAT_ROLE_ID,)):
             await interaction.response.send_message("❌ You are already SWAT!", ephemeral=True)
             return
-        if any(r.id in [TRAINEE_ROLE, CADET_ROLE] for r in interaction.user.roles):
+        if member_has_any(interaction.user, (TRAINEE_ROLE, CADET_ROLE)):
             await interaction.response.send_message("❌ You already have a trainee/cadet role!", ephemeral=True)
             return
-        if any(r.id == BLACKLISTED_ROLE_ID for r in interaction.user.roles):
+        if member_has_any(interaction.user, (BLACKLISTED_ROLE_ID,)):
             await interaction.response.send_message("❌ You are blacklisted from applying for SWAT! To appeal this, open a ticket with the recruiters!", ephemeral=True)
             return
         
@@ -466,6 +463,7 @@ class RequestActionView(discord.ui.View):
                     child.custom_id = child.custom_id.replace("{uid}", self.user_id)
 
     @discord.ui.button(label="Accept", style=discord.ButtonStyle.success, custom_id="request_accept:{uid}")
+    @require_tier("leadership")
     async def accept_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True, thinking=True)
         # Attempt to extract the original user id from the custom_id; if not found, fallback to self.user_id.
@@ -475,7 +473,6 @@ class RequestActionView(discord.ui.View):
         except Exception:
             original_user_id = self.user_id
 
-        leadership_role = interaction.client.resources.leadership_role
         if not is_in_correct_guild(interaction):
             await interaction.followup.send(
                 "❌ This command can only be used in the specified guild.",
@@ -483,13 +480,6 @@ class RequestActionView(discord.ui.View):
             )
             return
 
-        if not leadership_role or leadership_role not in interaction.user.roles:
-            await interaction.followup.send(
-                "❌ You do not have permission to use this command.",
-                ephemeral=True
-            )
-            return
-
         # Fetch the request data from the database using the original user id.
         request_data = await get_role_request( str(original_user_id))
         if not request_data:
@@ -581,6 +571,7 @@ class RequestActionView(discord.ui.View):
             await interaction.followup.send(f"❌ Error accepting request: {e}", ephemeral=True)
 
     @discord.ui.button(label="Ignore", style=discord.ButtonStyle.danger, custom_id="request_ignore:{uid}")
+    @require_tier("leadership", "❌ You do not have permission to ignore this request.")
     async def ignore_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             parts = button.custom_id.split(":")
@@ -598,11 +589,6 @@ class RequestActionView(discord.ui.View):
                 await interaction.response.send_message("❌ No pending request found.", ephemeral=True)
                 return
 
-            leadership_role = interaction.client.resources.leadership_role
-            if not leadership_role or (leadership_role not in interaction.user.roles):
-                await interaction.response.send_message("❌ You do not have permission to ignore this request.", ephemeral=True)
-                return
-
             updated_embed = interaction.message.embeds[0]
             updated_embed.color = discord.Color.red()
             updated_embed.title += " (Ignored)"
@@ -614,6 +600,7 @@ class RequestActionView(discord.ui.View):
             await interaction.response.send_message(f"❌ Error ignoring request: {e}", ephemeral=True)
 
     @discord.ui.button(label="Deny w/Reason", style=discord.ButtonStyle.danger, custom_id="request_deny_reason:{uid}")
+    @require_tier("leadership", "❌ You do not have permission to deny this request.")
     async def deny_with_reason(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             parts = button.custom_id.split(":")
@@ -625,17 +612,12 @@ class RequestActionView(discord.ui.View):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
 
-        recruiter_role = interaction.client.resources.recruiter_role
-        leadership_role = interaction.client.resources.leadership_role
         request_data = await get_role_request( str(original_user_id))
         if not request_data:
             await interaction.response.send_message("❌ No pending request found.", ephemeral=True)
             return
 
         req_type = request_data.get("request_type", "")
-        if not leadership_role or (leadership_role not in interaction.user.roles):
-            await interaction.response.send_message("❌ You do not have permission to deny this request.", ephemeral=True)
-            return
 
         modal = DenyReasonModal(
             user_id=original_user_id,
@@ -741,6 +723,11 @@ class RegionSelection(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction):
         selected_region = self.values[0]
         if await get_region_status( selected_region) == "CLOSED":
+            # answer first: the activity log may wait on the channel's send throttle
+            await interaction.response.send_message(
+                f"❌ Applications for {selected_region} are currently closed.",
+                ephemeral=True
+            )
             guild = interaction.client.get_guild(GUILD_ID)
             if guild:
                 activity_channel = interaction.client.resources.activity_ch
@@ -751,13 +738,11 @@ class RegionSelection(discord.ui.Select):
                         interaction.user,
                         f"User attempted to apply for {selected_region} which is closed."
                     )
-                    attempt_msg = await activity_channel.send(embed=embed)
+                    # sent on its own (not merged) so the jump_url points at this entry; the
+                    # user already has their answer, so waiting on the queue here is fine
+                    attempt_msg = await interaction.client.outbound.send(activity_channel, embed=embed, merge=False)
                     # Save the log URL (jump_url) for future reference.
-                    await add_application_attempt( interaction.user.id, selected_region, "closed_region_attempt", attempt_msg.jump_url)
-            await interaction.response.send_message(
-                f"❌ Applications for {selected_region} are currently closed.",
-                ephemeral=True
-            )
+                    await add_application_attempt(interaction.user.id, selected_region, "closed_region_attempt", attempt_msg.jump_url if attempt_msg else "")
             return
         
         # If region is open, proceed to show the modal for further details.
@@ -826,7 +811,7 @@ class TraineeDetailsModal(discord.ui.Modal, title="Trainee Application Details")
             if activity_channel:
                 embed = create_user_activity_log_embed("recruitment", "Blacklist User", interaction.user,
                                                     f"User {member.display_name} ( <@{member.id}> ) has been blacklisted, due to being underage.")
-                await activity_channel.send(embed=embed)
+                interaction.client.outbound.send(activity_channel, embed=embed)
             
             await interaction.response.send_message(
                 f"❌ You have been blacklisted because you are underage (under 16). If you wish to appeal, please open a <#{TICKET_CHANNEL_ID}> with the recruiters.",
@@ -961,7 +946,7 @@ async def finalize_trainee_request(interaction: discord.Interaction, user_id_str
                 interaction.user,
                 f"User has opened an application for {region}."
             )
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
 
         # Create a private thread for the application.
         apply_channel = guild.get_channel(APPLY_CHANNEL_ID)
@@ -1108,6 +1093,60 @@ async def finalize_trainee_request(interaction: discord.Interaction, user_id_str
 
 
 
+# -------------------------------
+# Paginated lists
+# -------------------------------
+def _format_request_row(interaction: discord.Interaction, request_data: dict) -> str:
+    req_type = request_data["request_type"]
+    details = request_data["details"] or "N/A"
+    if len(details) > 150:  # keep a full page inside the embed description limit
+        details = details[:147] + "..."
+    if req_type == "name_change":
+        detail = f"New Name: {details}"
+    elif req_type == "other":
+        detail = f"Request: {details}"
+    else:
+        detail = details
+    return f"• **User ID**: {request_data['user_id']} | **Type**: `{req_type}` | {detail} | **Time**: {request_data['timestamp']}"
+
+def _format_application_row(interaction: discord.Interaction, app: dict) -> str:
+    if not app["recruiter_id"]:
+        if app["ban_history_sent"] == 0:
+            status = "Unclaimed, No Ban History"
+        else:
+            status = "Unclaimed, Ban History Sent"
+    else:
+        status = "Claimed"
+    return f"**{app['ingame_name']}** (Thread: `{app['thread_id']}`) | Region: {app['region']} | Status: {status}"
+
+def _format_restriction_row(interaction: discord.Interaction, rec: dict) -> str:
+    user_id = int(rec["user_id"])
+    member = interaction.guild.get_member(user_id) if interaction.guild else None
+    name   = member.display_name if member else str(user_id)
+    if rec["type"] == "timeout":
+        exp = rec["expires_at"]
+        ts = f"<t:{int(exp.timestamp())}:f>" if exp else "N/A"
+        icon, detail = "⏰", f"Timeout until {ts}"
+    else:
+        icon, detail = "🚫", "Blacklisted"
+    return f"{icon} `{user_id}` — {name}: {detail}"
+
+register_page_source(PageSource(
+    "requests", "Current Pending Requests", get_role_requests_page,
+    lambda r: (r["timestamp"], r["user_id"]), _format_request_row,
+    "There are **no** pending requests at the moment."
+))
+register_page_source(PageSource(
+    "applications", "📋 Open Applications", get_open_applications_page,
+    lambda a: (a["sort_rank"], a["starttime_raw"], a["thread_id"]), _format_application_row,
+    "There are no open applications at the moment."
+))
+register_page_source(PageSource(
+    "restrictions", "🚨 Active Blacklists & Timeouts", get_timeouts_page,
+    lambda r: (r["user_id"],), _format_restriction_row,
+    "✅ There are no active blacklists or timeouts.", colour=discord.Color.dark_red()
+))
+
 # -------------------------------
 # Recruitment Cog
 # -------------------------------
@@ -1117,8 +1156,7 @@ class RecruitmentCog(commands.Cog):
         self.resources = bot.resources
         self.ready = False
         self.ban_history_submitted = set() 
-        self.embed_message_id = None
-        self.application_embed_message_id = None
+        self.reconciler = RoleReconciler(bot)
         self.bot.loop.create_task(self._wait_and_start())
 
 
@@ -1130,169 +1168,137 @@ class RecruitmentCog(commands.Cog):
         self.bot.add_view(CloseThreadView())
         self.bot.add_view(ApplicationControlView())
 
-        # Load embed message ID from file
-        stored = await get_stored_embed("main_embed")
-        self.embed_message_id = int(stored["message_id"]) if stored else None
-        
-        # Load embed message ID from file
-        stored = await get_stored_embed("application_embed")
-        self.application_embed_message_id = int(stored["message_id"]) if stored else None
-        
+        # Role request and application embeds are kept posted by bot.embeds
+        self.bot.embeds.register("main_embed", self._render_role_request_embed)
+        self.bot.embeds.register("application_embed", self._render_application_embed)
+
         # Start tasks
         self.check_embed_task.start()
         self.check_application_embed_task.start()
-        self.check_expired_endtimes_task.start()
-        self.check_ban_history_and_application_reminders.start()
-        self.check_open_requests_reminder.start()
-        self.check_timeouts_task.start()
+
+        # Due-time reminders run from the shared scheduler
+        self.bot.scheduler.register_handler(JOB_ENTRY_ENDTIME, self.send_endtime_reminders)
+        self.bot.scheduler.register_handler(JOB_APP_REMINDER, self.send_application_reminders)
+        self.bot.scheduler.register_handler(JOB_ROLE_REMINDER, self.send_open_request_reminders)
+        self.bot.scheduler.register_handler(JOB_TIMEOUT_EXPIRY, self.reconciler.expire_timeouts)
+
+        # Bring timeout/blacklist/trainee/cadet roles in line with the records once
+        await self.reconciler.full_sync()
         await self.load_existing_tickets()
         log("RecruitmentCog setup complete. All tasks started.")
 
     def cog_unload(self):
         self.check_embed_task.cancel()
         self.check_application_embed_task.cancel()
-        self.check_expired_endtimes_task.cancel()
-        self.check_timeouts_task.cancel()
-        self.check_ban_history_and_application_reminders.cancel()
-        self.check_open_requests_reminder.cancel()
+        self.bot.embeds.unregister("main_embed")
+        self.bot.embeds.unregister("application_embed")
+        for kind in (JOB_ENTRY_ENDTIME, JOB_APP_REMINDER, JOB_ROLE_REMINDER, JOB_TIMEOUT_EXPIRY):
+            self.bot.scheduler.unregister_handler(kind)
+        self.reconciler.close()
 
+    async def _render_role_request_embed(self):
+        return self.resources.request_ch, create_embed(), RoleRequestView()
+
+    async def _render_application_embed(self):
+        return self.resources.apply_ch, await create_application_embed(), ApplicationView()
+
+    # Safety net only: a deleted embed is re-sent from on_raw_message_delete and an
+    # unchanged one costs no REST call.
     @tasks.loop(minutes=5)
+    @track_loop("recruitment.check_embed_task")
     async def check_embed_task(self):
         try:
-            channel = self.resources.request_ch
-            if channel:
-                if self.embed_message_id:
-                    msg = PartialMessage(channel=channel, id=self.embed_message_id)
-                    try:
-                        # if it still exists, we assume it’s fine—no fetch
-                        await msg.edit(embed=create_embed(), view=RoleRequestView())
-                    except discord.NotFound:
-                        # it vanished—create a brand new one
-                        sent = await channel.send(embed=create_embed(), view=RoleRequestView())
-                        self.embed_message_id = sent.id
-                        await set_stored_embed("main_embed", sent.id, channel.id)
-                else:
-                    embed = create_embed()
-                    view = RoleRequestView()
-                    msg = await channel.send(embed=embed, view=view)
-                    self.embed_message_id = msg.id
-                    await set_stored_embed("main_embed", str(msg.id), str(channel.id))
-                    log(f"Created new embed with ID: {self.embed_message_id}")
+            await self.bot.embeds.refresh("main_embed")
         except (discord.DiscordException, Exception) as e:
             log(f"Error in check_embed_task: {e}", level="error")
 
-    
     @tasks.loop(minutes=5)
+    @track_loop("recruitment.check_application_embed_task")
     async def check_application_embed_task(self):
-        channel = self.resources.apply_ch
-        if not channel:
-            return
-
-        if self.application_embed_message_id:
-            msg = PartialMessage(channel=channel, id=self.application_embed_message_id)
-            try:
-                await msg.edit(embed=await create_application_embed(),
-                               view=ApplicationView())
-            except discord.NotFound:
-                # it vanished—send and store a new one
-                sent = await channel.send(embed=await create_application_embed(),
-                                          view=ApplicationView())
-                self.application_embed_message_id = sent.id
-                await set_stored_embed("application_embed", sent.id, channel.id)
-        else:
-            sent = await channel.send(embed=await create_application_embed(),
-                                      view=ApplicationView())
-            self.application_embed_message_id = sent.id
-            await set_stored_embed("application_embed", sent.id, channel.id)
+        await self.bot.embeds.refresh("application_embed")
 
-    @tasks.loop(minutes=1)
-    async def check_expired_endtimes_task(self):
-        await self.bot.wait_until_ready()
+    async def send_endtime_reminders(self, thread_ids: list):
+        """Scheduler handler: entries whose endtime has passed."""
         now = datetime.now()
+        placeholders = ",".join("?" * len(thread_ids))
 
         async with aiosqlite.connect(DATABASE_FILE) as db:
-            # fetch all un‑sent reminders
-            async with db.execute("""
+            # fetch the un‑sent reminders among the due threads
+            async with db.execute(f"""
                 SELECT thread_id, recruiter_id, starttime, endtime, role_type, region, ingame_name
                 FROM entries
-                WHERE reminder_sent = 0
-            """) as cursor:
+                WHERE reminder_sent = 0 AND endtime IS NOT NULL AND thread_id IN ({placeholders})
+            """, thread_ids) as cursor:
                 rows = await cursor.fetchall()
 
+            reminded = []
             for thread_id, recruiter_id, start_iso, end_iso, role_type, region, ign in rows:
-                if not end_iso:
+                end_dt = datetime.fromisoformat(end_iso)
+                if end_dt > now:
                     continue
 
-                end_dt = datetime.fromisoformat(end_iso)
-                if end_dt <= now:
-                    # Calculate days open if needed
-                    start_dt = datetime.fromisoformat(start_iso)
-                    days_open = (now - start_dt).days
+                # Calculate days open if needed
+                start_dt = datetime.fromisoformat(start_iso)
+                days_open = (now - start_dt).days
 
-                    # Build and send your embed
-                    embed = discord.Embed(
-                        description=f"**Reminder:** This thread has been open for **{days_open} days**.",
-                        color=0x008040
-                    )
-                    thread = self.bot.get_channel(int(thread_id))
-                    if thread and isinstance(thread, discord.Thread):
-                        if role_type == "trainee":
-                            await thread.send(f"<@{recruiter_id}>", embed=embed)
-                        else:  # cadet
-                            voting_embed = await create_voting_embed(start_dt, now, int(recruiter_id), region, ign)
-                            msg = await thread.send(f"<@&{SWAT_ROLE_ID}> Time for another cadet vote!⌛", embed=voting_embed)
-                            await asyncio.gather(*(msg.add_reaction(e) for e in (PLUS_ONE_EMOJI, "❔", MINUS_ONE_EMOJI)))
-
-                    # Mark reminder sent
-                    await db.execute(
-                        "UPDATE entries SET reminder_sent = 1 WHERE thread_id = ?",
-                        (thread_id,)
-                    )
-            await db.commit()
+                # Build and send your embed
+                embed = discord.Embed(
+                    description=f"**Reminder:** This thread has been open for **{days_open} days**.",
+                    color=0x008040
+                )
+                thread = self.bot.get_channel(int(thread_id))
+                if thread and isinstance(thread, discord.Thread):
+                    if role_type == "trainee":
+                        await thread.send(f"<@{recruiter_id}>", embed=embed)
+                    else:  # cadet
+                        voting_embed = await create_voting_embed(start_dt, now, int(recruiter_id), region, ign)
+                        msg = await thread.send(f"<@&{SWAT_ROLE_ID}> Time for another cadet vote!⌛", embed=voting_embed)
+                        await asyncio.gather(*(msg.add_reaction(e) for e in (PLUS_ONE_EMOJI, "❔", MINUS_ONE_EMOJI)))
+                reminded.append((thread_id,))
+
+            # Mark all reminders sent in one statement
+            if reminded:
+                await db.executemany("UPDATE entries SET reminder_sent = 1 WHERE thread_id = ?", reminded)
+                await db.commit()
 
     async def load_existing_tickets(self):
         # For recruitment, if you need to load active requests, do so here.
         pass
 
 
-    @tasks.loop(minutes=1)
-    async def check_ban_history_and_application_reminders(self):
-        await self.bot.wait_until_ready()
+    async def send_application_reminders(self, thread_ids: list):
+        """
+        Scheduler handler: open applications whose next reminder is due.
+        Each sent reminder schedules the following one 24h later.
+        """
         now = datetime.utcnow()
         now_iso = now.isoformat()
+        next_due = utc_epoch(now) + APP_REMINDER_INTERVAL.total_seconds()
+        placeholders = ",".join("?" * len(thread_ids))
 
         async with aiosqlite.connect(DATABASE_FILE) as db:
-            async with db.execute("""
-                SELECT thread_id, applicant_id, recruiter_id, starttime,
+            # 1) due, open and not silenced applications
+            async with db.execute(f"""
+                SELECT thread_id, applicant_id, recruiter_id,
                     ban_history_sent, ban_history_reminder_count
                 FROM application_threads
-                WHERE is_closed = 0
-                AND (
-                    (
-                    last_reminder_sent IS NULL
-                    AND datetime(starttime) <= datetime('now', '-3 hours')
-                    )
-                    OR (
-                    last_reminder_sent IS NOT NULL
-                    AND datetime(last_reminder_sent) <= datetime('now', '-24 hours')
-                    )
-                )
-            """) as cursor:
+                WHERE is_closed = 0 AND COALESCE(silenced, 0) = 0
+                AND thread_id IN ({placeholders})
+            """, thread_ids) as cursor:
                 rows = await cursor.fetchall()
 
-            for thread_id, applicant_id, recruiter_id, start_iso, ban_history_sent, reminder_count in rows:
+            sent = []          # (ban_history_reminder_count, last_reminder_sent, thread_id)
+            rescheduled = []   # (thread_id, next due time)
+            for thread_id, applicant_id, recruiter_id, ban_history_sent, reminder_count in rows:
                 reminder_count = reminder_count or 0
+                rescheduled.append((thread_id, next_due))
 
-                # 2) respect silence
-                if await is_application_silenced(thread_id):
-                    continue
-
-                # 3) ensure thread exists
+                # 2) ensure thread exists
                 thread = self.bot.get_channel(int(thread_id))
                 if not isinstance(thread, discord.Thread):
                     continue
 
-                # 4) pick embed & who to mention
+                # 3) pick embed & who to mention
                 if ban_history_sent:
                     # recruiter reminder
                     embed = discord.Embed(
@@ -1316,93 +1322,46 @@ class RecruitmentCog(commands.Cog):
                         )
 
                     embed = discord.Embed(title=title, colour=0xEFE410)
-
                     # increment our counter
-                    await db.execute(
-                        "UPDATE application_threads SET ban_history_reminder_count = ? WHERE thread_id = ?",
-                        (reminder_count + 1, thread_id)
-                    )
+                    reminder_count += 1
 
-                # 5) send the ping + embed
+                # 4) send the ping + embed
                 try:
                     await thread.send(content=mention, embed=embed)
                 except Exception as e:
                     log(f"Error sending reminder in thread {thread_id}: {e}", level="error")
 
-                # 6) record when we sent it
-                await db.execute(
-                    "UPDATE application_threads SET last_reminder_sent = ? WHERE thread_id = ?",
-                    (now_iso, thread_id)
+                # 5) record when we sent it
+                sent.append((reminder_count, now_iso, thread_id))
+
+            # 6) counters, timestamps and the next reminders in one transaction
+            if sent:
+                await db.executemany(
+                    """
+                    UPDATE application_threads
+                    SET ban_history_reminder_count = ?, last_reminder_sent = ?
+                    WHERE thread_id = ?
+                    """,
+                    sent
                 )
+            if rescheduled:
+                await put_jobs(db, JOB_APP_REMINDER, rescheduled)
+                await db.commit()
 
-            await db.commit()
-
-    @tasks.loop(minutes=30)
-    async def check_timeouts_task(self):
-        now = datetime.now()
-        guild = self.bot.get_guild(GUILD_ID)
-        if not guild:
-            return
-        # Cache all guild members in a dictionary (requires the members intent to be enabled)
-        members_dict = {member.id: member for member in guild.members}
-        activity_channel = self.resources.activity_ch
-        
-        for record in await get_all_timeouts( ):
-            user_id = int(record["user_id"])
-            member = members_dict.get(user_id)
-            if not member:
-                continue  # Skip if the member isn't found
-            
-            if record["type"] == "timeout":
-                timeout_role = self.resources.timeout_role
-                if record["expires_at"] and record["expires_at"] <= now:
-                    if timeout_role in member.roles:
-                        try:
-                            await member.remove_roles(timeout_role)
-                            log(f"Removed expired timeout role from user {record['user_id']}")
-                        except Exception as e:
-                            log(f"Error removing expired timeout role from user {record['user_id']}: {e}", level="error")
-                    await remove_timeout_record( record["user_id"])
-                    if activity_channel:
-                        log_embed = create_user_activity_log_embed(
-                            "recruitment", "Timeout Expired", member,
-                            f"Timeout expired on {record['expires_at'].strftime('%Y-%m-%d %H:%M:%S')}"
-                        )
-                        await activity_channel.send(embed=log_embed)
-                else:
-                    if timeout_role not in member.roles:
-                        try:
-                            await member.add_roles(timeout_role)
-                            log(f"Re-added timeout role to user {record['user_id']}")
-                        except Exception as e:
-                            log(f"Error re-adding timeout role to user {record['user_id']}: {e}", level="error")
-            elif record["type"] == "blacklist":
-                blacklist_role = self.resources.blacklist_role
-                if blacklist_role not in member.roles:
-                    try:
-                        await member.add_roles(blacklist_role)
-                        log(f"Re-added blacklist role to user {record['user_id']}")
-                    except Exception as e:
-                        log(f"Error re-adding blacklist role to user {record['user_id']}: {e}", level="error")
-        log("Completed check_timeouts_task cycle.")
+        notify_jobs(JOB_APP_REMINDER, rescheduled)
 
-    @tasks.loop(hours=1)
-    async def check_open_requests_reminder(self):
+    async def send_open_request_reminders(self, user_ids: list):
         """
-        Checks every 30 minutes for role requests that have been open for over 24 hours and
-        have not yet been reminded. Sends an embed to the activity channel and pings leadership and recruiters.
+        Scheduler handler: role requests that have been open for 24 hours and have
+        not yet been reminded. Sends an embed to the activity channel and pings leadership and recruiters.
         """
-        pending_requests = await get_pending_role_requests_no_reminder( )
-        now = datetime.now()
-        for req in pending_requests:
-            try:
-                req_time = datetime.fromisoformat(req["timestamp"])
-            except Exception as e:
-                log(f"Error parsing timestamp for role request from user {req['user_id']}: {e}", level="error")
-                continue
-
-            if now - req_time > timedelta(hours=24):
-                
+        async with aiosqlite.connect(DATABASE_FILE) as db:
+            pending_requests = await get_pending_role_requests_no_reminder(db, user_ids)
+            if not pending_requests:
+                return
+            activity_channel = self.resources.activity_ch
+            embeds = []
+            for req in pending_requests:
                 try:
                     dt = datetime.fromisoformat(req['timestamp'])
                     formatted_time = dt.strftime("%Y-%m-%d %H:%M")
@@ -1427,12 +1386,16 @@ class RecruitmentCog(commands.Cog):
                                 inline=False)
 
                 embed.set_footer(text="🔒 This reminder is visible only to team members.")
-                activity_channel = self.resources.activity_ch
-                if activity_channel:
-                    await activity_channel.send(content=f"<@&{LEADERSHIP_ID}>", embed=embed)
-                    log(f"Sent reminder for open request from user {req['user_id']}")
-                # Mark this request as reminded so it isn’t processed again.
-                await mark_role_request_reminder_sent( req["user_id"])
+                embeds.append(embed)
+                log(f"Queued reminder for open request from user {req['user_id']}")
+
+            # one leadership ping per 10 reminders instead of one per request
+            if activity_channel:
+                for i in range(0, len(embeds), 10):
+                    self.bot.outbound.send(activity_channel, content=f"<@&{LEADERSHIP_ID}>", embeds=embeds[i:i + 10])
+            # Mark these requests as reminded so they aren’t processed again.
+            await mark_role_requests_reminder_sent(db, [req["user_id"] for req in pending_requests])
+            await db.commit()
 
 
 #
@@ -1454,7 +1417,7 @@ class RecruitmentCog(commands.Cog):
             return
 
         # Auto-claim if the message author is a recruiter and the application is unclaimed:
-        if not app_data.get("recruiter_id") and any(role.id == RECRUITER_ID for role in message.author.roles):
+        if not app_data.get("recruiter_id") and self.resources.has_tier(message.author, "recruiter"):
             await update_application_recruiter( str(message.channel.id), str(message.author.id))
             embed = discord.Embed(title=f"ℹ️ Application automatically claimed by *{message.author.name}*.", colour=0xc0c0c0)
             await message.channel.send(embed=embed)
@@ -1472,15 +1435,8 @@ class RecruitmentCog(commands.Cog):
             elif att.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
                 is_image = True
             if is_image:
-                try:
-                    async with aiosqlite.connect(DATABASE_FILE) as db:
-                        await db.execute(
-                            "UPDATE application_threads SET ban_history_sent = 1 WHERE thread_id = ?",
-                            (message.channel.id,)
-                        )
-                        await db.commit()
-                except Exception as e:
-                    log(f"DB update error in on_message for thread {message.channel.id}: {e}", level="error")
+                # also stamps the time-to-ban-history analytics
+                await mark_ban_history_sent(str(message.channel.id))
                 
                 if message.channel.id not in self.ban_history_submitted:
                     confirmation = discord.Embed(
@@ -1495,109 +1451,73 @@ class RecruitmentCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
-        record = await get_timeout_record(str(member.id))
-        if not record:
-            return
-        # Pull your roles from the Cog’s resources, not member.self
-        if record["type"] == "timeout":
-            role = self.resources.timeout_role
-        else:
-            role = self.resources.blacklist_role
+        # Re-apply timeout/blacklist (and trainee/cadet) roles the records still require
+        await self.reconciler.check_member(member)
 
-        if role and role not in member.roles:
-            try:
-                await member.add_roles(role)
-                log(f"Re-added {record['type']} role to rejoined member {member.id}")
-            except Exception as e:
-                log(f"Error re-adding role for {member.id}: {e}", level="error")
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if after.guild.id == GUILD_ID:
+            await self.reconciler.on_member_update(before, after)
 
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
-            # 1) Fetch all open application threads
+        user_id = str(member.id)
+
         async with aiosqlite.connect(DATABASE_FILE) as db:
+            # 1) Fetch open application threads and accepted trainee/cadet threads
             cursor = await db.execute(
                 """
-                SELECT thread_id, recruiter_id, starttime, ingame_name, region
+                SELECT thread_id, recruiter_id, region
                 FROM application_threads
                 WHERE applicant_id = ? AND is_closed = 0 AND status = 'open'
                 """,
-                (str(member.id),)
+                (user_id,)
+            )
+            open_applications = await cursor.fetchall()
+            cursor = await db.execute(
+                "SELECT thread_id, recruiter_id, reminder_sent FROM entries WHERE user_id = ?",
+                (user_id,)
             )
-            rows = await cursor.fetchall()
+            accepted_threads = await cursor.fetchall()
 
-            for thread_id, recruiter_id, starttime, ingame_name, region in rows:
+            # only threads that still exist are handled
+            threads = {}
+            for thread_id, *_ in open_applications + accepted_threads:
                 thread = self.bot.get_channel(int(thread_id))
-                if not isinstance(thread, discord.Thread):
-                    continue
-
-                # 2) Mark ban_history_sent
-                await db.execute(
-                    "UPDATE application_threads SET ban_history_sent = 1 WHERE thread_id = ?",
-                    (thread_id,)
-                )
-
-                # 3) Send alert embed
-                embed = discord.Embed(
-                    title="🛫 User has left the discord!",
-                    colour=discord.Color.red()
-                )
-                mention = f"<@{recruiter_id}>" if recruiter_id else ""
-                try:
-                    await thread.send(content=mention, embed=embed)
-                except Exception as e:
-                    log(f"Error sending reminder in thread {thread_id}: {e}", level="error")
-
-                # 4) Log attempt in history
-                await add_application_attempt(
-                    applicant_id=str(member.id),
-                    region=region,
-                    status="left_with_open_application",
-                    log_url=f"https://discord.com/channels/{GUILD_ID}/{thread_id}"
-                )
+                if isinstance(thread, discord.Thread):
+                    threads[thread_id] = thread
+            open_applications = [row for row in open_applications if row[0] in threads]
+            accepted_threads = [row for row in accepted_threads if row[0] in threads]
+            if not threads:
+                return
 
-            # Commit all UPDATEs at once
+            # 2) Mark ban_history_sent, log the attempts and stop pending votes in one transaction
+            await db.executemany(
+                "UPDATE application_threads SET ban_history_sent = 1 WHERE thread_id = ?",
+                [(thread_id,) for thread_id, _, _ in open_applications]
+            )
+            await add_application_attempts(db, [
+                (user_id, region, "left_with_open_application", f"https://discord.com/channels/{GUILD_ID}/{thread_id}")
+                for thread_id, _, region in open_applications
+            ])
+            await db.executemany(
+                "UPDATE entries SET reminder_sent = 1 WHERE thread_id = ?",
+                [(thread_id,) for thread_id, _, reminder_sent in accepted_threads if reminder_sent == 0]
+            )
             await db.commit()
 
-
-        # ----- Process Accepted Trainee/Cadet Threads -----
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            cursor = await db.execute(
-                """
-                SELECT thread_id, recruiter_id, starttime, ingame_name, region, reminder_sent
-                FROM entries
-                WHERE user_id = ?
-                """,
-                (str(member.id),)
+        # 3) Send alert embeds
+        for thread_id, recruiter_id, _ in open_applications + accepted_threads:
+            embed = discord.Embed(
+                title="🛫 User has left the discord!",
+                colour=discord.Color.red()
             )
-            accepted_threads = await cursor.fetchall()
-
-        if accepted_threads:
-            for thread_id, recruiter_id, starttime, ingame_name, region, reminder_sent in accepted_threads:
-                thread = self.bot.get_channel(int(thread_id))
-                if thread and isinstance(thread, discord.Thread):
-                    embed = discord.Embed(
-                        title="🛫 User has left the discord!",
-                        description="",
-                        colour=discord.Color.red()
-                    )
-                    # Update reminder_sent in the entries table if not already set
-                    if reminder_sent == 0:
-                        async with aiosqlite.connect(DATABASE_FILE) as db:
-                            await db.execute(
-                                "UPDATE entries SET reminder_sent = ? WHERE thread_id = ?",
-                                (1, thread_id)
-                            )
-                            await db.commit()
-                    if recruiter_id:
-                        content = f"<@{recruiter_id}>"
-                    else:
-                        content = ""
-                    try:
-                        await thread.send(content=content, embed=embed)
-                    except Exception as e:
-                        log(f"Error sending reminder in accepted thread {thread_id}: {e}", level="error")
-                    # Log the event for accepted threads
+            mention = f"<@{recruiter_id}>" if recruiter_id else ""
+            try:
+                await threads[thread_id].send(content=mention, embed=embed)
+            except Exception as e:
+                log(f"Error sending reminder in thread {thread_id}: {e}", level="error")
 
 
     @app_commands.command(name="hello", description="Say hello to the bot")
@@ -1610,6 +1530,7 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="force_add", description="Manually add an existing trainee / cadet thread to the database!")
     @handle_interaction_errors
+    @require_tier("leadership")
     async def force_add(self, interaction: discord.Interaction, user_id: str, ingame_name: str, region: app_commands.Choice[str], role_type: app_commands.Choice[str]):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
@@ -1618,11 +1539,6 @@ class RecruitmentCog(commands.Cog):
         user_id_int = int(user_id)
         guild = interaction.client.get_guild(GUILD_ID)
         
-        leadership_role = self.bot.resources.leadership_role if guild else None
-        if not leadership_role or leadership_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
-        
         selected_region = region.value
         selected_role = role_type.value
         start_time = get_rounded_time()
@@ -1646,7 +1562,7 @@ class RecruitmentCog(commands.Cog):
             activity_channel = self.resources.activity_ch
             if activity_channel:
                 embed = create_user_activity_log_embed("recruitment", f"Manually added trainee", interaction.user, f"User has added <@{user_id_int}> as a trainee.")
-                await activity_channel.send(embed=embed)
+                interaction.client.outbound.send(activity_channel, embed=embed)
         else:
             await interaction.response.send_message(
                 f"❌ Error adding user ID `{user_id_int}` to the database. Possibly a duplicate or DB issue.",
@@ -1655,132 +1571,50 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="list_requests", description="Lists the currently stored pending requests.")
     @handle_interaction_errors
+    @require_tier("staff", "❌ You do not have permission to list requests.")
     async def list_requests(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
         
-        guild = interaction.client.get_guild(GUILD_ID)
-        leadership_role = self.bot.resources.leadership_role if guild else None
-        recruiter_role = self.resources.recruiter_role if guild else None
-
-        # If the user has neither role, deny access
-        if not (
-            (leadership_role and leadership_role in interaction.user.roles)
-            or
-            (recruiter_role and recruiter_role in interaction.user.roles)
-        ):
-            await interaction.response.send_message(
-                "❌ You do not have permission to list requests.",
-                ephemeral=True
-            )
-            return
-        
         await interaction.response.defer(ephemeral=True)
-        
-        pending_requests = await get_role_requests( )  # Returns a list of dicts
-        if not pending_requests:
-            await interaction.followup.send("There are **no** pending requests at the moment.", ephemeral=True)
-            return
-        
-        lines = []
-        
-        # Iterate directly over the list of request dicts
-        for request_data in pending_requests:
-            user_id_str = request_data.get("user_id", "N/A")
-            req_type = request_data.get("request_type", "N/A")
-            timestamp = request_data.get("timestamp", "Unknown")
-            
-            # Build out the 'details' portion based on request_type
-            if req_type == "trainee_role":
-                detail = (
-                    f"InGame Name: {request_data.get('ingame_name', 'Unknown')}, "
-                    f"Region: {request_data.get('region', 'Not Selected')}"
-                )
-            elif req_type == "name_change":
-                detail = f"New Name: {request_data.get('new_name', 'Unknown')}"
-            elif req_type == "other":
-                detail = f"Request: {request_data.get('other', 'No details')}"
-            else:
-                detail = "N/A"
-            
-            # Include the timestamp in the output line
-            lines.append(
-                f"• **User ID**: {user_id_str} | **Type**: `{req_type}` | {detail} | **Time**: {timestamp}"
-            )
-        
-        reply_text = "\n".join(lines)
-        await interaction.followup.send(f"**Current Pending Requests:**\n\n{reply_text}", ephemeral=True)
+        await send_paginated(interaction, "requests")
 
     @app_commands.command(name="list_applications", description="List all current open applications with their status.")
     @handle_interaction_errors
+    @require_tier("staff", "❌ You do not have permission to list requests.")
     async def list_applications(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
 
-        # (Optional) Restrict this command to recruiters or leadership.
-        guild = interaction.client.get_guild(GUILD_ID)
-        leadership_role = self.bot.resources.leadership_role if guild else None
-        recruiter_role = self.resources.recruiter_role if guild else None
-
-        # If the user has neither role, deny access
-        if not (
-            (leadership_role and leadership_role in interaction.user.roles)
-            or
-            (recruiter_role and recruiter_role in interaction.user.roles)
-        ):
-            await interaction.response.send_message(
-                "❌ You do not have permission to list requests.",
-                ephemeral=True
-            )
-            return
-
-        apps = await get_open_applications( )
-        if not apps:
-            await interaction.response.send_message("There are no open applications at the moment.", ephemeral=True)
-            return
-
-        sorted_apps = sort_applications(apps)
-        description_lines = []
-        for app in sorted_apps:
-            if not app["recruiter_id"]:
-                if app["ban_history_sent"] == 0:
-                    status = "Unclaimed, No Ban History"
-                else:
-                    status = "Unclaimed, Ban History Sent"
-            else:
-                status = "Claimed"
-            # You can also include a formatted timestamp if desired.
-            description_lines.append(
-                f"**{app['ingame_name']}** (Thread: `{app['thread_id']}`) | Region: {app['region']} | Status: {status}"
-            )
-        description = "\n".join(description_lines)
-        embed = discord.Embed(
-            title="📋 Open Applications",
-            description=description,
-            color=discord.Color.blue()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_paginated(interaction, "applications")
 
 
     @app_commands.command(name="clear_requests", description="Clears the entire pending requests list.")
     @handle_interaction_errors
+    @require_tier("leadership", "❌ You do not have permission to clear requests.")
     async def clear_requests(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
-        guild = interaction.client.get_guild(GUILD_ID)
-        leadership_role = self.bot.resources.leadership_role if guild else None
-        if not leadership_role or leadership_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to clear requests.", ephemeral=True)
-            return
         await clear_role_requests( )
         await interaction.response.send_message("✅ All pending requests have been **cleared**!", ephemeral=True)
         activity_channel = self.resources.activity_ch
         if activity_channel:
             embed = create_user_activity_log_embed("recruitment", f"Cleared Requests", interaction.user, f"User has cleared all requests.")
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
+
+    @app_commands.command(name="reconcile_roles", description="Re-apply timeout, blacklist, trainee and cadet roles from the database.")
+    @handle_interaction_errors
+    @require_tier("leadership", "❌ You do not have permission to reconcile roles.")
+    async def reconcile_roles(self, interaction: discord.Interaction):
+        if not is_in_correct_guild(interaction):
+            await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+        queued = await self.reconciler.full_sync()
+        await interaction.followup.send(f"✅ Role reconciliation done: **{queued}** member(s) queued for role fixes.", ephemeral=True)
 
     @app_commands.command(name="votinginfo", description="Show info about the current voting thread")
     @handle_interaction_errors
@@ -1811,15 +1645,12 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="remove", description="Remove a user from trainee / cadet program and close thread!")
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def lock_thread_command(self, interaction: discord.Interaction, days: int):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
         guild = interaction.client.get_guild(GUILD_ID)
-        recruiter_role = self.resources.recruiter_role if guild else None
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
         if not isinstance(interaction.channel, discord.Thread):
             await interaction.response.send_message("❌ This is not a thread.", ephemeral=True)
             return
@@ -1885,7 +1716,7 @@ class RecruitmentCog(commands.Cog):
             if activity_channel:
                 log_embed = create_user_activity_log_embed("recruitment", "Blacklisted User", interaction.user,
                                             f"User **{log_mention}** has been blacklisted. (Thread ID: <#{interaction.channel.id}>)")
-                await activity_channel.send(embed=log_embed)
+                interaction.client.outbound.send(activity_channel, embed=log_embed)
             reapply_info = "User has been blacklisted."
         elif days >= 1:
             expires = now + timedelta(days=days)
@@ -1907,7 +1738,7 @@ class RecruitmentCog(commands.Cog):
             if activity_channel:
                 log_embed = create_user_activity_log_embed("recruitment", "Timed Out User", interaction.user,
                                             f"User **{log_mention}** has been timed out until {expires_ts}. (Thread ID: <#{interaction.channel.id}>)")
-                await activity_channel.send(embed=log_embed)
+                interaction.client.outbound.send(activity_channel, embed=log_embed)
             reapply_info = f"User is timed out until {expires.strftime('%d-%m-%Y')}."
         
         embed = discord.Embed(
@@ -1928,11 +1759,12 @@ class RecruitmentCog(commands.Cog):
         if activity_channel:
             log_embed = create_user_activity_log_embed("recruitment", "Removed Trainee/Cadet", interaction.user,
                                                         f"User **{log_mention}** removed. (Thread ID: <#{interaction.channel.id}>)")
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
 
 
     @app_commands.command(name="rename", description="Rename the trainee/cadet thread and update the in-game name in the voting embed.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to accept this application.")
     async def rename(self, interaction: discord.Interaction, new_name: str):
         # Check the command is used in the correct guild.
         if not is_in_correct_guild(interaction):
@@ -1943,12 +1775,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.response.send_message("❌ This command must be used inside a thread.", ephemeral=True)
             return
         
-        # Check if the user issuing command is a Recruiter
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to accept this application.", ephemeral=True)
-            return
-        
         # Ensure the thread is a trainee or cadet notes thread.
         if interaction.channel.parent_id not in [TRAINEE_NOTES_CHANNEL, CADET_NOTES_CHANNEL]:
             await interaction.response.send_message("❌ This command can only be used in a trainee or cadet notes thread.", ephemeral=True)
@@ -1999,15 +1825,12 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="promote", description="Promote the user in the current voting thread (Trainee->Cadet or Cadet->SWAT).")
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def promote_user_command(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
         guild = interaction.client.get_guild(GUILD_ID)
-        recruiter_role = self.resources.recruiter_role if guild else None
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
         if not isinstance(interaction.channel, discord.Thread):
             await interaction.response.send_message("❌ This command must be used in a thread.", ephemeral=True)
             return
@@ -2114,7 +1937,7 @@ class RecruitmentCog(commands.Cog):
                 activity_channel = self.resources.activity_ch
                 if activity_channel:
                     embed = create_user_activity_log_embed("recruitment", f"Promotion", interaction.user, f"User has promoted {member.display_name} ( <@{member.id}> ) to SWAT Officer. (Thread ID: <#{interaction.channel.id}>)")
-                    await activity_channel.send(embed=embed)
+                    interaction.client.outbound.send(activity_channel, embed=embed)
         except discord.Forbidden:
             await interaction.followup.send("❌ Forbidden: Cannot assign roles or change nickname.", ephemeral=True)
         except discord.HTTPException as e:
@@ -2123,14 +1946,11 @@ class RecruitmentCog(commands.Cog):
     @app_commands.command(name="extend", description="Extend the current thread's voting period.")
     @app_commands.describe(days="How many days to extend?")
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def extend_thread_command(self, interaction: discord.Interaction, days: int):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
         if not isinstance(interaction.channel, discord.Thread):
             await interaction.response.send_message("❌ Use this in a thread channel.", ephemeral=True)
             return
@@ -2186,14 +2006,11 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="resend_voting", description="Resends a voting embed!")
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def resend_voting_command(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
         if not isinstance(interaction.channel, discord.Thread):
             await interaction.response.send_message("❌ This command must be used in a thread.", ephemeral=True)
             return
@@ -2212,14 +2029,11 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="early_vote", description="Resends a voting embed!")
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def early_vote(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
             return
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
         if not isinstance(interaction.channel, discord.Thread):
             await interaction.response.send_message("❌ This command must be used in a thread.", ephemeral=True)
             return
@@ -2324,6 +2138,7 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="app_remove", description="Remove this application and lock/archive the thread.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to accept this application.")
     async def app_remove_command(self, interaction: discord.Interaction, days: int):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ Wrong guild!", ephemeral=True)
@@ -2333,12 +2148,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.response.send_message("❌ Must be used in a thread!", ephemeral=True)
             return
 
-        # Check if the user issuing command is a Recruiter
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to accept this application.", ephemeral=True)
-            return
-
 
         app_data = await get_application( str(interaction.channel.id))
         if not app_data:
@@ -2396,7 +2205,7 @@ class RecruitmentCog(commands.Cog):
         if activity_channel:
             log_embed = create_user_activity_log_embed("recruitment", "Application Removed", interaction.user,
                                                     f"User has removed this application. (Thread ID: <#{interaction.channel.id}>)")
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
 
         try:
             await interaction.channel.edit(locked=True, archived=True)
@@ -2407,6 +2216,7 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="app_accept", description="Accept this application, awarding the Trainee role to the applicant.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to accept this application.")
     async def app_accept_command(self, interaction: discord.Interaction):
         # Immediately defer so we can use followup responses
         if not interaction.response.is_done():
@@ -2422,12 +2232,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.followup.send("❌ Must be used in a thread!", ephemeral=True)
             return
 
-        # Check if the user issuing command is a Recruiter
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.followup.send("❌ You do not have permission to accept this application.", ephemeral=True)
-            return
-
         app_data = await get_application( str(interaction.channel.id))
         if not app_data:
             await interaction.followup.send("❌ No application data found for this thread!", ephemeral=True)
@@ -2563,7 +2367,7 @@ class RecruitmentCog(commands.Cog):
         activity_channel = self.resources.activity_ch
         if activity_channel:
             embed = create_user_activity_log_embed("recruitment", f"Application Accepted", interaction.user, f"User has accepted this application. (Thread ID: <#{interaction.channel.id}>)")
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
         try:
             await interaction.channel.edit(locked=True, archived=True)
         except discord.Forbidden:
@@ -2571,6 +2375,7 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="app_accept_cadet", description="Accept this application, and get the person to cadet immediatly.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to accept this application.")
     async def app_accept_cadet_command(self, interaction: discord.Interaction):
         # Immediately defer so we can use followup responses
         await interaction.response.defer(ephemeral=False)
@@ -2585,12 +2390,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.followup.send("❌ Must be used in a thread!", ephemeral=True)
             return
 
-        # Check if the user issuing command is a Recruiter
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.followup.send("❌ You do not have permission to accept this application.", ephemeral=True)
-            return
-
         app_data = await get_application( str(interaction.channel.id))
         if not app_data:
             await interaction.followup.send("❌ No application data found for this thread!", ephemeral=True)
@@ -2713,7 +2512,7 @@ class RecruitmentCog(commands.Cog):
         activity_channel = self.resources.activity_ch
         if activity_channel:
             embed = create_user_activity_log_embed("recruitment", f"Application Accepted (Cadet)", interaction.user, f"User has accepted this application to Cadet. (Thread ID: <#{interaction.channel.id}>)")
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
         try:
             await interaction.channel.edit(locked=True, archived=True)
         except discord.Forbidden:
@@ -2728,6 +2527,7 @@ class RecruitmentCog(commands.Cog):
         can_reapply="Enter -1 for no timeout, 0 for blacklist, or number of days for timeout."
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to accept this application.")
     async def app_deny_command(self, interaction: discord.Interaction, reason: str, can_reapply: int):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ Wrong guild!", ephemeral=True)
@@ -2736,12 +2536,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.response.send_message("❌ Must be used inside a thread!", ephemeral=True)
             return
         
-        # Check if the user issuing command is a Recruiter
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to accept this application.", ephemeral=True)
-            return
-
         app_data = await get_application( str(interaction.channel.id))
         if not app_data:
             await interaction.response.send_message("❌ No application data found for this thread!", ephemeral=True)
@@ -2775,7 +2569,7 @@ class RecruitmentCog(commands.Cog):
             if activity_channel:
                 log_embed = create_user_activity_log_embed("recruitment", "Blacklist User", interaction.user,
                                             f"User **{log_mention}** has been blacklisted. (Thread ID: <#{interaction.channel.id}>)")
-                await activity_channel.send(embed=log_embed)
+                interaction.client.outbound.send(activity_channel, embed=log_embed)
             
             reapply_info = "User has been blacklisted."
         elif can_reapply >= 1:
@@ -2798,7 +2592,7 @@ class RecruitmentCog(commands.Cog):
             if activity_channel:
                 log_embed = create_user_activity_log_embed("recruitment", "Timeout User", interaction.user,
                                             f"User **{log_mention}** has been timed out until {expires_ts}. (Thread ID: <#{interaction.channel.id}>)")
-                await activity_channel.send(embed=log_embed)
+                interaction.client.outbound.send(activity_channel, embed=log_embed)
             reapply_info = f"User can reapply on {expires.strftime('%d-%m-%Y')}."
         
         # Mark the application as closed and update status
@@ -2844,7 +2638,7 @@ class RecruitmentCog(commands.Cog):
         if activity_channel:
             log_embed = create_user_activity_log_embed("recruitment", "Application Denied", interaction.user,
                                                     f"Application denied for thread ID: <#{interaction.channel.id}>")
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
         try:
             await interaction.channel.edit(locked=True, archived=True)
         except discord.Forbidden:
@@ -2866,14 +2660,12 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="app_claim", description="Claim this application.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ Only recruiters can claim.")
     async def app_claim_command(self, interaction: discord.Interaction):
         app_data = await get_application(str(interaction.channel.id))
         if not app_data:
             return await interaction.response.send_message("❌ No application data found!", ephemeral=True)
 
-        if not interaction.client.resources.recruiter_role in interaction.user.roles:
-            return await interaction.response.send_message("❌ Only recruiters can claim.", ephemeral=True)
-
         current = app_data.get("recruiter_id")
         if current:
             # Already claimed: ask for confirmation to override
@@ -2903,6 +2695,7 @@ class RecruitmentCog(commands.Cog):
         days="How many days to prevent them from applying"
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to timeout applications.")
     async def app_timeout(
         self,
         interaction: discord.Interaction,
@@ -2924,14 +2717,6 @@ class RecruitmentCog(commands.Cog):
                 ephemeral=True
             )
 
-        # permission check
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to timeout applications.",
-                ephemeral=True
-            )
-
         # resolve member_id and optional Member
         if target:
             member_id = target.id
@@ -2981,7 +2766,7 @@ class RecruitmentCog(commands.Cog):
                 interaction.user,
                 f"**{log_mention}** is timed out until {expires_ts}."
             )
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
 
 
     @app_commands.command(
@@ -2993,6 +2778,7 @@ class RecruitmentCog(commands.Cog):
         user_id="The user ID to blacklist"
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to blacklist users.")
     async def blacklist_command(
         self,
         interaction: discord.Interaction,
@@ -3020,14 +2806,6 @@ class RecruitmentCog(commands.Cog):
                 )
             member_obj = interaction.guild.get_member(member_id)
 
-        # permission check
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to blacklist users.",
-                ephemeral=True
-            )
-
         # apply blacklist in your DB
         await add_timeout_record( str(member_id), "blacklist")
 
@@ -3057,7 +2835,7 @@ class RecruitmentCog(commands.Cog):
                 interaction.user,
                 f"User **{log_mention}** has been blacklisted."
             )
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
 
         embed = discord.Embed(
             title="User Blacklisted",
@@ -3073,64 +2851,10 @@ class RecruitmentCog(commands.Cog):
         description="Lists all active blacklists and timeouts."
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to view this.")
     async def show_restrictions(self, interaction: discord.Interaction):
-       # permission check
-        recruiter = self.bot.resources.recruiter_role
-        if not recruiter or recruiter not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to view this.", ephemeral=True
-            )
-
-        # fetch your records
-        records = await get_all_timeouts()
-        if not records:
-            return await interaction.response.send_message(
-                "✅ There are no active blacklists or timeouts.", ephemeral=True
-            )
-
-        # build one line per record
-        lines = []
-        for rec in records:
-            user_id = int(rec["user_id"])
-            member = interaction.guild.get_member(user_id)
-            name   = member.display_name if member else str(user_id)
-
-            if rec["type"] == "timeout":
-                # parse expiration
-                exp = rec["expires_at"]
-                if isinstance(exp, str):
-                    try:
-                        exp = datetime.fromisoformat(exp)
-                    except:
-                        exp = None
-                ts = f"<t:{int(exp.timestamp())}:f>" if exp else "N/A"
-                icon, detail = "⏰", f"Timeout until {ts}"
-            else:
-                icon, detail = "🚫", "Blacklisted"
-
-            lines.append(f"{icon} `{user_id}` — {name}: {detail}")
-
-        # join into a single code-block, respecting Discord's 4096-char limit
-        text = "\n".join(lines)
-        if len(text) > 3900:  # leave room for backticks + “…and N more”
-            # find how many lines we can keep
-            allowed = []
-            total = 0
-            for line in lines:
-                if total + len(line) + 1 > 3900:
-                    break
-                allowed.append(line)
-                total += len(line) + 1
-            remaining = len(lines) - len(allowed)
-            allowed.append(f"...and {remaining} more not shown.")
-            text = "\n".join(allowed)
-
-        embed = discord.Embed(
-            title="🚨 Active Blacklists & Timeouts",
-            description=f"```{text}```",
-            color=discord.Color.dark_red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        # one page at a time, keyed by user id
+        await send_paginated(interaction, "restrictions")
         
     @app_commands.command(
         name="remove_restriction",
@@ -3141,6 +2865,7 @@ class RecruitmentCog(commands.Cog):
         user_id="The user ID to un-restrict"
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to remove restrictions.")
     async def remove_restriction_command(
         self,
         interaction: discord.Interaction,
@@ -3168,14 +2893,6 @@ class RecruitmentCog(commands.Cog):
                 )
             member_obj = interaction.guild.get_member(member_id)
 
-        # permission check
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to remove restrictions.",
-                ephemeral=True
-            )
-
         # remove from your DB
         removed = await remove_timeout_record( str(member_id))
         if not removed:
@@ -3205,7 +2922,7 @@ class RecruitmentCog(commands.Cog):
         if activity_channel:
             embed = create_user_activity_log_embed("recruitment", "Remove Restriction", interaction.user,
                                                 f"Removed restrictions from user {member_obj.display_name} ( <@{member_obj.id}> ).")
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
         
         embed = discord.Embed(
             title="Restriction Removed",
@@ -3240,6 +2957,7 @@ class RecruitmentCog(commands.Cog):
         ]
     )
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to toggle applications.")
     async def toggle_applications(
         self,
         interaction: discord.Interaction,
@@ -3249,34 +2967,20 @@ class RecruitmentCog(commands.Cog):
         # Immediately defer so we can take our time
         await interaction.response.defer(ephemeral=True)
 
-        # 1) Permission check
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.followup.send(
-                "❌ You do not have permission to toggle applications.",
-                ephemeral=True
-            )
-
         region_val = region.upper()   # "EU", "NA", "SEA"
         status_val = status.upper()   # "OPEN" or "CLOSED"
 
-        # 2) Update local DB
+        # 1) Update local DB
         if not await update_region_status(region_val, status_val):
             return await interaction.followup.send(
                 "❌ Failed to update region status in the database.",
                 ephemeral=True
             )
 
-        # 3) Refresh the local embed
-        new_embed = await create_application_embed()
-        channel   = self.resources.apply_ch
-        try:
-            msg = await channel.fetch_message(self.application_embed_message_id)
-            await msg.edit(embed=new_embed)
-        except Exception as e:
-            log(f"Error editing local application embed: {e}", level="error")
+        # 2) Refresh the local embed
+        await self.bot.embeds.refresh("application_embed")
 
-        # 4) Log locally
+        # 3) Log locally
         activity_channel = self.resources.activity_ch
         if activity_channel:
             log_embed = create_user_activity_log_embed(
@@ -3285,87 +2989,47 @@ class RecruitmentCog(commands.Cog):
                 interaction.user,
                 f"{region_val} → {status_val}"
             )
-            await activity_channel.send(embed=log_embed)
+            interaction.client.outbound.send(activity_channel, embed=log_embed)
 
-        # 5) Read API token
-        try:
-            with open(SWAT_WEBSITE_TOKEN_FILE, "r") as f:
-                website_api_token = f.read().strip()
-        except Exception as e:
-            log(f"Failed to read API token file '{SWAT_WEBSITE_TOKEN_FILE}': {e}", level="error")
-            return await interaction.followup.send(
-                "❌ Internal error reading API token.",
-                ephemeral=True
-            )
-
-        # 6) Call external API with correct header name
+        # 4) Push the change to the website through the shared client's queue
         if SEND_API_DATA:
-            url     = f"{SWAT_WEBSITE_URL}/api/application/status"
             payload = {"server": region_val.lower(), "status": status_val.lower()}
-            headers = {
-                "X-Api-Token":    website_api_token,
-                "Content-Type":   "application/json",
-                "User-Agent":     (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/114.0.0.0 Safari/537.36"
-                ),
-                "Accept":         "application/json, text/javascript, */*; q=0.01",
-                "Accept-Language":"en-US,en;q=0.9",
-            }
-
-            try:
-                resp = requests.post(url, json=payload, headers=headers, timeout=10)
-                resp.raise_for_status()
-            except requests.exceptions.HTTPError as e:
-                body = getattr(e.response, "text", "")
-                log(f"API HTTP error {e.response.status_code}", level="error")
-                return await interaction.followup.send(
-                    f"⚠ Website API returned {e.response.status_code} -> Data not updated",
-                    ephemeral=True
-                )
-            except requests.exceptions.RequestException as e:
-                log(f"Error calling external API: {e}", level="error")
-                return await interaction.followup.send(
-                    "⚠ Could not reach website application API.",
-                    ephemeral=True
-                )
-
-            # 7) Parse JSON
+            future  = self.bot.website.submit("/api/application/status", payload)
             try:
-                data = resp.json()
-            except ValueError:
-                log(f"Invalid JSON from API: {resp.text}", level="error")
+                result = await asyncio.wait_for(asyncio.shield(future), timeout=15)
+            except asyncio.TimeoutError:
                 return await interaction.followup.send(
-                    "⚠ Received invalid response from website API.",
+                    f"⚠ Applications for **{region_val}** set to **{status_val}** locally. "
+                    "The website API is slow to respond, the update stays queued and is retried in the background.",
                     ephemeral=True
                 )
 
-            if not data.get("success"):
-                err = data.get("error", "Unknown error")
-                log(f"External API error response: {err}", level="error")
-                return await interaction.followup.send(
-                    f"⚠ API error: {err}",
-                    ephemeral=True
-                )
+            if not result["ok"]:
+                if result["status"] is None:
+                    msg = "⚠ Could not reach website application API."
+                elif result["status"] >= 400:
+                    msg = f"⚠ Website API returned {result['status']} -> Data not updated"
+                else:
+                    msg = f"⚠ API error: {result['error']}"
+                return await interaction.followup.send(msg, ephemeral=True)
 
             log(f"External API status update succeeded: {region_val}→{status_val}", level="info")
 
-        # 8) Final confirmation
+        # 5) Final confirmation
         await interaction.followup.send(
             f"✅ Applications for **{region_val}** set to **{status_val}**.",
             ephemeral=True
         )
 
     @app_commands.command(name="app_stats", description="Show application statistics.")
+    @app_commands.describe(
+        days="Totals over the last N days (0 = all time)",
+        weeks="Weeks shown in the trend chart"
+    )
     @handle_interaction_errors
-    async def app_stats(self, interaction: discord.Interaction, days: int = 0):
-        guild = interaction.client.get_guild(GUILD_ID)
-        recruiter_role = self.resources.recruiter_role if guild else None
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
-            return
-
+    @require_tier("recruiter")
+    async def app_stats(self, interaction: discord.Interaction, days: int = 0,
+                        weeks: app_commands.Range[int, 1, 104] = 12):
         stats = await get_application_stats( days)
         if days > 0:
             title = f"Application Statistics (Last {days} days)"
@@ -3377,6 +3041,80 @@ class RecruitmentCog(commands.Cog):
         embed.add_field(name="❌ Denied Applications", value=str(stats["denied"]), inline=False)
         embed.add_field(name="⚠️ Withdrawn Applications", value=str(stats["withdrawn"]), inline=False)
         embed.add_field(name="🟢 Current Open Applications", value=str(stats["open"]), inline=False)
+
+        # weekly trend: cached per week, only the current week is re-queried
+        trends = await get_weekly_trends(weeks)
+        chart = await asyncio.to_thread(render_weekly_trends, trends)
+        if chart:
+            embed.set_image(url="attachment://app_trends.png")
+            await interaction.response.send_message(
+                embed=embed, file=discord.File(chart, filename="app_trends.png"), ephemeral=True
+            )
+            return
+        embed.add_field(name=f"📈 Last {weeks} weeks", value=f"```{format_weekly_trends(trends)}```", inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="recruiter_stats", description="Show time-to-claim/ban-history/decision percentiles.")
+    @app_commands.describe(
+        recruiter="Only this recruiter",
+        region="Only this region"
+    )
+    @app_commands.choices(
+        region=[
+            app_commands.Choice(name="EU",  value="EU"),
+            app_commands.Choice(name="NA",  value="NA"),
+            app_commands.Choice(name="SEA", value="SEA"),
+        ]
+    )
+    @handle_interaction_errors
+    @require_tier("recruiter")
+    async def recruiter_stats(self, interaction: discord.Interaction,
+                              recruiter: Optional[discord.Member] = None, region: Optional[str] = None):
+        # reads the precomputed aggregates only; nothing scans application history
+        if recruiter:
+            scope, key, title = "recruiter", str(recruiter.id), f"Recruiter Stats – {recruiter.display_name}"
+        elif region:
+            scope, key, title = "region", region, f"Recruiter Stats – {region}"
+        else:
+            scope, key, title = "all", "all", "Recruiter Stats (All)"
+        stats = await get_recruiter_stats(scope, key)
+
+        embed = discord.Embed(title=title, color=discord.Color.blue())
+        for metric, label in METRICS.values():
+            data = stats["metrics"].get(metric)
+            if not data:
+                embed.add_field(name=label, value="No data yet", inline=False)
+                continue
+            embed.add_field(
+                name=label,
+                value=(
+                    f"p50 **{fmt_duration(data['p50'])}** · p90 **{fmt_duration(data['p90'])}** · "
+                    f"mean {fmt_duration(data['mean'])} · n={data['count']}"
+                ),
+                inline=False
+            )
+        if stats["outcomes"]:
+            outcomes = " · ".join(f"{name}: {count}" for name, count in sorted(stats["outcomes"].items()))
+            embed.add_field(name="📊 Outcomes", value=outcomes, inline=False)
+
+        if scope == "all":
+            board = await get_recruiter_leaderboard()
+            lines = [
+                f"<@{row['recruiter_id']}> – {row['decisions']} decided, {row['claims']} claimed, "
+                f"claim p50 {fmt_duration(row['claim_p50'])}, decision p50 {fmt_duration(row['decision_p50'])}"
+                for row in board if row["recruiter_id"] != "unclaimed"
+            ]
+            if lines:
+                # whole lines only, so no mention is cut in half
+                value = ""
+                for index, line in enumerate(lines):
+                    more = f"\n… and {len(lines) - index} more"
+                    if len(value) + len(line) + 1 + len(more) > 1024:
+                        value += more
+                        break
+                    value += line + "\n"
+                embed.add_field(name="👥 Recruiters", value=value.strip(), inline=False)
+        embed.set_footer(text="Percentiles are bucketed (about ±20%). Counted since analytics were enabled.")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
@@ -3390,6 +3128,7 @@ class RecruitmentCog(commands.Cog):
         user_id="The user ID to look up"
     )
     @handle_interaction_errors
+    @require_tier("recruiter")
     async def app_history(
         self,
         interaction: discord.Interaction,
@@ -3417,16 +3156,7 @@ class RecruitmentCog(commands.Cog):
                 )
             lookup_user = interaction.client.get_user(lookup_id) or await interaction.client.fetch_user(lookup_id)
 
-        # 3) Permission check
-        guild = interaction.client.get_guild(GUILD_ID)
-        recruiter_role = self.resources.recruiter_role if guild else None
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ You do not have permission to use this command.",
-                ephemeral=True
-            )
-
-        # 4) Fetch history
+        # 3) Fetch history
         history = await get_application_history(str(lookup_id))
         if not history:
             return await interaction.response.send_message(
@@ -3434,7 +3164,7 @@ class RecruitmentCog(commands.Cog):
                 ephemeral=True
             )
 
-        # 5) Build lines
+        # 4) Build lines
         type_icons   = {"submission": "📥", "attempt": "🔍"}
         status_icons = {"accepted": "✅", "denied": "❌", "withdrawn": "🔁", "open": "📁"}
         lines = []
@@ -3454,7 +3184,7 @@ class RecruitmentCog(commands.Cog):
                 line = f"{t_icon} {ts_tag} • Attempt • {s_icon} • `{entry['details']}`"
             lines.append(line)
 
-        # 6) Truncate if over Discord's 4096 limit
+        # 5) Truncate if over Discord's 4096 limit
         desc = ""
         for ln in lines:
             candidate = desc + ln + "\n"
@@ -3463,7 +3193,7 @@ class RecruitmentCog(commands.Cog):
                 break
             desc = candidate
 
-        # 7) Send embed
+        # 6) Send embed
         embed = discord.Embed(
             title=f"📜 Application History for {lookup_user.display_name}",
             description=desc or "No entries.",
@@ -3474,6 +3204,7 @@ class RecruitmentCog(commands.Cog):
 
     @app_commands.command(name="app_silence", description="Toggle silence for notifications in this application thread.")
     @handle_interaction_errors
+    @require_tier("recruiter", "❌ You do not have permission to toggle silence.")
     async def app_silence(self, interaction: discord.Interaction):
         if not is_in_correct_guild(interaction):
             await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
@@ -3482,12 +3213,6 @@ class RecruitmentCog(commands.Cog):
             await interaction.response.send_message("❌ This command must be used in an application thread.", ephemeral=True)
             return
     
-        # Check if the user has the Recruiter role
-        recruiter_role = self.bot.resources.recruiter_role
-        if not recruiter_role or recruiter_role not in interaction.user.roles:
-            await interaction.response.send_message("❌ You do not have permission to toggle silence.", ephemeral=True)
-            return
-
         thread_id = str(interaction.channel.id)
         # Check current silence status
         current_silence = await is_application_silenced( thread_id)
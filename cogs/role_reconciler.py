@@ -0,0 +1,173 @@
+# cogs/role_reconciler.py
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+import discord
+
+from config import GUILD_ID, TIMEOUT_ROLE_ID, BLACKLISTED_ROLE_ID, TRAINEE_ROLE, CADET_ROLE
+from cogs.helpers import log, create_user_activity_log_embed
+from cogs.metrics import register_source
+from cogs.db_utils import get_required_roles, get_expired_timeouts, remove_timeout_records
+
+# record value (timeouts.type / entries.role_type) -> role it requires
+ROLE_FOR_RECORD = {
+    "timeout":   TIMEOUT_ROLE_ID,
+    "blacklist": BLACKLISTED_ROLE_ID,
+    "trainee":   TRAINEE_ROLE,
+    "cadet":     CADET_ROLE,
+}
+MANAGED_ROLE_IDS = frozenset(ROLE_FOR_RECORD.values())
+
+
+class RoleReconciler:
+    """
+    Keeps the managed roles (timeout, blacklist, trainee, cadet) in line with the
+    timeouts and entries tables.
+    - a record only ever requires a role; roles are taken away when a timeout expires
+    - on_member_update reacts to a managed role being removed, without any scan
+    - full_sync() walks the records (not the member list), on startup or on request
+    - role edits go through one worker, merged per member and spaced `spacing` seconds apart
+    """
+
+    def __init__(self, bot, spacing: float = 1.0):
+        self.bot       = bot
+        self.spacing   = spacing
+        self.applied   = 0
+        self.failed    = 0
+        self.last_sync = None       # (finished at, records checked, members queued)
+
+        self._pending: Dict[int, tuple] = {}   # member id -> (role ids to add, role ids to remove, reason)
+        self._wake = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        register_source("roles", self.describe)
+
+    def close(self):
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+
+    # -------------------------------
+    # Desired state
+    # -------------------------------
+    @staticmethod
+    def _missing_roles(member: discord.Member, records: Iterable[str]) -> set:
+        required = {ROLE_FOR_RECORD[r] for r in records if r in ROLE_FOR_RECORD}
+        return {role_id for role_id in required if member.get_role(role_id) is None}
+
+    async def full_sync(self) -> int:
+        """Queues every missing managed role. Cost is O(records). Returns the members queued."""
+        guild = self.bot.get_guild(GUILD_ID)
+        if not guild:
+            return 0
+        required = await get_required_roles()
+        queued = 0
+        for user_id, records in required.items():
+            member = guild.get_member(int(user_id)) if user_id.isdigit() else None
+            if not member:
+                continue
+            missing = self._missing_roles(member, records)
+            if missing:
+                self.queue(member.id, add=missing, reason="Role reconciliation")
+                queued += 1
+        self.last_sync = (datetime.now(), len(required), queued)
+        log(f"Role reconciliation: {len(required)} records checked, {queued} members queued")
+        return queued
+
+    async def check_member(self, member: discord.Member):
+        """Re-applies the required roles of a single member (e.g. on rejoin)."""
+        records = (await get_required_roles(str(member.id))).get(str(member.id), ())
+        missing = self._missing_roles(member, records)
+        if missing:
+            self.queue(member.id, add=missing, reason="Restoring roles required by records")
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        lost = {role_id for role_id in MANAGED_ROLE_IDS
+                if before.get_role(role_id) is not None and after.get_role(role_id) is None}
+        if not lost:
+            return
+        records = (await get_required_roles(str(after.id))).get(str(after.id), ())
+        restore = lost & {ROLE_FOR_RECORD[r] for r in records if r in ROLE_FOR_RECORD}
+        if restore:
+            log(f"Managed role(s) {sorted(restore)} removed from {after.id} while still required; restoring")
+            self.queue(after.id, add=restore, reason="Role is required by an active record")
+
+    async def expire_timeouts(self, user_ids: list):
+        """Scheduler handler: drops expired timeout records and strips the timeout role."""
+        expired = await get_expired_timeouts(user_ids)
+        if not expired:
+            return
+        await remove_timeout_records([record["user_id"] for record in expired])
+
+        guild = self.bot.get_guild(GUILD_ID)
+        activity_channel = self.bot.resources.activity_ch
+        for record in expired:
+            member = guild.get_member(int(record["user_id"])) if guild else None
+            log(f"Timeout expired for user {record['user_id']}")
+            if not member:
+                continue
+            self.queue(member.id, remove={TIMEOUT_ROLE_ID}, reason="Timeout expired")
+            if activity_channel:
+                log_embed = create_user_activity_log_embed(
+                    "recruitment", "Timeout Expired", member,
+                    f"Timeout expired on {record['expires_at'].strftime('%Y-%m-%d %H:%M:%S')}"
+                )
+                self.bot.outbound.send(activity_channel, embed=log_embed)
+
+    # -------------------------------
+    # Worker
+    # -------------------------------
+    def queue(self, member_id: int, add: Iterable[int] = (), remove: Iterable[int] = (), reason: str = None):
+        """Queues role changes for a member; later changes override earlier ones for the same role."""
+        add, remove = set(add), set(remove)
+        adds, removes, _ = self._pending.get(member_id, (set(), set(), None))
+        adds = (adds - remove) | add
+        removes = (removes - add) | remove
+        self._pending[member_id] = (adds, removes, reason)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+            member_id = next(iter(self._pending))
+            adds, removes, reason = self._pending.pop(member_id)
+            if await self._apply(member_id, adds, removes, reason):
+                await asyncio.sleep(self.spacing)
+
+    async def _apply(self, member_id: int, adds: set, removes: set, reason: str) -> bool:
+        """Applies only the changes still needed. Returns True if Discord was called."""
+        guild = self.bot.get_guild(GUILD_ID)
+        member = guild.get_member(member_id) if guild else None
+        if not member:
+            return False
+        to_add = [guild.get_role(r) for r in adds if member.get_role(r) is None]
+        to_remove = [member.get_role(r) for r in removes if member.get_role(r) is not None]
+        to_add = [role for role in to_add if role is not None]
+        if not to_add and not to_remove:
+            return False
+        try:
+            if to_add:
+                await member.add_roles(*to_add, reason=reason)
+            if to_remove:
+                await member.remove_roles(*to_remove, reason=reason)
+            self.applied += len(to_add) + len(to_remove)
+            log(f"Reconciled roles for {member_id}: +{[r.name for r in to_add]} -{[r.name for r in to_remove]}")
+        except discord.HTTPException as e:
+            self.failed += 1
+            log(f"Error reconciling roles for {member_id}: {e}", level="error")
+        return True
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        text = f"{len(self._pending)} pending, {self.applied} applied, {self.failed} failed"
+        if self.last_sync:
+            finished, records, queued = self.last_sync
+            text += f", last sync {finished:%H:%M} ({records} records, {queued} queued)"
+        return text
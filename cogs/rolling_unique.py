@@ -0,0 +1,56 @@
+# cogs/rolling_unique.py
+from collections import defaultdict
+
+
+def hour_bucket(timestamp: float) -> int:
+    """Returns the UTC hour bucket (hours since epoch) of a unix timestamp."""
+    return int(timestamp // 3600)
+
+
+class RollingUniqueCounter:
+    """
+    Keeps the set of distinct ids seen within the last `window_hours` hour buckets.
+    Every id lives in exactly one bucket (the hour it was last seen), so the
+    current count is simply the number of tracked ids.
+    """
+
+    def __init__(self, window_hours: int = 24):
+        self.window_hours = window_hours
+        self._last_seen = {}                # id -> hour bucket of the latest sighting
+        self._buckets = defaultdict(set)    # hour bucket -> ids last seen in that hour
+
+    def __len__(self):
+        return len(self._last_seen)
+
+    def cutoff(self, current_hour: int) -> int:
+        """Oldest hour bucket that still belongs to the window."""
+        return current_hour - self.window_hours + 1
+
+    def observe(self, uid: str, hour: int) -> bool:
+        """
+        Records a sighting. Returns True if the id moved to a newer bucket
+        (i.e. the sighting has to be persisted), False if nothing changed.
+        """
+        previous = self._last_seen.get(uid)
+        if previous is not None:
+            if previous >= hour:
+                return False
+            bucket = self._buckets.get(previous)
+            if bucket is not None:
+                bucket.discard(uid)
+                if not bucket:
+                    del self._buckets[previous]
+        self._buckets[hour].add(uid)
+        self._last_seen[uid] = hour
+        return True
+
+    def expire(self, current_hour: int):
+        """Drops every bucket that fell out of the window."""
+        cutoff = self.cutoff(current_hour)
+        for hour in [h for h in self._buckets if h < cutoff]:
+            for uid in self._buckets.pop(hour):
+                del self._last_seen[uid]
+
+    def count(self, current_hour: int) -> int:
+        self.expire(current_hour)
+        return len(self._last_seen)
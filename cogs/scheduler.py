@@ -0,0 +1,173 @@
+# cogs/scheduler.py
+import asyncio, heapq, time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from cogs.helpers import log
+from cogs.metrics import RollingStats, fmt_ms, register_source
+from cogs.db_utils import (
+    add_job_listener, backfill_scheduled_jobs, complete_scheduled_jobs,
+    get_scheduled_jobs, init_scheduled_jobs_db,
+)
+
+# async handler(job_keys) for one job kind
+JobHandler = Callable[[List[str]], Awaitable[None]]
+
+
+def _fmt_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "n/a"
+    if value < 60:
+        return fmt_ms(value * 1000)
+    if value < 3600:
+        return f"{value / 60:.0f} min"
+    return f"{value / 3600:.1f} h"
+
+
+class Scheduler:
+    """
+    Runs the due-time jobs stored in the scheduled_jobs table.
+    - every job is mirrored in a heap; the worker sleeps until the earliest
+      due time and is woken early when a sooner job is added
+    - all jobs of one kind that are due together go to that kind's handler
+      as a single batch of keys
+    - jobs missed while the bot was down are due immediately on start
+    Handlers re-check their own tables, so a stale job is harmless. A kind
+    without a registered handler is parked until its cog registers one.
+    """
+
+    def __init__(self, retry_delay: float = 60.0, max_sleep: float = 300.0):
+        self.retry_delay = retry_delay
+        self.max_sleep   = max_sleep        # re-read the clock at least this often
+        self.lateness    = RollingStats(maxlen=500)   # seconds between due time and dispatch
+        self.dispatched  = 0
+        self.failed      = 0
+
+        self._due: Dict[tuple, float] = {}  # (kind, key) -> due_at
+        self._heap = []                     # (due_at, kind, key); stale entries are skipped
+        self._handlers: Dict[str, JobHandler] = {}
+        self._parked = defaultdict(set)     # kind -> keys that came due without a handler
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        add_job_listener(self._on_job_changed)
+        register_source("scheduler", self.describe)
+
+    # -------------------------------
+    # Lifecycle
+    # -------------------------------
+    async def start(self):
+        """Loads the stored jobs and starts the worker. Safe to call again on reconnect."""
+        if self._task and not self._task.done():
+            return
+        await init_scheduled_jobs_db()
+        added = await backfill_scheduled_jobs()
+        for kind, key, due_at in await get_scheduled_jobs():
+            self._on_job_changed(kind, key, due_at)
+        now = time.time()
+        overdue = sum(1 for due_at in self._due.values() if due_at <= now)
+        log(f"Scheduler started: {len(self._due)} jobs ({added} backfilled, {overdue} overdue)")
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def register_handler(self, kind: str, handler: JobHandler):
+        self._handlers[kind] = handler
+        for key in self._parked.pop(kind, ()):
+            due_at = self._due.get((kind, key))
+            if due_at is not None:
+                heapq.heappush(self._heap, (due_at, kind, key))
+        self._wake.set()
+
+    def unregister_handler(self, kind: str):
+        self._handlers.pop(kind, None)
+
+    # -------------------------------
+    # Job bookkeeping
+    # -------------------------------
+    def _on_job_changed(self, kind: str, key: Optional[str], due_at: Optional[float]):
+        """Listener for db_utils: mirrors every job write into the heap."""
+        if key is None:
+            for job in [job for job in self._due if job[0] == kind]:
+                del self._due[job]
+            self._parked.pop(kind, None)
+            return
+        self._parked[kind].discard(key)
+        if due_at is None:
+            self._due.pop((kind, key), None)
+            return
+        self._due[(kind, key)] = due_at
+        heapq.heappush(self._heap, (due_at, kind, key))
+        if self._heap[0] == (due_at, kind, key):
+            self._wake.set()
+
+    def _pop_due(self, now: float) -> Dict[str, Dict[str, float]]:
+        batches = defaultdict(dict)
+        while self._heap and self._heap[0][0] <= now:
+            due_at, kind, key = heapq.heappop(self._heap)
+            if self._due.get((kind, key)) != due_at:
+                continue                    # moved or cancelled since it was pushed
+            if kind not in self._handlers:
+                self._parked[kind].add(key)
+                continue
+            batches[kind][key] = due_at
+        return batches
+
+    # -------------------------------
+    # Worker
+    # -------------------------------
+    async def _run(self):
+        while True:
+            now = time.time()
+            batches = self._pop_due(now)
+            if batches:
+                for kind, jobs in batches.items():
+                    await self._dispatch(kind, jobs, now)
+                continue
+
+            delay = self.max_sleep
+            if self._heap:
+                delay = min(delay, max(0.0, self._heap[0][0] - now))
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(self, kind: str, jobs: Dict[str, float], now: float):
+        for key, due_at in jobs.items():
+            self.lateness.add(max(0.0, now - due_at))
+            if self._due.get((kind, key)) == due_at:
+                del self._due[(kind, key)]
+
+        try:
+            await self._handlers[kind](list(jobs))
+        except Exception as e:
+            self.failed += 1
+            log(f"Scheduled {kind} handler failed for {len(jobs)} job(s), retrying in {self.retry_delay:.0f}s: {e}", level="error")
+            retry_at = time.time() + self.retry_delay
+            for key in jobs:
+                if (kind, key) not in self._due:  # not rescheduled by the handler itself
+                    self._on_job_changed(kind, key, retry_at)
+            return
+
+        self.dispatched += len(jobs)
+        await complete_scheduled_jobs(kind, list(jobs.items()))
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        parked = sum(len(keys) for keys in self._parked.values())
+        next_in = None
+        if self._due:
+            next_in = max(0.0, min(self._due.values()) - time.time())
+        snap = self.lateness.snapshot()
+        return (
+            f"{len(self._due)} queued ({parked} parked), next in {_fmt_seconds(next_in)}, "
+            f"{self.dispatched} run, {self.failed} failed, "
+            f"late p50 {_fmt_seconds(snap['p50'])}, p95 {_fmt_seconds(snap['p95'])}"
+        )
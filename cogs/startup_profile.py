@@ -0,0 +1,75 @@
+# cogs/startup_profile.py
+"""
+Startup timing mode. With BOT_STARTUP_PROFILE=1 in the environment, main.py
+records the import cost of every module (self and cumulative, like
+`python -X importtime`), the time of each cog setup and init_* call, and
+the time to the first on_ready, then logs a report.
+
+Import this before anything heavy: only imports that happen after it are seen.
+Keep it free of third-party and cogs imports for the same reason.
+"""
+import builtins, os, sys, time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+ENABLED = os.environ.get("BOT_STARTUP_PROFILE", "") not in ("", "0")
+
+
+class StartupProfiler:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.imports: Dict[str, Tuple[float, float]] = {}     # module -> (self s, cumulative s)
+        self.phases: List[Tuple[str, str, float]] = []         # (category, name, seconds)
+        self._stack: List[float] = []                          # child time of the imports in progress
+        self._original_import = builtins.__import__
+        if enabled:
+            builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports[name] = (elapsed - children, elapsed)
+
+    @contextmanager
+    def phase(self, category: str, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def record(self, category: str, name: str, seconds: float):
+        if self.enabled:
+            self.phases.append((category, name, seconds))
+
+    def report(self, top: int = 25, until: str = "first on_ready") -> List[str]:
+        """Stops timing imports and returns the report lines (empty when disabled)."""
+        if not self.enabled:
+            return []
+        builtins.__import__ = self._original_import
+        self.enabled = False
+
+        lines = [f"Startup profile: {until} {time.perf_counter() - self.started:.2f}s after launch"]
+        total_imports = sum(own for own, _ in self.imports.values())
+        lines.append(f"Imports: {len(self.imports)} modules, {total_imports * 1000:.0f} ms; slowest (self / cumulative):")
+        for name, (own, cumulative) in sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:top]:
+            lines.append(f"  {own * 1000:8.1f} ms {cumulative * 1000:8.1f} ms  {name}")
+        for category in dict.fromkeys(category for category, _, _ in self.phases):
+            entries = [(name, seconds) for cat, name, seconds in self.phases if cat == category]
+            lines.append(f"{category}: {sum(seconds for _, seconds in entries) * 1000:.0f} ms")
+            for name, seconds in entries:
+                lines.append(f"  {seconds * 1000:8.1f} ms  {name}")
+        return lines
+
+
+profiler = StartupProfiler(ENABLED)
@@ -7,12 +7,18 @@ import aiohttp
 import os
 from pathlib import Path
 
-from config import TICKET_CHANNEL_ID
+from cogs.metrics import LOOPS, collect, fmt_ms
+from cogs.health import HealthProber
+from cogs.guild_resources import require_tier
+
+
+def _p50_p95(snap: dict) -> str:
+    return f"{fmt_ms(snap['p50'])} / {fmt_ms(snap['p95'])}"
+
 
 class StatusCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        # Caches to avoid hitting APIs on every invocation
         creds_path = Path(__file__).parent / "pushover_creds.txt"
         try:
             with open(creds_path, "r") as f:
@@ -21,122 +27,108 @@ class StatusCog(commands.Cog):
             self.pushover_user  = lines["USER_KEY"]
         except Exception as e:
             raise RuntimeError(f"Could not load Pushover creds: {e}")
-    # —————————————————————————————————————————————
-        self._discord_status_cache = None  # dict with keys: description, ms, ts
-        self._discord_status_ttl = 60      # seconds
-        self._api_call_cache = None        # dict with keys: ok, ms, ts
-        self._api_call_ttl = 10            # seconds
+        # /status renders from these background samples instead of calling out
+        self.prober = HealthProber(bot)
+
+    async def cog_load(self):
+        self.prober.start()
+
+    async def cog_unload(self):
+        await self.prober.close()
 
     @app_commands.command(name="status", description="Show bot health & latency metrics")
     async def status(self, interaction: discord.Interaction):
-        await interaction.response.defer(thinking=True, ephemeral=True)
         overall_start = perf_counter()
+        prober = self.prober
+        hb, api, db = prober.heartbeat.snapshot(), prober.rest.snapshot(), prober.db.snapshot()
+        lag, page = prober.loop_lag.snapshot(), prober.status_page.snapshot()
 
-        # 1) Heartbeat latency
-        hb_ms = round(self.bot.latency * 1000)
+        # 1) Heartbeat latency (emoji/colour by the hour's median, not one sample)
+        hb_ms = hb["p50"] if hb["p50"] is not None else self.bot.latency * 1000
         hb_emoji = "💚" if hb_ms < 100 else "💛" if hb_ms < 300 else "💔"
 
-        now = time()
-
-        # 2) Cached or fresh Discord API call
-        if (self._api_call_cache is None or
-            now - self._api_call_cache["ts"] > self._api_call_ttl):
-            api_start = perf_counter()
-            api_ok = True
-            try:
-                await self.bot.fetch_channel(TICKET_CHANNEL_ID)
-            except Exception:
-                api_ok = False
-            api_ms = round((perf_counter() - api_start) * 1000)
-            self._api_call_cache = {"ok": api_ok, "ms": api_ms, "ts": now}
-        else:
-            api_ok = self._api_call_cache["ok"]
-            api_ms = self._api_call_cache["ms"]
+        # 2) Discord API round-trip
+        api_ok = prober.rest_ok is not False
+        api_ms = api["p50"] or 0
         api_emoji = "📡❌" if not api_ok or api_ms >= 500 else "📡⚠️" if api_ms >= 200 else "📡✅"
 
-        # 3) Cached or fresh Discord public status
-        if (self._discord_status_cache is None or
-            now - self._discord_status_cache["ts"] > self._discord_status_ttl):
-            status_start = perf_counter()
-            try:
-                async with aiohttp.ClientSession() as sess:
-                    async with sess.get("https://status.discord.com/api/v2/status.json") as resp:
-                        j = await resp.json()
-                        ds_desc = j["status"]["description"]
-            except Exception:
-                ds_desc = "Fetch Failed"
-            status_ms = round((perf_counter() - status_start) * 1000)
-            self._discord_status_cache = {
-                "description": ds_desc,
-                "ms": status_ms,
-                "ts": now
-            }
-        else:
-            ds_desc = self._discord_status_cache["description"]
-            status_ms = self._discord_status_cache["ms"]
-
-        # 4) Total command time
-        total_ms = round((perf_counter() - overall_start) * 1000)
-
-        # 5) Choose embed color by worst metric
-        if hb_ms >= 300 or not api_ok:
+        # 3) Choose embed color by worst metric
+        if hb_ms >= 300 or not api_ok or prober.db_ok is False:
             color = discord.Color.red()
         elif hb_ms >= 100 or api_ms >= 200:
             color = discord.Color.orange()
         else:
             color = discord.Color.green()
 
-        # 6) Build embed with formatted code blocks
+        # 4) Build embed with formatted code blocks (p50 / p95)
         embed = discord.Embed(title="🤖 Bot Status", color=color)
+        embed.add_field(name=f"{hb_emoji} Heartbeat", value=f"```{_p50_p95(hb)}```", inline=True)
+        embed.add_field(name=f"{api_emoji} API Call", value=f"```{_p50_p95(api)}```", inline=True)
         embed.add_field(
-            name=f"{hb_emoji} Heartbeat",
-            value=f"```{hb_ms} ms```",
+            name="🗄 Database" + (" ❌" if prober.db_ok is False else ""),
+            value=f"```{_p50_p95(db)}```",
             inline=True
         )
         embed.add_field(
-            name=f"{api_emoji} API Call",
-            value=f"```{api_ms} ms```",
+            name="🌀 Event Loop Lag",
+            value=f"```{_p50_p95(lag)} (max {fmt_ms(lag['max'])})```",
             inline=True
         )
         embed.add_field(
-            name=f"📶 Discord Status ({status_ms} ms)",
-            value=f"```{ds_desc}```",
+            name=f"📶 Discord Status ({fmt_ms(page['last'])})",
+            value=f"```{prober.status_desc or 'not checked yet'}```",
             inline=False
         )
-        embed.add_field(
-            name="⏱ Total Time",
-            value=f"```{total_ms} ms```",
-            inline=True
-        )
+        if LOOPS:
+            now = time()
+            lines = []
+            for name, stats in LOOPS.items():
+                if stats.last_run is None:
+                    lines.append(f"{name}: not run yet")
+                    continue
+                snap = stats.durations.snapshot()
+                lines.append(
+                    f"{'' if stats.last_ok else '❌ '}{name}: {now - stats.last_run:.0f}s ago, "
+                    f"{fmt_ms(snap['last'])} (p95 {fmt_ms(snap['p95'])})"
+                )
+            embed.add_field(name="🔁 Task Loops", value=f"```{chr(10).join(lines)[:1000]}```", inline=False)
+
+        internals = collect()
+        if internals:
+            lines = "\n".join(f"{name}: {summary}" for name, summary in internals.items())
+            embed.add_field(
+                name="📈 Internals",
+                value=f"```{lines[:1000]}```",
+                inline=False
+            )
 
-        await interaction.followup.send(embed=embed)
+        # 5) Total command time
+        total_ms = round((perf_counter() - overall_start) * 1000)
+        embed.add_field(name="⏱ Total Time", value=f"```{total_ms} ms```", inline=True)
+        sampled = f"sampled {time() - prober.sampled_at:.0f}s ago" if prober.sampled_at else "no samples yet"
+        embed.set_footer(text=f"p50 / p95 over the last {prober.window / 3600:g} h · {sampled}")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="contactmatt",
         description="📱 Alert Matt via Pushover with a reason"
     )
     @app_commands.describe(reason="Why are you contacting Matt?")
+    @require_tier("chief", "❌ You don’t have permission to use this.")
     async def contactmatt(
         self,
         interaction: discord.Interaction,
         reason: str
     ):
-        CHIEF_ROLE_ID = 958272560905195521  # ← replace with your CHIEF role ID
-
-        # 1) permission check
-        if CHIEF_ROLE_ID not in (r.id for r in interaction.user.roles):
-            return await interaction.response.send_message(
-                "❌ You don’t have permission to use this.", ephemeral=True
-            )
-
-        # 2) defer so we can do the HTTP request
+        # 1) defer so we can do the HTTP request
         await interaction.response.defer(ephemeral=True)
 
-        # 3) build the Pushover message
+        # 2) build the Pushover message
         user_display = interaction.user.display_name
         pushover_msg = f"🐱‍💻 /contactmatt by **{user_display}**\n> {reason}"
 
-        # 4) fire off to Pushover
+        # 3) fire off to Pushover
         async with aiohttp.ClientSession() as session:
             payload = {
                 "token": self.pushover_token,
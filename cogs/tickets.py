@@ -11,6 +11,9 @@ from config import *
 from messages import OPEN_TICKET_EMBED_TEXT
 from cogs.helpers import *
 from cogs.db_utils import *
+from cogs.pagination import PageSource, register_page_source, send_paginated
+from cogs.guild_resources import require_tier
+from cogs.metrics import track_loop
 
 # -------------------------------
 # Persistent Views and Modals
@@ -39,15 +42,15 @@ class CloseThreadView(discord.ui.View):
             )
 
         if ticket_data[3] == "recruiters":
-            closing_role = interaction.client.resources.recruiter_role
+            closing_tier = "recruiter"
         elif ticket_data[3] == "botdeveloper":
-            closing_role = interaction.client.resources.lead_dev_role
+            closing_tier = "lead_dev"
         else:
-            closing_role = interaction.client.resources.leadership_role
+            closing_tier = "leadership"
 
         # for internal tickets (ticket_type == "other"), allow any thread member to close
         if ticket_data[3] != "other":
-            if closing_role not in interaction.user.roles and interaction.user.id != int(ticket_data[1]):
+            if not interaction.client.resources.has_tier(interaction.user, closing_tier) and interaction.user.id != int(ticket_data[1]):
                 return await interaction.response.send_message(
                     "❌ You do not have permission to close this ticket.",
                     ephemeral=True
@@ -207,6 +210,22 @@ class TicketView(discord.ui.View):
         await add_ticket(str(thread.id), str(interaction.user.id), now_str, ticket_type)
         await interaction.followup.send("✅ Your ticket has been created!", ephemeral=True)
 
+# -------------------------------
+# Active LOA list
+# -------------------------------
+def _format_loa_row(interaction: discord.Interaction, rec: dict) -> str:
+    member = interaction.guild.get_member(int(rec["user_id"])) if interaction.guild else None
+    user_display = member.display_name if member else f"<@{rec['user_id']}>"
+    thread = interaction.client.get_channel(int(rec["thread_id"]))
+    thread_mention = thread.mention if thread else f"<#{rec['thread_id']}>"
+    return f"**{user_display}** — Ends: {d_timestamp(rec['end_date'])} | Thread: {thread_mention}"
+
+register_page_source(PageSource(
+    "loas", "Active LOAs", get_active_loa_page,
+    lambda r: (r["end_date"], r["thread_id"]), _format_loa_row,
+    "✅ There are currently no active LOAs."
+))
+
 # -------------------------------
 # Ticket Cog
 # -------------------------------
@@ -215,7 +234,6 @@ class TicketCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.active_tickets: Dict[str, Any] = {}
-        self.ticket_embed_id: Optional[int] = None
         # kick off DB/init once ready
         self.bot.loop.create_task(self._init_dbs())
 
@@ -228,22 +246,20 @@ class TicketCog(commands.Cog):
         # load existing tickets into memory
         await self.load_existing_tickets()
 
-        # grab the stored embed ID just once
-        stored = await get_stored_embed("tickets_embed")
-        if stored and stored.get("message_id"):
-            self.ticket_embed_id = int(stored["message_id"])
-
         # register our views & start loops
         self.bot.add_view(TicketView())
         self.bot.add_view(CloseThreadView())
+        self.bot.embeds.register("tickets_embed", self._render_ticket_embed)
         self.ensure_ticket_embed_task.start()
-        self.loa_reminder_task.start()
-        self.ticket_done_task.start()
+        self.bot.scheduler.register_handler(JOB_LOA_EXPIRY, self.send_loa_expiry_pings)
+        self.bot.scheduler.register_handler(JOB_TICKET_LOCK, self.lock_done_tickets)
         log("Tickets cog fully initialized")
 
     def cog_unload(self):
         self.ensure_ticket_embed_task.cancel()
-        self.loa_reminder_task.cancel()
+        self.bot.embeds.unregister("tickets_embed")
+        self.bot.scheduler.unregister_handler(JOB_LOA_EXPIRY)
+        self.bot.scheduler.unregister_handler(JOB_TICKET_LOCK)
         log("TicketCog unloaded; tasks canceled.")
 
 
@@ -251,27 +267,16 @@ class TicketCog(commands.Cog):
     # Ensure Ticket Embed in Channel
     # -------------------------------
     @tasks.loop(minutes=5)
+    @track_loop("tickets.ensure_ticket_embed_task")
     async def ensure_ticket_embed_task(self):
         await self.bot.wait_until_ready()
-        ch = self.bot.resources.ticket_ch
-        if ch is None:
+        if self.bot.resources.ticket_ch is None:
             log(f"Ticket channel {TICKET_CHANNEL_ID} not found.", level="error")
             return
+        # no REST call unless the embed was deleted or its content changed
+        await self.bot.embeds.refresh("tickets_embed")
 
-        # If we _haven't_ loaded an ID yet, or if the message is missing, recreate it:
-        if not self.ticket_embed_id:
-            return await self._create_ticket_embed(ch)
-
-        try:
-            # single fetch to verify it still exists
-            await ch.fetch_message(self.ticket_embed_id)
-        except discord.NotFound:
-            # if it's gone, create a new one
-            await self._create_ticket_embed(ch)
-        except Exception as e:
-            log(f"Error fetching stored ticket embed {self.ticket_embed_id}: {e}", level="warning")
-
-    async def _create_ticket_embed(self, ch: discord.TextChannel):
+    async def _render_ticket_embed(self):
         description = (
             OPEN_TICKET_EMBED_TEXT
             .replace("{leadership_emoji}", LEADERSHIP_EMOJI)
@@ -279,11 +284,7 @@ class TicketCog(commands.Cog):
             .replace("{leaddeveloper_emoji}", LEAD_BOT_DEVELOPER_EMOJI)
         )
         embed = discord.Embed(title="🎟️ Open a Ticket", description=description, colour=0x28afcc)
-        msg = await ch.send(embed=embed, view=TicketView())
-        # cache and persist
-        self.ticket_embed_id = msg.id
-        await set_stored_embed("tickets_embed", str(msg.id), str(ch.id))
-        log(f"New ticket embed created and stored: {msg.id}")
+        return self.bot.resources.ticket_ch, embed, TicketView()
 
     # -------------------------------
     # Load Existing Tickets on Start
@@ -309,15 +310,12 @@ class TicketCog(commands.Cog):
     # -------------------------------
 
     @app_commands.command(name="loa_accept", description="Accept the LOA request on this thread.")
+    @require_tier("leadership", "❌ Only leadership can accept LOA.")
     async def loa_accept(self, interaction: discord.Interaction):
         thread = interaction.channel
         if not isinstance(thread, discord.Thread):
             return await interaction.response.send_message("❌ Use this inside a LOA thread.", ephemeral=True)
 
-        leadership_role = interaction.client.resources.leadership_role
-        if leadership_role not in interaction.user.roles:
-            return await interaction.response.send_message("❌ Only leadership can accept LOA.", ephemeral=True)
-
         ticket = await get_ticket_info(str(thread.id))
         if not ticket or ticket[3] != "loa":
             return await interaction.response.send_message("❌ This is not a LOA ticket.", ephemeral=True)
@@ -359,16 +357,12 @@ class TicketCog(commands.Cog):
 
     @app_commands.command(name="loa_extend", description="Extend an existing LOA by days or until a given date.")
     @app_commands.describe(days="Number of days to extend", until="New end date DD-MM-YYYY")
+    @require_tier("leadership", "❌ Only leadership can extend LOA.")
     async def loa_extend(self, interaction: discord.Interaction, days: int = None, until: str = None):
         thread = interaction.channel
         if not isinstance(thread, discord.Thread):
             return await interaction.response.send_message("❌ Use this inside a LOA thread.", ephemeral=True)
 
-        # Only leadership may run this
-        leadership_role = interaction.client.resources.leadership_role
-        if leadership_role not in interaction.user.roles:
-            return await interaction.response.send_message("❌ Only leadership can extend LOA.", ephemeral=True)
-
         # Must have an active LOA reminder
         loa = await get_loa_reminder(str(thread.id))
         if not loa:
@@ -405,16 +399,12 @@ class TicketCog(commands.Cog):
 
 
     @app_commands.command(name="loa_remove", description="Remove the LOA reminder for this thread.")
+    @require_tier("leadership", "❌ Only leadership can remove LOA.")
     async def loa_remove(self, interaction: discord.Interaction):
         thread = interaction.channel
         if not isinstance(thread, discord.Thread):
             return await interaction.response.send_message("❌ Use this inside a LOA thread.", ephemeral=True)
 
-        # Only leadership may run this
-        leadership_role = interaction.client.resources.leadership_role
-        if leadership_role not in interaction.user.roles:
-            return await interaction.response.send_message("❌ Only leadership can remove LOA.", ephemeral=True)
-
         if not await get_loa_reminder(str(thread.id)):
             return await interaction.response.send_message("❌ No LOA to remove.", ephemeral=True)
 
@@ -428,47 +418,9 @@ class TicketCog(commands.Cog):
         )
 
     @app_commands.command(name="loa_list", description="List all active LOAs with user, end date, and thread.")
+    @require_tier("leadership", "❌ Only leadership can view active LOAs.")
     async def loa_list(self, interaction: discord.Interaction):
-        # Only leadership may run this
-        leadership_role = interaction.client.resources.leadership_role
-        if leadership_role not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ Only leadership can view active LOAs.", ephemeral=True
-            )
-        
-        # Get all active LOAs
-        rows = await get_active_loa_reminders()
-
-        if not rows:
-            return await interaction.response.send_message(
-                "✅ There are currently no active LOAs.", ephemeral=True
-            )
-
-        embed = discord.Embed(title="Active LOAs", color=discord.Color.blue())
-        for rec in rows:
-            # pull out each field by its key
-            thread_id     = rec["thread_id"]
-            user_id       = rec["user_id"]
-            end_date_iso  = rec["end_date"]
-
-            # Resolve user display name
-            member = interaction.guild.get_member(int(user_id))
-            user_display = member.display_name if member else f"<@{user_id}>"
-
-            # Resolve (and mention) the thread
-            thread = self.bot.get_channel(int(thread_id))
-            thread_mention = thread.mention if thread else f"<#{thread_id}>"
-
-            # Format end date
-            end_date_str = d_timestamp(end_date_iso)
-
-            embed.add_field(
-                name=user_display,
-                value=f"Ends: {end_date_str}\nThread: {thread_mention}",
-                inline=False
-            )
-
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_paginated(interaction, "loas")
 
     @app_commands.command(
         name="loa_custom",
@@ -477,6 +429,7 @@ class TicketCog(commands.Cog):
     @app_commands.describe(
         date="New end date in DD-MM-YYYY format"
     )
+    @require_tier("leadership", "❌ Only leadership can override an LOA.")
     async def loa_custom(self, interaction: discord.Interaction, date: str):
         thread = interaction.channel
         # 1) Must be in a thread
@@ -485,21 +438,14 @@ class TicketCog(commands.Cog):
                 "❌ Use this inside a LOA thread.", ephemeral=True
             )
 
-        # 2) Only leadership
-        leadership = interaction.client.resources.leadership_role
-        if leadership not in interaction.user.roles:
-            return await interaction.response.send_message(
-                "❌ Only leadership can override an LOA.", ephemeral=True
-            )
-
-        # 3) Must be a LOA ticket
+        # 2) Must be a LOA ticket
         ticket = await get_ticket_info(str(thread.id))
         if not ticket or ticket[3] != "loa":
             return await interaction.response.send_message(
                 "❌ This is not a LOA ticket.", ephemeral=True
             )
 
-        # 4) Parse the new date
+        # 3) Parse the new date
         from datetime import datetime
         try:
             new_dt = datetime.strptime(date, "%d-%m-%Y").date()
@@ -512,7 +458,7 @@ class TicketCog(commands.Cog):
                 "❌ End date cannot be in the past.", ephemeral=True
             )
 
-        # 5) Update the embed in the thread to show the new date
+        # 4) Update the embed in the thread to show the new date
         import re
         async for msg in thread.history(limit=10):
             if msg.author == interaction.client.user and msg.embeds:
@@ -527,11 +473,11 @@ class TicketCog(commands.Cog):
                 await msg.edit(embed=emb)
                 break
 
-        # 6) Schedule the LOA reminder (same as loa_accept)
+        # 5) Schedule the LOA reminder (same as loa_accept)
         new_iso = new_dt.isoformat()
         await add_loa_reminder(str(thread.id), ticket[1], new_iso)
 
-        # 7) Confirm+close thread
+        # 6) Confirm+close thread
         await interaction.response.send_message(
             embed=discord.Embed(
                 title=f"✅ LOA end date updated to {date} and reminder scheduled.",
@@ -542,20 +488,20 @@ class TicketCog(commands.Cog):
         await thread.edit(archived=True, locked=False)
 
     # -------------------------------
-    # LOA Expiration Background Task
+    # LOA Expiry & Ticket Auto-Lock (scheduler handlers)
     # -------------------------------
 
-    @tasks.loop(hours=1)
-    async def loa_reminder_task(self):
-        await self.bot.wait_until_ready()
-        expired = await get_expired_loa()
-        for thread_id, user_id in expired:
+    async def send_loa_expiry_pings(self, thread_ids: list):
+        for thread_id, user_id in await get_expired_loa(thread_ids):
             # Try to fetch the thread even if it's archived
             thread = self.bot.get_channel(int(thread_id))
             if thread is None:
                 try:
                     thread = await self.bot.fetch_channel(int(thread_id))
-                except discord.HTTPException:
+                except discord.HTTPException as e:
+                    log(f"Failed to fetch LOA thread {thread_id}: {e}", level="error")
+                    # the job is completed once we return; retry in an hour
+                    await schedule_job(JOB_LOA_EXPIRY, thread_id, datetime.now().timestamp() + 3600)
                     continue
 
             # Attempt to unarchive, send the reminder, then re‑archive
@@ -569,16 +515,15 @@ class TicketCog(commands.Cog):
                 # await thread.edit(archived=True)
             except Exception as e:
                 log(f"Failed to send LOA expiry ping in thread {thread_id}: {e}", level="error")
-                # Do not mark as sent; we'll retry next loop
+                # Do not mark as sent; retry in an hour
+                await schedule_job(JOB_LOA_EXPIRY, thread_id, datetime.now().timestamp() + 3600)
                 continue
 
             # Only mark as sent after a successful send
             await mark_reminder_sent(thread_id)
 
-    @tasks.loop(minutes=5) ## CHANGE FOR PRODUCTION
-    async def ticket_done_task(self):
-        await self.bot.wait_until_ready()
-        for tid in await get_tickets_to_lock():
+    async def lock_done_tickets(self, thread_ids: list):
+        for tid in await get_tickets_to_lock(thread_ids):
             try:
                 # fetch or load the thread
                 thread = (
@@ -588,10 +533,7 @@ class TicketCog(commands.Cog):
                 if not thread:
                     continue
 
-                # 1) remove from tickets table (just like /ticket_close)
-                await remove_ticket(tid)
-
-                # 2) send the close embed
+                # 1) send the close embed
                 embed = discord.Embed(
                     title="Ticket closed automatically",
                     colour=0xf51616
@@ -599,38 +541,29 @@ class TicketCog(commands.Cog):
                 embed.set_footer(text="🔒This ticket is locked now!")
                 await thread.send(embed=embed)
 
-                # 3) lock & archive thread
+                # 2) lock & archive thread
                 await thread.edit(locked=True, archived=True)
                 log(f"Ticket {tid} auto-closed and locked.")
 
-                # 4) clear the done flag so we don’t run again
-                await clear_ticket_done(tid)
+                # 3) remove from tickets table (just like /ticket_close) only once
+                #    locked, so a failure above leaves the ticket for the retry
+                await remove_ticket(tid)
 
             except Exception as e:
                 log(f"Error auto-closing ticket {tid}: {e}", level="error")
+                # the job is completed once we return; retry in 5 minutes
+                await schedule_job(JOB_TICKET_LOCK, tid, datetime.now().timestamp() + 300)
 
     # -------------------------------
     # Existing Commands (unchanged)
     # -------------------------------
 
     @app_commands.command(name="ticket_internal", description="Creates a ticket without pinging anybody!")
+    @require_tier("staff", "❌ You do not have permission to open a private ticket.")
     async def ticket_internal(self, interaction: discord.Interaction):
         now_str = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
         if not interaction.guild or interaction.guild.id != GUILD_ID:
             return await interaction.response.send_message("❌ This command can only be used in the specified guild.", ephemeral=True)
-
-        leadership_role = interaction.client.resources.leadership_role
-        recruiter_role   = interaction.client.resources.recruiter_role
-
-        # build a list of the configured “allowed” roles
-        allowed = [r for r in (leadership_role, recruiter_role) if r]
-
-        # if none of the allowed roles are on the user, deny
-        if not any(role in interaction.user.roles for role in allowed):
-            return await interaction.response.send_message(
-                "❌ You do not have permission to open a private ticket.",
-                ephemeral=True
-            )
         channel = self.bot.get_channel(TICKET_CHANNEL_ID)
         if not channel:
             return await interaction.response.send_message("❌ Ticket channel not found", ephemeral=True)
@@ -666,7 +599,7 @@ class TicketCog(commands.Cog):
                 interaction.user,
                 f"User has opened an internal ticket. (Thread ID: <#{thread.id}>)"
             )
-            await activity_channel.send(embed=embed)
+            interaction.client.outbound.send(activity_channel, embed=embed)
 
     @app_commands.command(name="ticket_info", description="Show info about the current ticket thread.")
     async def ticket_info(self, interaction: discord.Interaction):
@@ -712,6 +645,7 @@ class TicketCog(commands.Cog):
         app_commands.Choice(name=label, value=label)
         for label in ADDABLE_ROLES.keys()
     ])
+    @require_tier("staff", "❌ You don’t have permission to add users or ping groups.")
     async def ticket_add(
         self,
         interaction: discord.Interaction,
@@ -732,13 +666,6 @@ class TicketCog(commands.Cog):
                 "❌ This thread isn’t a registered ticket.", ephemeral=True
             )
 
-        recruiter = interaction.client.resources.recruiter_role
-        leadership = interaction.client.resources.leadership_role
-        if not any(r in interaction.user.roles for r in (recruiter, leadership)):
-            return await interaction.response.send_message(
-                "❌ You don’t have permission to add users or ping groups.", ephemeral=True
-            )
-
         if (user and group) or (not user and not group):
             return await interaction.response.send_message(
                 "❌ Provide exactly one of `user` or `group`.", ephemeral=True
@@ -774,6 +701,7 @@ class TicketCog(commands.Cog):
     @app_commands.describe(
         name="The new name for this ticket thread",
     )
+    @require_tier("staff", "❌ You do not have permission to rename this ticket.")
     async def ticket_rename(
         self,
         interaction: discord.Interaction,
@@ -793,10 +721,6 @@ class TicketCog(commands.Cog):
                 "❌ This thread isn’t a registered ticket.", ephemeral=True
             )
 
-        if not interaction.client.resources.recruiter_role in interaction.user.roles and not interaction.client.resources.leadership_role in interaction.user.roles:
-                return await interaction.response.send_message(
-                   "❌ You do not have permission to rename this ticket.", ephemeral=True)
-
         try:
             if not name:
                 return await interaction.response.send_message(
@@ -839,15 +763,15 @@ class TicketCog(commands.Cog):
             )
 
         if ticket_data[3] == "recruiters":
-            closing_role = interaction.client.resources.recruiter_role
+            closing_tier = "recruiter"
         elif ticket_data[3] == "botdeveloper":
-            closing_role = interaction.client.resources.lead_dev_role
+            closing_tier = "lead_dev"
         else:
-            closing_role = interaction.client.resources.leadership_role
+            closing_tier = "leadership"
 
         # for internal tickets (ticket_type == "other"), allow any thread member to close
         if ticket_data[3] != "other":
-            if closing_role not in interaction.user.roles and interaction.user.id != int(ticket_data[1]):
+            if not interaction.client.resources.has_tier(interaction.user, closing_tier) and interaction.user.id != int(ticket_data[1]):
                 return await interaction.response.send_message(
                     "❌ You do not have permission to close this ticket.",
                     ephemeral=True
@@ -889,13 +813,12 @@ class TicketCog(commands.Cog):
 
         # Neue Rechte-Logik:
         ticket_type = ticket_data[3]  # "other", "recruiters", "botdeveloper", usw.
-        leadership = interaction.client.resources.leadership_role
-        recruiter  = interaction.client.resources.recruiter_role
+        resources = interaction.client.resources
 
         # Leadership darf immer, Recruiter nur für interne ("other") oder Recruiter-Tickets
         if not (
-            leadership in interaction.user.roles
-            or (recruiter in interaction.user.roles and ticket_type in ("other", "recruiters"))
+            resources.has_tier(interaction.user, "leadership")
+            or (resources.has_tier(interaction.user, "recruiter") and ticket_type in ("other", "recruiters"))
         ):
             return await interaction.response.send_message(
                 "❌ You don’t have permission to mark this done.", ephemeral=True
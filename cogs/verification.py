@@ -3,32 +3,21 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import asyncio, aiohttp, time
+import asyncio, heapq, time
 from datetime import datetime
 from config import *
 from cogs.helpers import *
+from cogs.cnr_client import CnRMemberClient, is_cnr_verified
+from cogs.metrics import RollingStats, fmt_ms, register_source, unregister_source
+from cogs.db_utils import (
+    JOB_GUEST_SWEEP, ensure_job, schedule_job, init_scheduled_jobs_db, get_bot_state, set_bot_state,
+)
 
-# -----------------------------------------------------------------------------
-# 1) A small helper for doing the external CnR lookup
-# -----------------------------------------------------------------------------
-
-async def fetch_cnr_member(session: aiohttp.ClientSession, user_id: int, token: str):
-    url = f"https://discord.com/api/v9/guilds/{CNR_ID}/members/{user_id}"
-    headers = {
-        "Authorization": token,
-        "Content-Type": "application/json",
-    }
-    async with session.get(url, headers=headers) as resp:
-        data = None
-        try:
-            data = await resp.json()
-        except:
-            pass
-        return resp.status, data or {}
-
+GUEST_SWEEP_KEY    = "guests"
+GUEST_SWEEP_CURSOR = "guest_sweep_cursor"     # bot_state: last member ID checked in the current sweep
 
 # -----------------------------------------------------------------------------
-# 2) The “Verify” button view
+# 1) The “Verify” button view
 # -----------------------------------------------------------------------------
 
 class VerifyView(discord.ui.View):
@@ -62,15 +51,16 @@ class VerifyView(discord.ui.View):
             return await interaction.response.send_message(
                 "⚠️ Please wait before retrying verification.", ephemeral=True
             )
+        # forget expired cooldowns so the dict doesn't keep every guest forever
+        self.cooldowns = {uid: ts for uid, ts in self.cooldowns.items() if now - ts < 300}
         self.cooldowns[user.id] = now
 
 
-        # 3) do the same external check
+        # 3) do the same external check (cached, see CnRMemberClient)
         await interaction.response.defer(ephemeral=True)
-        async with aiohttp.ClientSession() as session:
-            status, member_data = await fetch_cnr_member(session, user.id, self.cog.account_token)
+        status, member_data = await self.cog.cnr.lookup(user.id)
 
-        if status == 200 and str(CHECK_CNR_VERIFIED_ROLE) in member_data.get("roles", []):
+        if is_cnr_verified(status, member_data):
             log(f"User {user.id} verified successfully.")
             # success: give role, remove guest
             try:
@@ -90,7 +80,7 @@ class VerifyView(discord.ui.View):
                     "verification", "Manual verify succeeded", user,
                     "User manually verified."
                 )
-                await activity_ch.send(embed=e)
+                interaction.client.outbound.send(activity_ch, embed=e)
 
         else:
             await interaction.followup.send(
@@ -105,10 +95,10 @@ class VerifyView(discord.ui.View):
                     user,
                     "User tried to verify manually but failed."
                 )
-                await activity_ch.send(embed=e)
+                interaction.client.outbound.send(activity_ch, embed=e)
 
 # -----------------------------------------------------------------------------
-# 3) The VerificationCog itself
+# 2) The VerificationCog itself
 # -----------------------------------------------------------------------------
 
 class VerificationCog(commands.Cog):
@@ -121,11 +111,39 @@ class VerificationCog(commands.Cog):
         self.resources = bot.resources
         # config
         self.account_token = open("account_token.txt", "r").read().strip()
+        # one pooled session + result cache for the CnR member lookups
+        self.cnr = CnRMemberClient(self.account_token)
         # placeholders to fill in on_ready
         # will hold our “Click to Verify” message ID
         self.verify_msg_id: int | None = None
+        # one view instance, so button cooldowns survive a re-send
+        self.verify_view = VerifyView(self)
+        # joins are verified by a fixed pool of workers (see on_member_join)
+        self.verify_queue: asyncio.Queue = asyncio.Queue()
+        self._queued: dict[int, float] = {}     # member_id -> monotonic join time, while queued
+        self._workers: list[asyncio.Task] = []
+        self._active = 0
+        self._join_results: list = []           # (member, verified, reason) awaiting the batch log
+        self._log_task: asyncio.Task | None = None
+        self.join_latency = RollingStats(maxlen=5000, window=300)   # join -> done, ms
+        self.processed = 0
+        self.skipped   = 0
+        # guests are re-checked in pages by a scheduled job (see sweep_guests)
+        self.sweep_checked  = 0
+        self.sweep_promoted = 0
+        self.bot.scheduler.register_handler(JOB_GUEST_SWEEP, self.sweep_guests)
+        register_source("verification", self.describe)
         log("VerificationCog loaded.")
 
+    async def cog_unload(self):
+        self.bot.embeds.unregister("verification_embed")
+        unregister_source("verification")
+        self.bot.scheduler.unregister_handler(JOB_GUEST_SWEEP)
+        for task in self._workers + [self._log_task]:
+            if task:
+                task.cancel()
+        await self.cnr.close()
+
     def create_embed(self, title: str, description: str, colour: int) -> discord.Embed:
         embed = discord.Embed(title=title, description=description, colour=colour)
         embed.set_author(name="S.W.A.T Verification Bot")
@@ -148,6 +166,10 @@ class VerificationCog(commands.Cog):
         # 3) restore—or create—the manual-verify embed (and register its view)
         await self._ensure_manual_verify_embed()
 
+        # 4) make sure a guest sweep is scheduled (an existing one is kept)
+        await init_scheduled_jobs_db()
+        await ensure_job(JOB_GUEST_SWEEP, GUEST_SWEEP_KEY, time.time() + GUEST_SWEEP_PAGE_DELAY)
+
         log("VerificationCog is fully initialized.")
 
     async def _wait_for_resources(self):
@@ -162,23 +184,7 @@ class VerificationCog(commands.Cog):
         # make sure our table exists
         await init_stored_embeds_db()
 
-    async def _ensure_manual_verify_embed(self):
-        stored = await get_stored_embed("verification_embed")
-
-        if stored:
-            try:
-                ch  = self.bot.get_channel(int(stored["channel_id"]))
-                msg = await ch.fetch_message(int(stored["message_id"]))
-                # re-attach your custom VerifyView
-                self.bot.add_view(VerifyView(self), message_id=msg.id)
-                self.verify_msg_id = msg.id
-                log(f"Restored verify embed {msg.id}")
-                return
-            except discord.NotFound:
-                log("Stored verify embed not found, recreating.", level="warning")
-
-        # no valid stored message → send new
-        view = VerifyView(self)
+    async def _render_verify_embed(self):
         embed = self.create_embed(
             "🔒 Verification Required",
             "If you’re seeing this channel, it means your verification has **not been completed.**\n\n"
@@ -188,94 +194,250 @@ class VerificationCog(commands.Cog):
             0x3ec62f
         )
         embed.set_footer(text="S.W.A.T Verification Manager")
-        log(f"Sending new verify embed to {self.verify_ch.id}.")
-        msg = await self.verify_ch.send(embed=embed, view=view)
-        self.bot.add_view(view, message_id=msg.id)
-        await set_stored_embed("verification_embed", msg.id, self.verify_ch.id)
-        self.verify_msg_id = msg.id
-        log(f"Posted new verify embed {msg.id}")
+        return self.verify_ch, embed, self.verify_view
 
+    async def _ensure_manual_verify_embed(self):
+        # restored, edited or re-sent by bot.embeds; deletions are picked up from events
+        self.bot.embeds.register("verification_embed", self._render_verify_embed)
+        msg_id = await self.bot.embeds.refresh("verification_embed")
+        if msg_id:
+            # re-attach the VerifyView to the (possibly restored) message
+            self.bot.add_view(self.verify_view, message_id=msg_id)
+            self.verify_msg_id = msg_id
+            log(f"Verify embed ready: {msg_id}")
+
+    # -------------------------------
+    # Join verification queue
+    # -------------------------------
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
-        await asyncio.sleep(2)  # let Discord finish onboarding
+        # a join raid must not turn into hundreds of concurrent lookups:
+        # queue the member and let the worker pool get to them
+        if member.id in self._queued:
+            return
+        self._queued[member.id] = time.monotonic()
+        self.verify_queue.put_nowait(member.id)
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < VERIFY_WORKERS:
+            self._workers.append(asyncio.create_task(self._verify_worker()))
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        # still queued -> the worker skips them without a lookup
+        self._queued.pop(member.id, None)
+
+    async def _verify_worker(self):
+        while True:
+            member_id = await self.verify_queue.get()
+            self._active += 1
+            try:
+                joined_at = self._queued.get(member_id)
+                if joined_at is None:
+                    self.skipped += 1
+                    log(f"Member {member_id} left before we could verify.", level="warning")
+                    continue
+                # let Discord finish onboarding (the queue is in join order)
+                wait = VERIFY_JOIN_DELAY - (time.monotonic() - joined_at)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                result = await self._verify_join(member_id)
+                if result is None:
+                    self.skipped += 1
+                else:
+                    self.processed += 1
+                    self.join_latency.add((time.monotonic() - joined_at) * 1000)
+                    self._join_results.append(result)
+                    if self._log_task is None or self._log_task.done():
+                        self._log_task = asyncio.create_task(self._flush_join_log())
+            except Exception as e:
+                log(f"Verification of {member_id} failed: {e}", level="error")
+            finally:
+                self._queued.pop(member_id, None)
+                self._active -= 1
+                self.verify_queue.task_done()
+
+    async def _verify_join(self, member_id: int):
+        """Verifies one new member. Returns (member, verified, reason), or None if they left."""
         res = await self.resources.ready()
 
         # try to get them from the cache
-        m = self.guild.get_member(member.id)
+        guild = self.bot.get_guild(GUILD_ID)
+        m = guild.get_member(member_id) if guild else None
         if not m:
-            log(f"Member {member.id} left before we could verify.", level="warning")
-            return
-
-        # perform the same external check
-        async with aiohttp.ClientSession() as session:
-            status, data = await fetch_cnr_member(session, member.id, self.account_token)
+            log(f"Member {member_id} left before we could verify.", level="warning")
+            return None
 
-        # reference your cached roles & channel
-        ver = self.verified_role
-        gue = self.guest_role
-        act = self.activity_ch
+        # perform the same external check (rate limited & retried by CnRMemberClient)
+        status, data = await self.cnr.lookup(member_id)
 
         # handle success
-        if status == 200 and str(CHECK_CNR_VERIFIED_ROLE) in data.get("roles", []):
+        if is_cnr_verified(status, data):
             try:
-                await m.add_roles(ver)
+                await m.add_roles(res.verified_role)
             except:
-                log(f"Cannot assign verified to {member.id}", level="error")
+                log(f"Cannot assign verified to {member_id}", level="error")
             # DM
             embed = self.create_embed(
                 "✅ Automatic Verification Successful",
-                f"Hey {data.get('nick', member.name)}, you have been successfully verified via our CnR database!",
+                f"Hey {data.get('nick', m.name)}, you have been successfully verified via our CnR database!",
                 0x1cd946
             )
-            log(f"Assigned verified role to {member.id}.")
+            log(f"Assigned verified role to {member_id}.")
             await self._safe_dm(m, embed)
-            # log
-            if act:
-                e = create_user_activity_log_embed(
-                    "verification", "Successful verification", member,
-                    "Automatically verified on join."
-                )
-                await act.send(embed=e)
-                log(f"Logged verification for {member.id}.")
+            return m, True, "Automatically verified on join."
 
         # all failures funnel through here
-        else:
-            # DM fail
-            embed = self.create_embed(
-                "❌ Automatic Verification Failed",
-                (
-                    f"Hey {member.name}, we could **not** verify you in our CnR database. "
-                    "Please ensure you are verified on the CnR Discord, and then click "
-                    "the verify button here: <#1370260376276697140>"
-                ),
-                0xf40000
+        # DM fail
+        embed = self.create_embed(
+            "❌ Automatic Verification Failed",
+            (
+                f"Hey {m.name}, we could **not** verify you in our CnR database. "
+                "Please ensure you are verified on the CnR Discord, and then click "
+                "the verify button here: <#1370260376276697140>"
+            ),
+            0xf40000
+        )
+        await self._safe_dm(m, embed)
+
+        # give guest
+        try:
+            await m.add_roles(res.guest_role)
+            log(f"Assigned guest role to {member_id}.")
+        except:
+            log(f"Cannot assign guest to {member_id}", level="error")
+
+        # choose a human-readable reason
+        reason = (
+            "User not found in the CnR Discord"
+            if status == 404 else
+            "Missing CnR-verified role"
+            if status == 200 else
+            f"API error (status {status})"
+        )
+        return m, False, reason
+
+    async def _flush_join_log(self):
+        """One activity log per VERIFY_LOG_WINDOW seconds of join results."""
+        await asyncio.sleep(VERIFY_LOG_WINDOW)
+        results, self._join_results = self._join_results, []
+        act = self.resources.activity_ch
+        if not act or not results:
+            return
+        if len(results) == 1:
+            member, verified, reason = results[0]
+            e = create_user_activity_log_embed(
+                "verification",
+                "Successful verification" if verified else "Failed verification",
+                member,
+                reason
             )
-            await self._safe_dm(m, embed)
-            
-            # give guest
+        else:
+            e = self._summary_embed("Join verification", results)
+        self.bot.outbound.send(act, embed=e)
+        log(f"Logged verification results for {len(results)} join(s).")
+
+    def _summary_embed(self, action: str, results: list) -> discord.Embed:
+        verified = [f"{m.mention} ({m.display_name})" for m, ok, _ in results if ok]
+        failed   = [f"{m.mention} ({m.display_name}) – {reason}" for m, ok, reason in results if not ok]
+        embed = discord.Embed(
+            title="🔒 Verification Log",
+            color=discord.Color.purple(),
+            timestamp=datetime.now()
+        )
+        embed.add_field(name="🛠 Action:", value=f"**{action}** ({len(results)} members)", inline=False)
+        for name, lines in ((f"✅ Verified ({len(verified)})", verified), (f"❌ Failed ({len(failed)})", failed)):
+            if not lines:
+                continue
+            value = ""
+            for index, line in enumerate(lines):
+                more = f"\n… and {len(lines) - index} more"
+                if len(value) + len(line) + 1 + len(more) > 1024:
+                    value += more
+                    break
+                value += line + "\n"
+            embed.add_field(name=name, value=value.strip(), inline=False)
+        embed.set_footer(text="🔒 This log is visible only to team members.")
+        return embed
+
+    def describe(self) -> str:
+        snap = self.join_latency.snapshot()
+        return (
+            f"{self.verify_queue.qsize()} queued, {self._active} in progress, "
+            f"{snap['count'] / 5:.1f}/min (5 min), {self.processed} verified/failed, "
+            f"{self.skipped} left first, join→done p95 {fmt_ms(snap['p95'])}; "
+            f"guest sweep {self.sweep_checked} checked, {self.sweep_promoted} promoted"
+        )
+
+    # -------------------------------
+    # Guest re-verification sweep
+    # -------------------------------
+    async def sweep_guests(self, job_keys: list):
+        """
+        Scheduler handler: re-checks one page of guests (by member ID, after the
+        stored cursor) and promotes anyone who is now CnR-verified. Schedules
+        the next page, or the next sweep once every guest has been checked.
+        """
+        res = await self.resources.ready()
+        guild = self.bot.get_guild(GUILD_ID)
+        if not guild or not res.guest_role or not res.verified_role:
+            await schedule_job(JOB_GUEST_SWEEP, GUEST_SWEEP_KEY, time.time() + GUEST_SWEEP_INTERVAL)
+            return
+
+        # new joins go first; try again in a bit
+        if self.verify_queue.qsize() or self._active:
+            await schedule_job(JOB_GUEST_SWEEP, GUEST_SWEEP_KEY, time.time() + GUEST_SWEEP_PAGE_DELAY)
+            return
+
+        cursor = int(await get_bot_state(GUEST_SWEEP_CURSOR) or 0)
+        page = heapq.nsmallest(
+            GUEST_SWEEP_PAGE_SIZE,
+            (m for m in res.guest_role.members if m.id > cursor and m.id not in self._queued),
+            key=lambda m: m.id
+        )
+        if not page:
+            log(f"Guest sweep finished: {self.sweep_checked} checked, {self.sweep_promoted} promoted.")
+            self.sweep_checked = self.sweep_promoted = 0
+            await set_bot_state(GUEST_SWEEP_CURSOR, "0")
+            await schedule_job(JOB_GUEST_SWEEP, GUEST_SWEEP_KEY, time.time() + GUEST_SWEEP_INTERVAL)
+            return
+
+        semaphore = asyncio.Semaphore(GUEST_SWEEP_CONCURRENCY)
+
+        async def recheck(member: discord.Member):
+            async with semaphore:
+                # GUEST_SWEEP_RESERVE request slots stay free for joins and the button
+                status, data = await self.cnr.lookup(member.id, reserve=GUEST_SWEEP_RESERVE)
+            if not is_cnr_verified(status, data) or res.guest_role not in member.roles:
+                return None
             try:
-                await m.add_roles(gue)
-                log(f"Assigned guest role to {member.id}.")
-            except:
-                log(f"Cannot assign guest to {member.id}", level="error")
-           
-            if act:
-                # choose a human-readable reason
-                reason = (
-                    "User not found in the CnR Discord"
-                    if status == 404 else
-                    "Missing CnR-verified role"
-                    if status == 200 else
-                    f"API error (status {status})"
-                )
-                e = create_user_activity_log_embed(
-                    "verification",
-                    "Failed verification",
-                    member,
-                    reason
-                )
-                await act.send(embed=e)
-                log(f"Logged failed verification for {member.id}.")
+                await member.add_roles(res.verified_role)
+                await member.remove_roles(res.guest_role)
+            except discord.HTTPException as e:
+                log(f"Guest sweep could not promote {member.id}: {e}", level="error")
+                return None
+            log(f"Guest sweep promoted {member.id}.")
+            await self._safe_dm(member, self.create_embed(
+                "✅ Verification Successful",
+                f"Hey {data.get('nick', member.name)}, you are now verified in our CnR database, "
+                "so we have verified you here as well!",
+                0x1cd946
+            ))
+            return member, True, "Promoted by the guest re-verification sweep."
+
+        results = [r for r in await asyncio.gather(*(recheck(m) for m in page)) if r]
+        # checkpoint: a restart resumes after the last member of this page
+        await set_bot_state(GUEST_SWEEP_CURSOR, str(page[-1].id))
+        self.sweep_checked  += len(page)
+        self.sweep_promoted += len(results)
+
+        if results and res.activity_ch:
+            if len(results) == 1:
+                member, _, reason = results[0]
+                e = create_user_activity_log_embed("verification", "Successful verification", member, reason)
+            else:
+                e = self._summary_embed("Guest re-verification", results)
+            self.bot.outbound.send(res.activity_ch, embed=e)
+        await schedule_job(JOB_GUEST_SWEEP, GUEST_SWEEP_KEY, time.time() + GUEST_SWEEP_PAGE_DELAY)
 
     async def _safe_dm(self, member: discord.Member, embed: discord.Embed):
         try:
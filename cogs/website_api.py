@@ -0,0 +1,207 @@
+# cogs/website_api.py
+import asyncio
+from time import perf_counter
+from typing import Optional
+
+import aiohttp
+
+from config import SWAT_WEBSITE_URL, SWAT_WEBSITE_TOKEN_FILE
+from cogs.helpers import log, retry_with_backoff
+from cogs.metrics import RollingStats, fmt_ms, register_source
+
+# The website sits behind a WAF that rejects non-browser user agents
+DEFAULT_HEADERS = {
+    "Content-Type":    "application/json",
+    "User-Agent":      (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/114.0.0.0 Safari/537.36"
+    ),
+    "Accept":          "application/json, text/javascript, */*; q=0.01",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class EndpointMetrics:
+    """Request/error counters and a latency window for one endpoint."""
+
+    def __init__(self):
+        self.requests    = 0
+        self.errors      = 0
+        self.last_status = None
+        self.last_error  = None
+        self.latency     = RollingStats(maxlen=500)
+
+
+class WebsiteAPIClient:
+    """
+    Shared async client for SWAT_WEBSITE_URL.
+    - one pooled aiohttp session, created lazily
+    - API token read once and cached
+    - retries with jittered exponential backoff on network errors, 429 and 5xx
+    - an outbound queue drained by a single worker, so callers never wait on the website
+    Results are plain dicts: {"ok", "status", "data", "error"}.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0,
+                 max_delay: float = 30.0, queue_size: int = 100):
+        self.max_attempts = max_attempts
+        self.base_delay   = base_delay
+        self.max_delay    = max_delay
+        self.metrics      = {}      # endpoint -> EndpointMetrics
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[str] = None
+        self._queue  = asyncio.Queue(maxsize=queue_size)
+        self._worker: Optional[asyncio.Task] = None
+        register_source("website_api", self.describe)
+
+    # -------------------------------
+    # Session & credentials
+    # -------------------------------
+    def _get_token(self) -> Optional[str]:
+        if self._token is None:
+            try:
+                with open(SWAT_WEBSITE_TOKEN_FILE, "r") as f:
+                    self._token = f.read().strip()
+            except Exception as e:
+                log(f"Could not read SWAT_WEBSITE_TOKEN_FILE: {e}", level="error")
+                return None
+        return self._token
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+            )
+        return self._session
+
+    async def close(self):
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    # -------------------------------
+    # Requests
+    # -------------------------------
+    def _metrics_for(self, endpoint: str) -> EndpointMetrics:
+        if endpoint not in self.metrics:
+            self.metrics[endpoint] = EndpointMetrics()
+        return self.metrics[endpoint]
+
+    async def _post_once(self, endpoint: str, payload: dict, token: str) -> tuple:
+        """Single POST. Returns (result, retryable, retry_after)."""
+        stats = self._metrics_for(endpoint)
+        stats.requests += 1
+        start = perf_counter()
+        try:
+            async with self._get_session().post(
+                f"{SWAT_WEBSITE_URL}{endpoint}", json=payload, headers={"X-Api-Token": token}
+            ) as resp:
+                status = resp.status
+                retry_after = resp.headers.get("Retry-After")
+                try:
+                    data = await resp.json(content_type=None)
+                except ValueError:
+                    data = None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            stats.latency.add((perf_counter() - start) * 1000)
+            stats.errors += 1
+            stats.last_status = None
+            stats.last_error = str(e) or type(e).__name__
+            return {"ok": False, "status": None, "data": None, "error": stats.last_error}, True, None
+
+        stats.latency.add((perf_counter() - start) * 1000)
+        stats.last_status = status
+
+        if status >= 400:
+            stats.errors += 1
+            stats.last_error = f"HTTP {status}"
+            retryable = status == 429 or status >= 500
+            try:
+                retry_after = float(retry_after) if retry_after else None
+            except ValueError:
+                retry_after = None
+            return {"ok": False, "status": status, "data": data, "error": stats.last_error}, retryable, retry_after
+
+        if not isinstance(data, dict):
+            stats.errors += 1
+            stats.last_error = "invalid JSON response"
+            return {"ok": False, "status": status, "data": None, "error": stats.last_error}, False, None
+
+        if not data.get("success"):
+            stats.errors += 1
+            stats.last_error = data.get("error", "unknown")
+            return {"ok": False, "status": status, "data": data, "error": stats.last_error}, False, None
+
+        stats.last_error = None
+        return {"ok": True, "status": status, "data": data, "error": None}, False, None
+
+    async def post(self, endpoint: str, payload: dict) -> dict:
+        """POSTs `payload` to `endpoint`, retrying transient failures with jittered backoff."""
+        token = self._get_token()
+        if not token:
+            return {"ok": False, "status": None, "data": None, "error": "API token unavailable"}
+
+        def on_retry(result: dict, attempt: int, delay: float):
+            log(f"Website API {endpoint} failed ({result['error']}), retry {attempt} in {delay:.1f}s", level="warning")
+
+        result = await retry_with_backoff(
+            lambda: self._post_once(endpoint, payload, token),
+            self.max_attempts, self.base_delay, self.max_delay, on_retry,
+        )
+        if not result["ok"]:
+            log(f"Website API {endpoint} failed: {result['error']}", level="error")
+        return result
+
+    # -------------------------------
+    # Outbound queue
+    # -------------------------------
+    def submit(self, endpoint: str, payload: dict) -> asyncio.Future:
+        """
+        Queues a POST and returns a future resolving to its result dict.
+        Callers may await the future (optionally with a timeout) or ignore it.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((endpoint, payload, future))
+        except asyncio.QueueFull:
+            log(f"Website API queue full, dropping request to {endpoint}", level="error")
+            future.set_result({"ok": False, "status": None, "data": None, "error": "outbound queue full"})
+            return future
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return future
+
+    async def _drain(self):
+        while True:
+            endpoint, payload, future = await self._queue.get()
+            try:
+                result = await self.post(endpoint, payload)
+            except Exception as e:
+                log(f"Unexpected error posting to {endpoint}: {e}", level="error")
+                result = {"ok": False, "status": None, "data": None, "error": str(e)}
+            finally:
+                self._queue.task_done()
+            if not future.done():
+                future.set_result(result)
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def describe(self) -> str:
+        if not self.metrics:
+            return f"no requests yet, queue {self._queue.qsize()}"
+        parts = []
+        for endpoint, stats in self.metrics.items():
+            snap = stats.latency.snapshot()
+            parts.append(
+                f"{endpoint}: {stats.requests} req, {stats.errors} err, "
+                f"p50 {fmt_ms(snap['p50'])}, p95 {fmt_ms(snap['p95'])}"
+            )
+        parts.append(f"queue {self._queue.qsize()}")
+        return "; ".join(parts)
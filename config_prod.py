@@ -35,6 +35,7 @@ GUEST_ROLE            = 974835615424192552   # UNCHANGED
 VERIFIED_ROLE         = 1216355281139798169  # Changed
 BLACKLISTED_ROLE_ID   = 1363175970172965156
 TIMEOUT_ROLE_ID       = 1363175797304590508
+CHIEF_ROLE_ID         = 958272560905195521   # UNCHANGED
 
 # -----------------------
 # EMOJIS
@@ -118,3 +119,50 @@ ROLE_TO_RANK = {
 # Verification Bot
 # -----------------------
 CHECK_CNR_VERIFIED_ROLE = 871086120698523668
+CNR_CACHE_TTL           = 600     # seconds a successful CnR lookup is reused
+CNR_NEGATIVE_CACHE_TTL  = 60      # seconds a "not in CnR"/"missing role" lookup is reused
+CNR_CACHE_MAX_ENTRIES   = 5000
+CNR_RATE_LIMIT          = 5       # CnR member lookups per CNR_RATE_PER seconds (on top of Discord's headers)
+CNR_RATE_PER            = 1.0
+CNR_MAX_ATTEMPTS        = 4
+VERIFY_WORKERS          = 3       # join verifications handled at once
+VERIFY_JOIN_DELAY       = 2       # seconds to let Discord finish onboarding before verifying
+VERIFY_LOG_WINDOW       = 10      # seconds of join results collected into one activity log
+GUEST_SWEEP_INTERVAL    = 6 * 3600  # seconds between guest re-verification sweeps
+GUEST_SWEEP_PAGE_SIZE   = 50      # guests re-checked per page
+GUEST_SWEEP_PAGE_DELAY  = 30      # seconds between pages
+GUEST_SWEEP_CONCURRENCY = 2       # lookups in flight per page
+GUEST_SWEEP_RESERVE     = 3       # of CNR_RATE_LIMIT, slots per window the sweep leaves free
+
+# -----------------------
+# Logging
+# -----------------------
+LOG_FILE          = "botlog.log"
+LOG_MAX_BYTES     = 20 * 1024 * 1024   # roll over at this size ...
+LOG_ROTATE_DAILY  = True               # ... and at local midnight
+LOG_BACKUP_COUNT  = 30                 # gzip-compressed rolled files kept
+LOG_JSON          = False              # write JSON lines instead of plain text
+
+# -----------------------
+# Admin UI (sqlite-web)
+# -----------------------
+ADMIN_UI_MODE             = "snapshot"   # "snapshot", "readonly", "write" (opt-in) or "off"
+ADMIN_UI_HOST             = "0.0.0.0"
+ADMIN_UI_PORT             = 8080
+ADMIN_UI_SNAPSHOT_FILE    = "data-snapshot.db"
+ADMIN_UI_SNAPSHOT_SECONDS = 300          # how often the snapshot is refreshed
+ADMIN_UI_PASSWORD_FILE    = None         # file with a login password for the UI
+
+# -----------------------
+# /status health prober
+# -----------------------
+STATUS_PROBE_SECONDS  = 30      # heartbeat / REST / DB sample interval
+STATUS_PAGE_SECONDS   = 120     # status.discord.com poll interval
+STATUS_WINDOW_SECONDS = 3600    # percentiles are over this window
+
+# -----------------------
+# Event-loop watchdog
+# -----------------------
+LOOP_WATCHDOG_INTERVAL  = 0.1   # seconds between lag ticks on the loop
+LOOP_WATCHDOG_THRESHOLD = 0.25  # a loop blocked this long (s) gets its stack logged
+LOOP_WATCHDOG_HANG      = 10    # log again if still blocked after this many seconds
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Event-loop lag while the sqlite-web admin UI is under load, in-thread vs out of process.
+
+  thread:  sqlite-web served from a thread inside this process (how main.py used to run it)
+  process: sqlite-web as a child process (cogs/admin_ui.AdminUI)
+
+The event loop stands in for the bot: it sleeps in 50 ms steps and records how
+late each wake-up is. Discord heartbeats and interaction acks run on the same
+loop, so this lag adds directly to gateway latency. Load comes from a separate
+process hammering a table page and an aggregate query.
+
+    python helper-files/admin_ui_bench.py
+    python helper-files/admin_ui_bench.py --rows 500000 --clients 8 --seconds 20
+
+Needs sqlite-web (pip install sqlite-web). Works in a temp dir, removed afterwards.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from cogs.metrics import RollingStats  # noqa: E402
+
+PAGES = (
+    "/bench/content/?ordering=-payload&page=40",
+    "/query/?sql=SELECT+value+%25+100,+COUNT(*),+MAX(payload)+FROM+bench+GROUP+BY+1",
+)
+
+
+def build_db(path: str, rows: int):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE bench (id INTEGER PRIMARY KEY, payload TEXT, value INTEGER)")
+    conn.executemany(
+        "INSERT INTO bench (payload, value) VALUES (?, ?)",
+        ((f"row {i} " + "x" * 40, i) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def wait_until_up(port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("sqlite-web did not come up")
+
+
+def load(port: int, clients: int, seconds: float):
+    """Runs in the load-generator process: `clients` threads requesting PAGES in a loop."""
+    stop_at = time.monotonic() + seconds
+    done = [0]
+
+    def worker(offset):
+        i = offset
+        while time.monotonic() < stop_at:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}{PAGES[i % len(PAGES)]}", timeout=30).read()
+                done[0] += 1
+            except OSError:
+                pass
+            i += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(done[0])
+
+
+async def measure_lag(seconds: float, step: float = 0.05) -> RollingStats:
+    stats = RollingStats(maxlen=100000)
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        await asyncio.sleep(step)
+        stats.add((time.perf_counter() - start - step) * 1000)
+    return stats
+
+
+def run_case(mode: str, db: str, port: int, args) -> str:
+    server = None
+    if mode == "thread":
+        sys.argv = ["sqlite_web", db, "--port", str(port), "--no-browser", "--quiet", "--read-only"]
+        from sqlite_web.sqlite_web import main as sqlite_web_main
+        threading.Thread(target=sqlite_web_main, daemon=True).start()
+    elif mode == "process":
+        server = subprocess.Popen(
+            [sys.executable, "-m", "sqlite_web.sqlite_web", db, "--port", str(port),
+             "--no-browser", "--quiet", "--read-only"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    try:
+        if mode != "idle":
+            wait_until_up(port)
+        loader = None
+        if mode != "idle":
+            loader = subprocess.Popen(
+                [sys.executable, __file__, "--load", str(port), "--clients", str(args.clients),
+                 "--seconds", str(args.seconds)],
+                stdout=subprocess.PIPE, text=True,
+            )
+        stats = asyncio.run(measure_lag(args.seconds))
+        requests = int(loader.communicate()[0].strip() or 0) if loader else 0
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    snap = stats.snapshot()
+    return (f"  {mode:<8} lag p50 {snap['p50']:6.1f} ms  p95 {snap['p95']:6.1f} ms  "
+            f"max {snap['max']:7.1f} ms   ({requests} UI requests served)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8095)
+    parser.add_argument("--load", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load:
+        return load(args.load, args.clients, args.seconds)
+
+    workdir = tempfile.mkdtemp(prefix="admin_ui_bench_")
+    try:
+        db = os.path.join(workdir, "bench.db")
+        build_db(db, args.rows)
+        print(f"{args.rows} rows, {args.clients} UI clients, {args.seconds:.0f}s per case")
+        print(run_case("idle", db, args.port, args))
+        print(run_case("process", db, args.port + 1, args))
+        print(run_case("thread", db, args.port + 2, args))   # last: the thread can't be stopped
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Cost per call of helpers.log, old vs new.
+
+  old: inspect.stack() caller lookup + synchronous FileHandler (the previous helpers.log)
+  new: sys._getframe() caller lookup + QueueHandler, file I/O on the listener thread
+
+    python helper-files/log_bench.py
+    python helper-files/log_bench.py --calls 50000 --depth 40
+
+--depth nests the calls that many frames deep, since inspect.stack() cost grows
+with the stack (a discord.py interaction callback runs ~30 frames deep).
+Log files are written to a temp dir and removed afterwards.
+"""
+import argparse
+import inspect
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+
+def old_log(message: str, level: str = "info"):
+    caller_frame = inspect.stack()[1]
+    caller_module = inspect.getmodule(caller_frame[0])
+    module_name = caller_module.__name__ if caller_module else "UnknownModule"
+    full_msg = f"[{module_name}] {message}"
+    if level.lower() == "error":
+        logging.error(full_msg)
+    elif level.lower() == "warning":
+        logging.warning(full_msg)
+    elif level.lower() == "debug":
+        logging.debug(full_msg)
+    else:
+        logging.info(full_msg)
+
+
+def nested(depth: int, fn):
+    if depth <= 0:
+        return fn()
+    return nested(depth - 1, fn)
+
+
+def measure(log_fn, calls: int, depth: int, repeats: int, level: str = "info") -> float:
+    """Median µs per call over `repeats` runs."""
+    def run():
+        for i in range(calls):
+            log_fn(f"benchmark message {i}", level)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        nested(depth, run)
+        samples.append((time.perf_counter() - start) / calls * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="log_bench_")
+    os.chdir(workdir)
+    try:
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+
+        # old: synchronous file handler on the root logger, as basicConfig set it up
+        file_handler = logging.FileHandler("old.log", encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+        root.addHandler(file_handler)
+        old_us = measure(old_log, max(1, args.calls // 10), args.depth, args.repeats)
+        root.removeHandler(file_handler)
+        file_handler.close()
+
+        # new: the queue handler main.py installs at startup (files land in the temp dir)
+        from cogs.helpers import log
+        from cogs.logging_setup import configure_logging, stop_logging
+        configure_logging("new.log", 20 * 1024 * 1024, 3)
+        new_us = measure(log, args.calls, args.depth, args.repeats)
+        filtered_us = measure(log, args.calls, args.depth, args.repeats, level="debug")
+        start = time.perf_counter()
+        stop_logging()                      # drain the queue to disk
+        drain_ms = (time.perf_counter() - start) * 1000
+
+        print(f"calls {args.calls} (old: {max(1, args.calls // 10)}), stack depth {args.depth}")
+        print(f"  old  inspect.stack + FileHandler : {old_us:9.2f} µs/call")
+        print(f"  new  _getframe + QueueHandler    : {new_us:9.2f} µs/call  ({old_us / new_us:.0f}x faster)")
+        print(f"  new  below level (debug)         : {filtered_us:9.2f} µs/call")
+        print(f"  queue drain after the run        : {drain_ms:9.1f} ms (listener thread)")
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: everything main.py does before it connects to Discord.
+
+Each run is a fresh interpreter (nothing cached in sys.modules) with
+BOT_STARTUP_PROFILE=1, so cogs/startup_profile.py times every import.
+The run then calls main.setup_services(), loads every extension and runs
+every DB init against an empty data.db in a temp dir.
+
+    python helper-files/startup_bench.py
+    python helper-files/startup_bench.py --runs 10 --top 15
+    python helper-files/startup_bench.py --json startup.json --compare baseline.json
+
+Reports the median of each phase over the runs, plus the full profile
+(slowest imports, per-cog setup, per-init) of the last run. An extension
+that can't load here (missing token files, ...) is reported and skipped.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def child(top: int):
+    """One cold start; prints a JSON summary on the last line of stdout."""
+    launched = time.perf_counter()
+    sys.path.insert(0, REPO_ROOT)
+    import main
+    from cogs.startup_profile import profiler
+    imported = time.perf_counter()
+
+    async def run():
+        failed = {}
+        async with main.bot:
+            main.setup_services()
+            for extension in main.EXTENSIONS:
+                try:
+                    with profiler.phase("cog setup", extension):
+                        await main.bot.load_extension(extension)
+                except Exception as e:
+                    failed[extension] = f"{type(e).__name__}: {e}"
+            loaded = time.perf_counter()
+            for init in main.DB_INITS:
+                with profiler.phase("init", init.__name__):
+                    await init()
+        return failed, loaded
+
+    failed, loaded = asyncio.run(run())
+    done = time.perf_counter()
+    report = profiler.report(top, until="setup done")
+    summary = {
+        "imports_s":   imported - launched,
+        "cogs_s":      loaded - imported,
+        "inits_s":     done - loaded,
+        "total_s":     done - launched,
+        "import_self": sum(own for own, _ in profiler.imports.values()),
+        "failed":      failed,
+        "report":      report,
+    }
+    print(json.dumps(summary))
+    sys.stdout.flush()
+    os._exit(0)     # don't wait on cog background tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="slowest imports to list")
+    parser.add_argument("--json", help="write the medians to this file")
+    parser.add_argument("--compare", help="baseline JSON; exit 1 if total regresses by more than 20%%")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.top)
+
+    env = dict(os.environ, BOT_STARTUP_PROFILE="1", PYTHONDONTWRITEBYTECODE="1")
+    runs = []
+    for _ in range(args.runs):
+        workdir = tempfile.mkdtemp(prefix="startup_bench_")
+        try:
+            started = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", "--top", str(args.top)],
+                cwd=workdir, env=env, capture_output=True, text=True,
+            )
+            if out.returncode != 0:
+                sys.exit(f"cold start failed:\n{out.stderr[-2000:]}")
+            summary = json.loads(out.stdout.strip().splitlines()[-1])
+            summary["process_s"] = time.perf_counter() - started
+            runs.append(summary)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    keys = ("process_s", "imports_s", "cogs_s", "inits_s", "total_s")
+    medians = {key: statistics.median(run[key] for run in runs) for key in keys}
+    print(f"cold start, median of {args.runs} runs")
+    print(f"  interpreter + everything : {medians['process_s'] * 1000:7.0f} ms")
+    print(f"  import main.py           : {medians['imports_s'] * 1000:7.0f} ms")
+    print(f"  load extensions          : {medians['cogs_s'] * 1000:7.0f} ms")
+    print(f"  DB inits                 : {medians['inits_s'] * 1000:7.0f} ms")
+    for extension, error in runs[-1]["failed"].items():
+        print(f"  skipped {extension}: {error}")
+    print()
+    print("\n".join(runs[-1]["report"]))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(medians, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if medians["process_s"] > baseline["process_s"] * 1.2:
+            print(f"REGRESSION: {medians['process_s']:.2f}s vs baseline {baseline['process_s']:.2f}s")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
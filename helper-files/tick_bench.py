@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Record-and-replay benchmark for one PlayerListCog.update_game_status tick.
+
+  Record live API responses + a guild member snapshot:
+      python helper-files/tick_bench.py record fixtures/live
+      python helper-files/tick_bench.py record fixtures/live --skip-guild
+
+  Replay a recorded fixture (Discord is stubbed, DBs live in a temp dir):
+      python helper-files/tick_bench.py replay fixtures/live --ticks 5
+
+  Replay a synthetic load:
+      python helper-files/tick_bench.py synthetic --players 2000 --regions 10 --members 20000
+
+Every replay reports tick wall time, CPU time, peak allocations, DB write
+statements/commits, time per phase and the member-cache size. Use --json to
+save the summary and --compare to fail (exit 1) when a run regresses
+against a saved baseline.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+QUEUE_URL     = "https://api.gtacnr.net/cnr/servers"
+SEA_QUEUE_URL = "https://sea.gtacnr.net/cnr/servers"
+
+
+# -------------------------------
+# Fixtures
+# -------------------------------
+def players_json_url(info_url: str) -> str:
+    return info_url.replace("/info.json", "/players.json")
+
+
+def load_fixture(path: str) -> dict:
+    with open(os.path.join(path, "regions.json"), "r", encoding="utf-8") as f:
+        regions = json.load(f)
+    with open(os.path.join(path, "http.json"), "r", encoding="utf-8") as f:
+        http = json.load(f)
+    members = []
+    members_file = os.path.join(path, "members.json")
+    if os.path.exists(members_file):
+        with open(members_file, "r", encoding="utf-8") as f:
+            members = json.load(f)
+    return {"API_URLS": regions["API_URLS"], "API_URLS_FIVEM": regions["API_URLS_FIVEM"],
+            "http": http, "members": members}
+
+
+async def record_http(api_urls: dict, fivem_urls: dict) -> dict:
+    import aiohttp
+    urls = [QUEUE_URL, SEA_QUEUE_URL, *api_urls.values()]
+    for url in fivem_urls.values():
+        urls += [url, players_json_url(url)]
+    out = {}
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as http:
+        for url in urls:
+            try:
+                async with http.get(url, ssl=False) as resp:
+                    out[url] = {"status": resp.status, "body": (await resp.read()).decode("utf-8", errors="replace")}
+            except Exception as e:
+                print(f"  ! {url}: {e}")
+                out[url] = {"status": 599, "body": ""}
+            print(f"  {out[url]['status']} {url}")
+            await asyncio.sleep(1)
+    return out
+
+
+async def record_members(guild_id: int, token: str) -> list:
+    import discord
+    intents = discord.Intents.default()
+    intents.members = True
+    client = discord.Client(intents=intents)
+    members = []
+
+    @client.event
+    async def on_ready():
+        guild = client.get_guild(guild_id)
+        if guild is None:
+            print(f"  ! bot is not in guild {guild_id}")
+        else:
+            await guild.chunk()
+            for m in guild.members:
+                members.append({
+                    "display_name": m.display_name,
+                    "id": m.id,
+                    "roles": [r.id for r in m.roles],
+                    "joined_at": m.joined_at.isoformat() if m.joined_at else None,
+                })
+        await client.close()
+
+    await client.start(token)
+    return members
+
+
+async def record(path: str, skip_guild: bool):
+    from config import API_URLS, API_URLS_FIVEM, GUILD_ID, TOKEN_FILE
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "regions.json"), "w", encoding="utf-8") as f:
+        json.dump({"API_URLS": API_URLS, "API_URLS_FIVEM": API_URLS_FIVEM}, f, indent=2)
+    print("Recording HTTP responses…")
+    http = await record_http(API_URLS, API_URLS_FIVEM)
+    with open(os.path.join(path, "http.json"), "w", encoding="utf-8") as f:
+        json.dump(http, f)
+    if not skip_guild:
+        print("Recording guild member snapshot…")
+        with open(os.path.join(REPO_ROOT, TOKEN_FILE), "r", encoding="utf-8") as f:
+            token = f.read().strip()
+        members = await record_members(GUILD_ID, token)
+        with open(os.path.join(path, "members.json"), "w", encoding="utf-8") as f:
+            json.dump(members, f)
+        print(f"  {len(members)} members")
+    print(f"Fixture written to {path}")
+
+
+def build_synthetic(players: int, regions: int, members: int, seed: int) -> dict:
+    """Generates a fixture: `players` spread over `regions` servers and a guild of `members`."""
+    from config import ROLE_TO_RANK, SWAT_ROLE_ID, CADET_ROLE, TRAINEE_ROLE, LEADERSHIP_ID, MENTOR_ROLE_ID
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rank_roles = list(ROLE_TO_RANK)
+    filler_roles = [1000 + i for i in range(40)]
+
+    api_urls, fivem_urls, http = {}, {}, {}
+    queue = []
+    per_region = max(1, players // regions)
+    uid = 0
+    roster = []     # (username, kind) for players that should have a Discord member
+
+    for r in range(regions):
+        region = f"{['EU', 'NA', 'SEA'][r % 3]}{r + 1}"
+        api_urls[region] = f"https://synthetic.invalid/cnr/players?serverId={region}"
+        fivem_urls[region] = f"https://synthetic.invalid/{region}/info.json"
+        plist = []
+        for _ in range(per_region):
+            uid += 1
+            roll = rnd.random()
+            base = f"Player{uid:06d}"
+            if roll < 0.08:
+                name, kind = f"[SWAT] {base}", "swat"
+            elif roll < 0.12:
+                name, kind = base, rnd.choice(["cadet", "trainee"])
+            else:
+                name, kind = base, None
+            plist.append({"Uid": f"uid-{uid}", "Username": {"Username": name}})
+            if kind:
+                roster.append((base, kind))
+        http[api_urls[region]] = {"status": 200, "body": json.dumps(plist)}
+        http[fivem_urls[region]] = {"status": 200, "body": json.dumps({"vars": {"Time": "Monday 12:30"}})}
+        http[players_json_url(fivem_urls[region])] = {
+            "status": 200, "body": json.dumps([{"ping": rnd.randint(20, 200)} for _ in range(per_region)])
+        }
+        queue.append({
+            "Id": region, "Players": per_region, "MaxPlayers": 2048, "QueuedPlayers": rnd.randint(0, 50),
+            "LastHeartbeatDateTime": now.isoformat().replace("+00:00", "Z"),
+        })
+    http[QUEUE_URL] = {"status": 200, "body": json.dumps([q for q in queue if q["Id"] != "SEA"])}
+    http[SEA_QUEUE_URL] = {"status": 200, "body": json.dumps([q for q in queue if q["Id"] == "SEA"])}
+
+    member_list = []
+    for i in range(members):
+        roles = rnd.sample(filler_roles, rnd.randint(1, 6))
+        if i < len(roster):
+            base, kind = roster[i]
+            if kind == "swat":
+                display = f"{base} [SWAT]"
+                roles += [SWAT_ROLE_ID, rnd.choice(rank_roles)]
+                if rnd.random() < 0.05:
+                    roles.append(LEADERSHIP_ID)
+                if rnd.random() < 0.1:
+                    roles.append(MENTOR_ROLE_ID)
+            else:
+                display = f"{base} [{kind.upper()}]"
+                roles.append(CADET_ROLE if kind == "cadet" else TRAINEE_ROLE)
+        else:
+            display = f"Member{i:06d}"
+        member_list.append({
+            "display_name": display,
+            "id": 10**17 + i,
+            "roles": roles,
+            "joined_at": (now - timedelta(days=rnd.randint(0, 900))).isoformat(),
+        })
+    return {"API_URLS": api_urls, "API_URLS_FIVEM": fivem_urls, "http": http, "members": member_list}
+
+
+# -------------------------------
+# Discord / HTTP stubs
+# -------------------------------
+class FakeHTTPError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: str):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise FakeHTTPError(self.status)
+
+    async def read(self):
+        return self._body.encode("utf-8")
+
+    async def text(self, encoding=None):
+        return self._body
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        entry = self.responses.get(url, {"status": 404, "body": ""})
+        return FakeResponse(entry["status"], entry["body"])
+
+    async def close(self):
+        pass
+
+
+class FakeRole:
+    __slots__ = ("id",)
+
+    def __init__(self, role_id: int):
+        self.id = role_id
+
+
+class FakeMember:
+    def __init__(self, data: dict):
+        self.display_name = data["display_name"]
+        self.id = data["id"]
+        self._roles = list(data["roles"])
+        self.roles = [FakeRole(r) for r in data["roles"]]
+        joined = data.get("joined_at")
+        self.joined_at = datetime.fromisoformat(joined) if joined else None
+
+
+class FakeGuild:
+    def __init__(self, members: list):
+        self.members = [FakeMember(m) for m in members]
+        self._by_id = {m.id: m for m in self.members}
+
+    def get_member(self, member_id: int):
+        return self._by_id.get(member_id)
+
+
+class FakeMessage:
+    def __init__(self, message_id: int, channel):
+        self.id = message_id
+        self.channel = channel
+
+    async def edit(self, **kwargs):
+        self.channel.edits += 1
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.messages = {}
+        self.sends = 0
+        self.edits = 0
+
+    async def send(self, **kwargs):
+        self.sends += 1
+        msg = FakeMessage(len(self.messages) + 1, self)
+        self.messages[msg.id] = msg
+        return msg
+
+    async def fetch_message(self, message_id: int):
+        return self.messages[message_id]
+
+
+class FakeLoop:
+    def create_task(self, coro):
+        # PlayerListCog.__init__ schedules init_database(); the harness sets up the DB itself
+        coro.close()
+
+
+class FakeBot:
+    def __init__(self, guild: FakeGuild, channel: FakeChannel):
+        self.loop = FakeLoop()
+        self._guild = guild
+        self._channel = channel
+
+    def get_guild(self, guild_id: int):
+        return self._guild
+
+    def get_channel(self, channel_id: int):
+        return self._channel
+
+    async def wait_until_ready(self):
+        return None
+
+
+# -------------------------------
+# Measurement
+# -------------------------------
+class PhaseTimer:
+    """Wraps cog methods so wall time per phase is accumulated per tick."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+
+    def wrap(self, obj, attr: str, phase: str):
+        func = getattr(obj, attr)
+        totals = self.totals
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    totals[phase] += time.perf_counter() - start
+        else:
+            @wraps(func)
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    totals[phase] += time.perf_counter() - start
+        setattr(obj, attr, timed)
+
+    def take(self) -> dict:
+        out = {k: round(v * 1000, 2) for k, v in self.totals.items()}
+        self.totals.clear()
+        return out
+
+
+async def replay(fixture: dict, ticks: int, rebuild_cache: bool, label: str) -> dict:
+    workdir = tempfile.mkdtemp(prefix="tick_bench_")
+    cwd = os.getcwd()
+    os.chdir(workdir)   # data.db, player_logs.db and the bot log land here
+
+    import aiosqlite
+    import cogs.playerlist as playerlist
+    from cogs.helpers import init_stored_embeds_db
+    from config import CACHE_UPDATE_INTERVAL
+
+    playerlist.API_URLS = fixture["API_URLS"]
+    playerlist.API_URLS_FIVEM = fixture["API_URLS_FIVEM"]
+    await init_stored_embeds_db()
+
+    guild = FakeGuild(fixture["members"])
+    channel = FakeChannel(1)
+    cog = playerlist.PlayerListCog(FakeBot(guild, channel))
+    cog.request_spacing = 0
+    cog.region_spacing = 0
+    cog.http = FakeSession(fixture["http"])
+    cog.db_conn = await aiosqlite.connect("player_logs.db")
+    cog.db_conn.row_factory = aiosqlite.Row
+    await cog.setup_database()
+
+    db = {"writes": 0, "commits": 0}
+
+    def on_statement(sql: str):
+        head = sql.lstrip()[:6].upper()
+        if head in ("INSERT", "UPDATE", "DELETE"):
+            db["writes"] += 1
+        elif head == "COMMIT":
+            db["commits"] += 1
+    await cog.db_conn.set_trace_callback(on_statement)
+
+    timer = PhaseTimer()
+    timer.wrap(cog, "update_discord_cache", "discord_cache")
+    timer.wrap(cog, "get_cached_queue", "fetch_queue")
+    timer.wrap(cog, "fetch_players", "fetch_players")
+    timer.wrap(cog, "fetch_fivem", "fetch_fivem")
+    timer.wrap(cog, "log_player_data", "log_player_data")
+    timer.wrap(cog, "match_players", "match")
+    timer.wrap(cog, "create_embed", "embed")
+    timer.wrap(cog, "update_or_create_embed_for_region", "publish")
+
+    # Member-cache footprint
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    await cog.update_discord_cache()
+    cache_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    cached = max(1, len(cog.discord_cache["members"]))
+    timer.take()
+
+    async def one_tick():
+        # Real ticks run CHECK_INTERVAL apart, so the queue caches are always stale
+        cog.queue_cache["timestamp"] = None
+        cog.sea_queue_cache["timestamp"] = None
+        if rebuild_cache:
+            cog.discord_cache["timestamp"] = None
+        await cog.update_game_status()
+
+    # Warm-up tick creates the players and the stored region embeds
+    await one_tick()
+    timer.take()
+    db.update(writes=0, commits=0)
+
+    results = []
+    for i in range(ticks):
+        if not rebuild_cache and i % max(1, CACHE_UPDATE_INTERVAL // 30) == 0:
+            cog.discord_cache["timestamp"] = None
+        writes0, commits0 = db["writes"], db["commits"]
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        await one_tick()
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+        await asyncio.sleep(0)
+        results.append({
+            "wall_ms": wall * 1000, "cpu_ms": cpu * 1000,
+            "db_writes": db["writes"] - writes0, "commits": db["commits"] - commits0,
+            "phases": timer.take(),
+        })
+        print(f"  tick {i + 1:>3}: wall {wall * 1000:9.1f} ms  cpu {cpu * 1000:9.1f} ms  "
+              f"writes {results[-1]['db_writes']:>6}  commits {results[-1]['commits']:>6}")
+
+    # One extra tick under tracemalloc for allocation numbers
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    await one_tick()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timer.take()
+
+    await cog.db_conn.close()
+    os.chdir(cwd)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    players = sum(len(json.loads(fixture["http"][u]["body"] or "[]"))
+                  for u in fixture["API_URLS"].values() if fixture["http"].get(u, {}).get("status") == 200)
+    phase_names = sorted({k for r in results for k in r["phases"]})
+    return {
+        "label": label,
+        "players": players,
+        "regions": len(fixture["API_URLS"]),
+        "members": len(fixture["members"]),
+        "ticks": ticks,
+        "wall_ms": summarize([r["wall_ms"] for r in results]),
+        "cpu_ms": summarize([r["cpu_ms"] for r in results]),
+        "db_writes_per_tick": statistics.median(r["db_writes"] for r in results),
+        "commits_per_tick": statistics.median(r["commits"] for r in results),
+        "alloc_peak_kib": round((peak - base) / 1024, 1),
+        "alloc_retained_kib": round((current - base) / 1024, 1),
+        "member_cache_bytes_per_member": round(cache_bytes / cached, 1),
+        "phases_ms": {p: round(statistics.median(r["phases"].get(p, 0.0) for r in results), 2)
+                      for p in phase_names},
+        "embed_edits": channel.edits,
+        "embed_sends": channel.sends,
+    }
+
+
+def summarize(values: list) -> dict:
+    return {
+        "median": round(statistics.median(values), 2),
+        "min": round(min(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def print_report(report: dict):
+    print()
+    print(f"== {report['label']}: {report['players']} players / {report['regions']} regions / "
+          f"{report['members']} members, {report['ticks']} ticks ==")
+    print(f"wall ms      median {report['wall_ms']['median']:>10}  min {report['wall_ms']['min']:>10}  max {report['wall_ms']['max']:>10}")
+    print(f"cpu ms       median {report['cpu_ms']['median']:>10}  min {report['cpu_ms']['min']:>10}  max {report['cpu_ms']['max']:>10}")
+    print(f"db writes    {report['db_writes_per_tick']} statements / {report['commits_per_tick']} commits per tick")
+    print(f"allocations  peak {report['alloc_peak_kib']} KiB, retained {report['alloc_retained_kib']} KiB per tick")
+    print(f"member cache {report['member_cache_bytes_per_member']} bytes per cached member")
+    print("phases (median ms per tick):")
+    for phase, ms in sorted(report["phases_ms"].items(), key=lambda kv: -kv[1]):
+        print(f"  {phase:<16} {ms:>10}")
+
+
+def compare(report: dict, baseline_path: str, tolerance: float) -> bool:
+    """Returns False when the run regresses beyond `tolerance` against the baseline."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    ok = True
+    checks = [
+        ("wall median", report["wall_ms"]["median"], baseline["wall_ms"]["median"]),
+        ("cpu median", report["cpu_ms"]["median"], baseline["cpu_ms"]["median"]),
+        ("alloc peak", report["alloc_peak_kib"], baseline["alloc_peak_kib"]),
+        ("db writes", report["db_writes_per_tick"], baseline["db_writes_per_tick"]),
+    ]
+    print()
+    for name, now, before in checks:
+        limit = before * (1 + tolerance)
+        verdict = "ok" if now <= limit else "REGRESSION"
+        ok &= now <= limit
+        print(f"{name:<12} {before:>10} -> {now:>10}  ({verdict})")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    rec = sub.add_parser("record", help="record live API responses and a guild snapshot")
+    rec.add_argument("path")
+    rec.add_argument("--skip-guild", action="store_true", help="do not log in to snapshot guild members")
+
+    for name in ("replay", "synthetic"):
+        p = sub.add_parser(name)
+        if name == "replay":
+            p.add_argument("path")
+        else:
+            p.add_argument("--players", type=int, default=2000)
+            p.add_argument("--regions", type=int, default=10)
+            p.add_argument("--members", type=int, default=20000)
+            p.add_argument("--seed", type=int, default=1)
+        p.add_argument("--ticks", type=int, default=5)
+        p.add_argument("--rebuild-cache", action="store_true",
+                       help="rebuild the Discord member cache on every tick (default: every CACHE_UPDATE_INTERVAL)")
+        p.add_argument("--json", help="write the summary to this file")
+        p.add_argument("--compare", help="baseline summary to compare against")
+        p.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (default 25%%)")
+
+    args = parser.parse_args()
+    if args.mode == "record":
+        asyncio.run(record(os.path.abspath(args.path), args.skip_guild))
+        return
+
+    if args.mode == "replay":
+        fixture = load_fixture(os.path.abspath(args.path))
+        label = os.path.basename(os.path.normpath(args.path))
+    else:
+        fixture = build_synthetic(args.players, args.regions, args.members, args.seed)
+        label = f"synthetic-{args.players}p-{args.regions}r-{args.members}m"
+    json_out = os.path.abspath(args.json) if args.json else None
+    baseline = os.path.abspath(args.compare) if args.compare else None
+
+    report = asyncio.run(replay(fixture, args.ticks, args.rebuild_cache, label))
+    print_report(report)
+    if json_out:
+        with open(json_out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if baseline and not compare(report, baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,26 @@
+# first: with BOT_STARTUP_PROFILE=1 it times every import below
+from cogs.startup_profile import profiler
 import discord
 from discord import app_commands, ButtonStyle, Interaction
 from discord.ext import commands, tasks
 import asyncio
 from cogs.helpers import *
-import os, threading
-from sqlite_web.sqlite_web import initialize_app, app
+import os, hashlib, json, time
 import asyncio
 import platform
+from typing import Optional
 from cogs.db_utils import *
 from cogs.guild_resources import GuildResources
+from cogs.website_api import WebsiteAPIClient
+from cogs.scheduler import Scheduler
+from cogs.outbound import OutboundQueue
+from cogs.persistent_embeds import PersistentEmbeds
+from cogs.pagination import PageButton
+from cogs.admin_ui import AdminUI
+from cogs.loop_watchdog import LoopWatchdog
+from cogs.logging_setup import configure_logging
 
-from config import TOKEN_FILE
+from config import TOKEN_FILE, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_ROTATE_DAILY, LOG_JSON
 
 if platform.system() != "Windows":
     try:
@@ -19,19 +29,6 @@ if platform.system() != "Windows":
     except ImportError:
         pass  # uvloop isn’t installed or not available
 
-with open(TOKEN_FILE, "r", encoding="utf-8") as file:
-    TOKEN = file.read().strip()
-
-def start_sqlite_web():
-    # Initialisiere das sqlite-web‑Interface
-    #   args: (datenbank-file, read_only=False, password=None, url_prefix=None)
-    initialize_app('data.db', False, None, None)  
-    # Starte den eingebauten Flask‑Server
-    app.run(host='0.0.0.0', port=8080, debug=False)
-
-# In Deinem main() noch vor bot.run() starten
-threading.Thread(target=start_sqlite_web, daemon=True).start()
-
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
@@ -39,6 +36,66 @@ intents.guilds = True
 
 bot = commands.AutoShardedBot(command_prefix="!", intents=intents)
 
+# -------------------------------
+# Startup timing & command sync
+# -------------------------------
+STARTED_AT   = profiler.started
+_phase_start = STARTED_AT
+_ready_once  = False
+
+def log_phase(phase: str):
+    """Logs how long `phase` took and restarts the phase clock."""
+    global _phase_start
+    now = time.perf_counter()
+    log(f"Startup: {phase} took {(now - _phase_start) * 1000:.0f} ms ({now - STARTED_AT:.1f}s since launch)")
+    profiler.record("phases", phase, now - _phase_start)
+    _phase_start = now
+
+def command_tree_hash(tree: app_commands.CommandTree) -> str:
+    """Stable hash of the global command payload tree.sync() would upload."""
+    payload = [command.to_dict(tree) for command in tree.get_commands()]
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+EXTENSIONS = (
+    "cogs.recruitment",
+    "cogs.tickets",
+    "cogs.playerlist",
+    "cogs.status",
+    "cogs.verification",
+    "cogs.fun",
+    "cogs.export",
+    # "cogs.example_cog",
+)
+
+DB_INITS = (
+    initialize_database,
+    init_role_requests_db,
+    init_application_requests_db,
+    init_applications_db,
+    init_application_attempts_db,
+    init_region_status,
+    init_timeouts_db,
+    init_stored_embeds_db,
+    init_ticket_db,
+    init_loa_db,
+    init_analytics_db,
+    init_bot_state_db,
+)
+
+async def sync_commands_if_changed() -> Optional[int]:
+    """
+    Syncs the global command tree only if it differs from the last synced one.
+    Returns the number of synced commands, or None when the sync was skipped.
+    """
+    state_key = f"command_tree_hash:{bot.application_id}"
+    tree_hash = command_tree_hash(bot.tree)
+    if await get_bot_state(state_key) == tree_hash:
+        return None
+    synced = await bot.tree.sync()
+    await set_bot_state(state_key, tree_hash)
+    return len(synced)
+
 @bot.tree.command(name="reload_cog", description="Reload a specified cog. (Owner only)")
 async def reload_cog_command(interaction: discord.Interaction, cog_name: str):
     """Reload a given cog file without restarting the bot."""
@@ -63,10 +120,14 @@ async def reload_cog_command(interaction: discord.Interaction, cog_name: str):
     try:
         # Attempt to reload the cog.
         await interaction.client.reload_extension(cog_name)
-        # After reloading, resync the command tree.
-        synced = await interaction.client.tree.sync()
+        # After reloading, resync the command tree if the reload changed it.
+        synced = await sync_commands_if_changed()
+        if synced is None:
+            note = "commands unchanged, sync skipped"
+        else:
+            note = f"resynced commands ({synced} commands synced)"
         await interaction.response.send_message(
-            f"✅ Successfully reloaded `{cog_name}` and resynced commands ({len(synced)} commands synced).",
+            f"✅ Successfully reloaded `{cog_name}` and {note}.",
             ephemeral=True
         )
     except Exception as e:
@@ -80,38 +141,79 @@ async def shardinfo(interaction: discord.Interaction):
     await interaction.response.send_message(f"This interaction is on shard {interaction.client.shard_id}.", ephemeral=True)
 
 @bot.event
-async def on_ready():
-        # -------------------------------
+async def setup_hook():
+    # Runs once per process, after login and before the gateway connects;
+    # on_ready fires again on every reconnect.
+    log_phase("login")
+    # -------------------------------
     # Initialize databases
     # -------------------------------
-    await initialize_database()
-    await init_role_requests_db()
-    await init_application_requests_db()
-    await init_applications_db()
-    await init_application_attempts_db()
-    await init_region_status()
-    await init_timeouts_db()
-    await init_stored_embeds_db()
+    for init in DB_INITS:
+        with profiler.phase("init", init.__name__):
+            await init()
+    log_phase("database init")
 
-    print(f"✅ Logged in as {bot.user} (ID: {bot.user.id})")
     try:
-        synced = await bot.tree.sync()
-        print(f"✅ Synced {len(synced)} slash commands.")
+        synced = await sync_commands_if_changed()
+        if synced is None:
+            print("✅ Slash commands unchanged, sync skipped.")
+        else:
+            print(f"✅ Synced {synced} slash commands.")
     except Exception as e:
         print(f"❌ Failed to sync commands: {e}")
+    log_phase("command sync")
+
+@bot.event
+async def on_ready():
+    global _ready_once
+    await bot.scheduler.start()     # no-op when already running
+    if _ready_once:
+        log(f"Gateway ready again (reconnect) as {bot.user}")
+        return
+    _ready_once = True
+    log_phase("gateway connect")
+    print(f"✅ Logged in as {bot.user} (ID: {bot.user.id})")
+    for line in profiler.report():
+        log(line)
+
+def setup_services():
+    """Attaches the shared services the cogs expect on the bot. No network I/O."""
+    bot.resources = GuildResources(bot)
+    bot.website = WebsiteAPIClient()
+    bot.scheduler = Scheduler()
+    bot.outbound = OutboundQueue()
+    bot.embeds = PersistentEmbeds(bot)
+    bot.add_listener(bot.embeds.on_raw_message_delete)
+    bot.add_listener(bot.embeds.on_raw_bulk_message_delete)
+    bot.add_dynamic_items(PageButton)
+    bot.admin_ui = AdminUI()
+    bot.watchdog = LoopWatchdog()
 
 async def main():
+    # Log records go through a queue to a writer thread (size/daily rotation, gzip)
+    configure_logging(LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT, daily=LOG_ROTATE_DAILY, json_lines=LOG_JSON)
+    with open(TOKEN_FILE, "r", encoding="utf-8") as file:
+        token = file.read().strip()
+
     async with bot:
-        bot.resources = GuildResources(bot)
+        setup_services()
+        # logs the stack of anything that blocks the event loop (LOOP_WATCHDOG_*)
+        bot.watchdog.start()
+        # sqlite-web runs in its own process (see ADMIN_UI_MODE)
+        await bot.admin_ui.start()
         # Load the cogs/extensions:
-        await bot.load_extension("cogs.recruitment")
-        await bot.load_extension("cogs.tickets")
-        await bot.load_extension("cogs.playerlist")
-        await bot.load_extension("cogs.status")
-        await bot.load_extension("cogs.verification")
-        await bot.load_extension("cogs.fun")
-        # await bot.load_extension("cogs.example_cog")
-        await bot.start(TOKEN)
+        for extension in EXTENSIONS:
+            with profiler.phase("cog setup", extension):
+                await bot.load_extension(extension)
+        log_phase("service & cog setup")
+        try:
+            await bot.start(token)
+        finally:
+            await bot.scheduler.close()
+            await bot.outbound.close()
+            await bot.website.close()
+            await bot.admin_ui.close()
+            bot.watchdog.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
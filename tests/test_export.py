@@ -0,0 +1,54 @@
+# tests/test_export.py
+"""
+Runs every /export dataset once against freshly initialised databases, so a
+query that points at the wrong database, table or column fails here.
+
+    python -m unittest discover -s tests
+"""
+import os, tempfile, unittest
+from types import SimpleNamespace
+
+import aiosqlite
+
+from cogs.db_utils import (
+    PLAYER_LOGS_FILE, stream_query, initialize_database, init_applications_db,
+    init_application_attempts_db, init_ticket_db,
+)
+from cogs.export import EXPORTS
+from cogs.playerlist import PlayerListCog
+
+
+class ExportDatasetsTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)        # data.db / player_logs.db are relative paths
+
+        for init in (initialize_database, init_applications_db, init_application_attempts_db, init_ticket_db):
+            await init()
+        async with aiosqlite.connect(PLAYER_LOGS_FILE) as conn:
+            await PlayerListCog.setup_database(SimpleNamespace(db_conn=conn))
+            await conn.execute("INSERT INTO players_info (uid, current_name) VALUES ('u1', '[SWAT] Test')")
+            await conn.execute(
+                "INSERT INTO playtime_log (uid, log_time, seconds) VALUES ('u1', '2025-01-02 10:00:00', 60)"
+            )
+            await conn.commit()
+
+    async def asyncTearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def test_every_dataset_runs(self):
+        for dataset, (query, _, db_path) in EXPORTS.items():
+            with self.subTest(dataset=dataset):
+                rows = []
+                async with stream_query(query, ("", "9999"), db_path=db_path) as (columns, batches):
+                    async for batch in batches:
+                        rows.extend(batch)
+                self.assertTrue(columns)
+                if dataset == "playtime_daily":
+                    self.assertEqual([tuple(row) for row in rows], [("2025-01-02", "u1", "[SWAT] Test", 60.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# tests/test_recruitment_round_trips.py
+"""
+Counts connections and execute/executemany calls around the recruitment
+reminder handlers and on_member_remove. Each handler runs in one connection
+with a fixed number of statements, whatever the number of rows it handles.
+
+    python -m unittest discover -s tests
+"""
+import os, tempfile, unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import aiosqlite
+import discord
+
+from cogs.db_utils import (
+    add_application, add_entry, add_role_request, initialize_database, init_applications_db,
+    init_application_attempts_db, init_role_requests_db, init_scheduled_jobs_db,
+)
+from cogs.recruitment import RecruitmentCog
+from config import LEADERSHIP_ID
+
+
+class RoundTrips:
+    """Patches aiosqlite so every connection and statement is counted."""
+
+    def __init__(self):
+        self.connections = 0
+        self.statements  = 0
+        self._patches = [
+            mock.patch.object(aiosqlite.Connection, "__init__", self._counted(aiosqlite.Connection.__init__, "connections")),
+            mock.patch.object(aiosqlite.Connection, "execute", self._counted(aiosqlite.Connection.execute)),
+            mock.patch.object(aiosqlite.Connection, "executemany", self._counted(aiosqlite.Connection.executemany)),
+            mock.patch.object(aiosqlite.Cursor, "execute", self._counted(aiosqlite.Cursor.execute)),
+            mock.patch.object(aiosqlite.Cursor, "executemany", self._counted(aiosqlite.Cursor.executemany)),
+        ]
+
+    def _counted(self, original, counter: str = "statements"):
+        def wrapper(*args, **kwargs):
+            setattr(self, counter, getattr(self, counter) + 1)
+            return original(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self):
+        for patch in self._patches:
+            patch.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patch in self._patches:
+            patch.stop()
+
+
+class RecruitmentRoundTripsTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)        # data.db is a relative path
+        for init in (initialize_database, init_applications_db, init_application_attempts_db,
+                     init_role_requests_db, init_scheduled_jobs_db):
+            await init()
+
+        self.sent = []
+        thread = mock.MagicMock(spec=discord.Thread)
+        thread.send = mock.AsyncMock(side_effect=lambda *a, **kw: self.sent.append(kw))
+        bot = SimpleNamespace(
+            get_channel=lambda channel_id: thread,
+            outbound=mock.MagicMock(),
+        )
+        self.cog = RecruitmentCog.__new__(RecruitmentCog)    # skip the startup tasks
+        self.cog.bot = bot
+        self.cog.resources = SimpleNamespace(activity_ch=mock.MagicMock())
+
+    async def asyncTearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def _assert_budget(self, seed, handler, args, statements: int, sends_per_row: int = 1) -> list:
+        """
+        Runs `handler` over 1 and over 12 seeded rows; each run must use one
+        connection and exactly `statements` statements. Returns the row counts.
+        """
+        runs = (1, 12)
+        for offset, n in zip((0, 100), runs):
+            keys = [str(1000 + offset + i) for i in range(n)]
+            await seed(keys)
+            self.sent.clear()
+            with RoundTrips() as trips:
+                await handler(*args(keys))
+            self.assertEqual(len(self.sent), sends_per_row * n)
+            self.assertEqual(trips.connections, 1, f"{n} row(s): connections")
+            self.assertEqual(trips.statements, statements, f"{n} row(s): statements")
+        return list(runs)
+
+    async def test_endtime_reminders(self):
+        async def seed(keys):
+            start = datetime.now() - timedelta(days=8)
+            for key in keys:
+                await add_entry(key, "1", start, start + timedelta(days=7), "trainee", None, "ign", key, "EU")
+        await self._assert_budget(seed, self.cog.send_endtime_reminders, lambda keys: (keys,), statements=2)
+
+    async def test_application_reminders(self):
+        async def seed(keys):
+            for key in keys:
+                await add_application(key, key, "1", datetime.now(), "ign", "EU", "20", "10")
+        await self._assert_budget(seed, self.cog.send_application_reminders, lambda keys: (keys,), statements=3)
+
+    async def test_open_request_reminders(self):
+        async def seed(keys):
+            for key in keys:
+                await add_role_request(key, "other", "details")
+        # reminders go out through bot.outbound, not thread.send
+        outbound = self.cog.bot.outbound
+        runs = await self._assert_budget(seed, self.cog.send_open_request_reminders, lambda keys: (keys,),
+                                         statements=2, sends_per_row=0)
+
+        # one leadership ping per 10 reminders: 1 row -> 1 message, 12 rows -> 10 + 2
+        calls = outbound.send.call_args_list
+        self.assertEqual([len(call.kwargs["embeds"]) for call in calls], [1, 10, 2])
+        for call in calls:
+            self.assertIs(call.args[0], self.cog.resources.activity_ch)
+            self.assertIn(str(LEADERSHIP_ID), call.kwargs["content"])
+        mentioned = [embed.description for call in calls for embed in call.kwargs["embeds"]]
+        self.assertEqual(len(mentioned), sum(runs))
+        self.assertTrue(all("has been open for over 24 hours" in text for text in mentioned))
+
+    async def test_member_remove(self):
+        async def seed(keys):
+            user_id = keys[0]
+            for key in keys:
+                await add_application(key, user_id, "1", datetime.now(), "ign", "EU", "20", "10")
+                await add_entry(str(int(key) + 50), "1", datetime.now(), None, "trainee", None, "ign", user_id, "EU")
+        await self._assert_budget(seed, self.cog.on_member_remove,
+                                  lambda keys: (SimpleNamespace(id=int(keys[0])),), statements=5, sends_per_row=2)
+
+        async with aiosqlite.connect("data.db") as conn:
+            cursor = await conn.execute(
+                "SELECT COUNT(*) FROM application_attempts WHERE status = 'left_with_open_application' AND ts_epoch IS NOT NULL"
+            )
+            self.assertEqual((await cursor.fetchone())[0], 13)
+
+
+if __name__ == "__main__":
+    unittest.main()